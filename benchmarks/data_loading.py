@@ -0,0 +1,91 @@
+"""
+Compares loading shared/data from JSON against mapping the compiled snapshot.
+
+Each run happens in a fresh interpreter so it measures a cluster's cold start,
+and reports the time taken, the resident set size and how much of it is private
+(anonymous) memory as opposed to file-backed pages shared between processes.
+
+    python benchmarks/data_loading.py [--runs 5]
+
+Linux only, RSS is read from /proc/self/status.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / "shared" / "data"
+
+CHILD = """
+import json, sys, time
+from pathlib import Path
+try:
+    import ujson
+except ImportError:
+    ujson = json
+from dittocore.snapshot import _sources, load_snapshot
+
+root = Path(sys.argv[1])
+mode = sys.argv[2]
+start = time.perf_counter()
+if mode == "json":
+    data = {}
+    for name in _sources(root):
+        with open(root / name) as f:
+            data[name] = ujson.load(f)
+else:
+    data = load_snapshot(root)
+    data = {name: data[name] for name in data}
+loaded = time.perf_counter() - start
+
+start = time.perf_counter()
+rows = 0
+for name in ("pokemonfile.json", "forms.json", "moves.json"):
+    rows += sum(1 for row in data[name] if row["id"])
+scan = time.perf_counter() - start
+
+status = {}
+with open("/proc/self/status") as f:
+    for line in f:
+        key, _, value = line.partition(":")
+        status[key] = int(value.split()[0]) if value.strip().endswith("kB") else 0
+print(loaded, scan, status["VmRSS"], status.get("RssAnon", 0), status.get("RssFile", 0))
+"""
+
+
+def run(mode):
+    output = subprocess.check_output(
+        [sys.executable, "-c", CHILD, str(DATA), mode],
+        cwd=ROOT / "ditto",
+        text=True,
+    )
+    loaded, scan, rss, anon, file = output.split()
+    return float(loaded), float(scan), int(rss), int(anon), int(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT / "ditto"))
+    from dittocore.snapshot import build_snapshot
+
+    path = build_snapshot(DATA)
+    print(f"snapshot: {path.stat().st_size / 1024:.0f} KiB")
+    print(
+        f"{'mode':<10}{'load ms':>10}{'scan ms':>10}{'rss KiB':>10}{'anon KiB':>10}{'file KiB':>10}"
+    )
+    for mode in ("json", "snapshot"):
+        results = [run(mode) for _ in range(args.runs)]
+        loaded, scan, rss, anon, file = (statistics.median(r) for r in zip(*results))
+        print(
+            f"{mode:<10}{loaded * 1000:>10.1f}{scan * 1000:>10.1f}{rss:>10.0f}{anon:>10.0f}{file:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Times paging through a large box, `/p` and filter, in every user_order against the array lookup it replaced.
+
+Fills a scratch schema with one user owning `--pokes` pokemon, then for each
+order lists the box:
+
+    array     the first 3750 rows through the users.pokes array, `id = ANY(pokes)`
+              and `pokes.index` per row, all fetched before the menu opened
+    open      dittocore.listing.OwnedPages counting the box and fetching page 1
+    next      the page after the one shown, fetched from its keys
+    last      the last page, fetched from the end of the box
+
+Results can be saved as a baseline, and later runs compared against it to
+catch regressions:
+
+    python benchmarks/listing.py --dsn postgresql://... [--pokes 50000] [--runs 20]
+    python benchmarks/listing.py --save baseline.json
+    python benchmarks/listing.py --compare baseline.json [--tolerance 0.5]
+
+Needs a PostgreSQL it can create a schema in, DATABASE_URL is used without
+`--dsn`. The schema is dropped afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import asyncpg
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRATCH = "bench_listing"
+ROWS = 15 * 250
+
+# Only the columns listings read
+TABLES = """
+CREATE TABLE users (u_id bigint PRIMARY KEY, pokes bigint[] NOT NULL DEFAULT '{}');
+CREATE TABLE pokes (
+    id bigserial PRIMARY KEY, pokname text, name text, poknick text, pokelevel int,
+    hpiv int, atkiv int, defiv int, spatkiv int, spdefiv int, speediv int,
+    hpev int, atkev int, defev int, spatkev int, spdefev int, speedev int,
+    shiny boolean, radiant boolean, skin text, gender text, fav boolean
+);
+"""
+
+FILL = """
+INSERT INTO pokes (pokname, name, pokelevel, hpiv, atkiv, defiv, spatkiv, spdefiv, speediv,
+    hpev, atkev, defev, spatkev, spdefev, speedev, shiny, radiant, gender, fav)
+SELECT md5(g::text), 'egg', 1 + g % 100, g % 32, g % 31, g % 29, g % 27, g % 25, g % 23,
+    g % 252, g % 200, g % 150, g % 100, g % 50, g % 10, g % 400 = 0, false, '-m', g % 50 = 0
+FROM generate_series(1, $1) g
+"""
+
+# Every /p order, then the filter orders that add a condition or sort by number
+CASES = {
+    "iv": ("true", "iv"),
+    "level": ("true", "level"),
+    "ev": ("true", "ev"),
+    "name": ("true", "name"),
+    "default": ("true", "kek"),
+    "filter fav": ("fav = true", "kek"),
+    "filter id desc": ("true", (None, True)),
+}
+
+
+async def setup(pconn, pokes):
+    from migrations.poke_ownership import BACKFILL, INDEX, SCHEMA
+
+    await pconn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+    await pconn.execute(f"CREATE SCHEMA {SCRATCH}")
+    await pconn.execute(f"SET search_path TO {SCRATCH}")
+    await pconn.execute(TABLES)
+    await pconn.execute(FILL, pokes)
+    await pconn.execute(
+        "INSERT INTO users (u_id, pokes) SELECT 1, ARRAY(SELECT id FROM pokes ORDER BY random())"
+    )
+    async with pconn.transaction():
+        for statement in SCHEMA:
+            await pconn.execute(statement)
+    await pconn.execute(INDEX)
+    await pconn.execute(BACKFILL, [1])
+    await pconn.execute("VACUUM ANALYZE users")
+    await pconn.execute("VACUUM ANALYZE pokes")
+
+
+async def array_listing(pconn, conditions, order):
+    from dittocore.listing import EV_SUM, IV_SUM
+
+    key, descending = order
+    pokes = await pconn.fetchval("SELECT pokes FROM users WHERE u_id = $1", 1)
+    ids = pokes
+    if key is None and not descending:
+        # The default order was none at all
+        order = ""
+    elif key is None:
+        # Filter's id order sliced the array in Python to the rows shown
+        ids = list(reversed(pokes[-ROWS:]))
+        order = "ORDER BY array_position($1, id) DESC"
+    else:
+        # There was no tiebreak on the number
+        order = f"ORDER BY {key} DESC"
+    async with pconn.transaction():
+        cur = await pconn.cursor(
+            f"SELECT {IV_SUM} AS ivs, {EV_SUM} AS evs, * FROM pokes "
+            f"WHERE id = ANY($1) AND {conditions} {order}",
+            ids,
+        )
+        records = await cur.fetch(ROWS)
+    return [pokes.index(r["id"]) + 1 for r in records]
+
+
+async def listing(pool, conditions, order):
+    """Returns the times to open the listing, turn to the next page and jump to the last."""
+    import discord
+    from dittocore.listing import OwnedPages
+
+    key, descending = order
+    pages = OwnedPages(
+        pool,
+        1,
+        where=conditions,
+        key=key,
+        descending=descending,
+        format_page=lambda records, index: "\n".join(str(r["num"]) for r in records),
+        base_embed=discord.Embed(),
+    )
+    started = time.perf_counter()
+    await pages.prepare()
+    await pages.get_page(0)
+    opened = time.perf_counter()
+    # Page 2 is read ahead while page 1 is shown, its fetch is what a slow reader waits on
+    await pages._loading.get(1) or pages.get_page(1)
+    turned = time.perf_counter()
+    await pages.get_page(len(pages) - 1)
+    ended = time.perf_counter()
+    return opened - started, turned - opened, ended - turned
+
+
+async def run(args):
+    from dittocore.listing import USER_ORDERS
+
+    pconn = await asyncpg.connect(args.dsn)
+    pool = await asyncpg.create_pool(
+        args.dsn, min_size=1, max_size=2, server_settings={"search_path": SCRATCH}
+    )
+    results = {}
+    try:
+        start = time.perf_counter()
+        await setup(pconn, args.pokes)
+        print(f"A box of {args.pokes:,} pokemon, set up in {time.perf_counter() - start:.1f}s")
+        print()
+        print(
+            f"{'listing':<16}{'array p50':>12}{'open p50':>12}{'open p99':>12}"
+            f"{'next p50':>12}{'last p50':>12}{'speedup':>10}"
+        )
+        for name, (conditions, order) in CASES.items():
+            order = USER_ORDERS.get(order, order)
+            samples = {"array": [], "open": [], "next": [], "last": []}
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                await array_listing(pconn, conditions, order)
+                samples["array"].append((time.perf_counter() - started) * 1000)
+                for step, took in zip(("open", "next", "last"), await listing(pool, conditions, order)):
+                    samples[step].append(took * 1000)
+            array_p50 = statistics.median(samples["array"])
+            p50 = {step: statistics.median(samples[step]) for step in ("open", "next", "last")}
+            p99 = sorted(samples["open"])[int((args.runs - 1) * 0.99)]
+            results[name] = {"p50": p50["open"], "p99": p99, "next_p50": p50["next"], "last_p50": p50["last"]}
+            print(
+                f"{name:<16}{array_p50:>10.1f}ms{p50['open']:>10.1f}ms{p99:>10.1f}ms"
+                f"{p50['next']:>10.1f}ms{p50['last']:>10.1f}ms{array_p50 / p50['open']:>9.1f}x"
+            )
+    finally:
+        await pool.close()
+        await pconn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+        await pconn.close()
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """Returns the listings whose p50 grew beyond `tolerance` of the baseline's."""
+    found = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before and result["p50"] > before["p50"] * (1 + tolerance):
+            found.append(f"{name} p50 rose to {result['p50']:.1f}ms from {before['p50']:.1f}ms")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--pokes", type=int, default=50000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--save", type=Path, help="Write the results to a JSON baseline.")
+    parser.add_argument(
+        "--compare", type=Path, help="Exit non-zero on a regression from a saved baseline."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Fraction a listing's p50 may grow by before it counts as a regression.",
+    )
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    sys.path.insert(0, str(ROOT))
+    sys.path.insert(0, str(ROOT / "ditto"))
+    results = asyncio.run(run(args))
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        found = regressions(results, json.loads(args.compare.read_text()), args.tolerance)
+        print()
+        print("\n".join(found) or "No regressions against the baseline.")
+        sys.exit(bool(found))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Compares pokemon ownership kept in the users.pokes array against the pokes.owner index.
+
+Fills a scratch schema with `--users` users owning `--pokes` pokemon each,
+kept both ways, using the definitions in migrations/poke_ownership.py. Then
+times the lookups and writes the bot makes through either layout:
+
+    nth       the id of a user's nth pokemon, `/select 5`
+    newest    the id of a user's latest pokemon, `/select new`
+    number    a pokemon's number, the footer of `/info`
+    owns      who owns a pokemon, the ownership recheck of a trade
+    list      a user's pokemon sorted by name and numbered, `/p`
+    give      moving a pokemon to another user and back, a trade
+
+    python benchmarks/poke_ownership.py --dsn postgresql://... [--users 20] [--pokes 10000]
+
+Needs a PostgreSQL it can create a schema in, DATABASE_URL is used without
+`--dsn`. The schema is dropped afterwards unless `--keep` is passed.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import asyncpg
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRATCH = "bench_poke_ownership"
+
+# Only the columns the measured queries touch
+TABLES = """
+CREATE TABLE users (u_id bigint PRIMARY KEY, pokes bigint[] NOT NULL DEFAULT '{}');
+CREATE TABLE pokes (id bigserial PRIMARY KEY, pokname text, market_enlist boolean DEFAULT false);
+"""
+
+
+async def array_list(pconn, user_id):
+    pokes = await pconn.fetchval("SELECT pokes FROM users WHERE u_id = $1", user_id)
+    records = await pconn.fetch(
+        "SELECT id, pokname FROM pokes WHERE id = ANY($1) ORDER BY pokname DESC LIMIT 3750",
+        pokes,
+    )
+    return [pokes.index(r["id"]) + 1 for r in records]
+
+
+async def array_give(pconn, poke_id, giver, receiver):
+    for sender, to in ((giver, receiver), (receiver, giver)):
+        async with pconn.transaction():
+            await pconn.execute(
+                "UPDATE users SET pokes = array_remove(pokes, $1) WHERE u_id = $2", poke_id, sender
+            )
+            await pconn.execute(
+                "UPDATE users SET pokes = array_append(pokes, $1) WHERE u_id = $2", poke_id, to
+            )
+
+
+async def owner_give(pconn, poke_id, giver, receiver):
+    for sender, to in ((giver, receiver), (receiver, giver)):
+        await pconn.execute(
+            "UPDATE pokes SET owner = $3, position = DEFAULT, market_enlist = false WHERE id = $1 AND owner = $2",
+            poke_id,
+            sender,
+            to,
+        )
+
+
+# operation -> layout -> coroutine taking (connection, user id, a poke id they own, its number, another user id)
+OPERATIONS = {
+    "nth": {
+        "array": lambda c, u, p, n, o: c.fetchval(
+            "SELECT pokes[$2] FROM users WHERE u_id = $1", u, n
+        ),
+        "owner": lambda c, u, p, n, o: c.fetchval("SELECT poke_at($1, $2)", u, n),
+    },
+    "newest": {
+        "array": lambda c, u, p, n, o: c.fetchval(
+            "SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1", u
+        ),
+        "owner": lambda c, u, p, n, o: c.fetchval("SELECT newest_poke($1)", u),
+    },
+    "number": {
+        "array": lambda c, u, p, n, o: c.fetchval(
+            "SELECT array_position(pokes, $2) FROM users WHERE u_id = $1", u, p
+        ),
+        "owner": lambda c, u, p, n, o: c.fetchval("SELECT poke_number($1, $2)", u, p),
+    },
+    "owns": {
+        "array": lambda c, u, p, n, o: c.fetchval(
+            "SELECT u_id FROM users WHERE pokes @> $1", [p]
+        ),
+        "owner": lambda c, u, p, n, o: c.fetchval("SELECT owner FROM pokes WHERE id = $1", p),
+    },
+    "list": {
+        "array": lambda c, u, p, n, o: array_list(c, u),
+        "owner": lambda c, u, p, n, o: c.fetch(
+            "SELECT id, pokname, row_number() OVER (ORDER BY position) AS num "
+            "FROM pokes WHERE owner = $1 ORDER BY pokname DESC LIMIT 3750",
+            u,
+        ),
+    },
+    "give": {
+        "array": lambda c, u, p, n, o: array_give(c, p, u, o),
+        "owner": lambda c, u, p, n, o: owner_give(c, p, u, o),
+    },
+}
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int((len(samples) - 1) * 0.99)]
+
+
+async def setup(pconn, users, pokes):
+    from migrations.poke_ownership import BACKFILL, INDEX, SCHEMA
+
+    await pconn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+    await pconn.execute(f"CREATE SCHEMA {SCRATCH}")
+    await pconn.execute(f"SET search_path TO {SCRATCH}")
+    await pconn.execute(TABLES)
+    await pconn.execute(
+        "INSERT INTO pokes (pokname) SELECT md5(g::text) FROM generate_series(1, $1) g",
+        users * pokes,
+    )
+    # Each user owns a contiguous range of ids, shuffled into catch order
+    await pconn.execute(
+        """
+        INSERT INTO users (u_id, pokes)
+        SELECT u, ARRAY(SELECT g FROM generate_series((u - 1) * $2 + 1, u * $2) g ORDER BY random())
+        FROM generate_series(1, $1) u
+        """,
+        users,
+        pokes,
+    )
+    async with pconn.transaction():
+        for statement in SCHEMA:
+            await pconn.execute(statement)
+    await pconn.execute(INDEX)
+    await pconn.execute(BACKFILL, list(range(1, users + 1)))
+    # Index only scans need the visibility map autovacuum would have set
+    await pconn.execute("VACUUM ANALYZE users")
+    await pconn.execute("VACUUM ANALYZE pokes")
+
+
+async def run(args):
+    pconn = await asyncpg.connect(args.dsn)
+    try:
+        start = time.perf_counter()
+        await setup(pconn, args.users, args.pokes)
+        print(
+            f"{args.users} users with {args.pokes:,} pokemon each, set up in {time.perf_counter() - start:.1f}s"
+        )
+        print()
+        print(f"{'operation':<10}{'array p50':>12}{'owner p50':>12}{'array p99':>12}{'owner p99':>12}{'speedup':>10}")
+        for operation, layouts in OPERATIONS.items():
+            samples = {layout: [] for layout in layouts}
+            for _ in range(args.iterations):
+                user_id = random.randint(1, args.users)
+                other = user_id % args.users + 1
+                n = random.randint(1, args.pokes)
+                poke_id = await pconn.fetchval("SELECT pokes[$2] FROM users WHERE u_id = $1", user_id, n)
+                for layout, call in layouts.items():
+                    started = time.perf_counter()
+                    await call(pconn, user_id, poke_id, n, other)
+                    samples[layout].append((time.perf_counter() - started) * 1000)
+            array_p50, array_p99 = percentiles(samples["array"])
+            owner_p50, owner_p99 = percentiles(samples["owner"])
+            print(
+                f"{operation:<10}{array_p50:>10.3f}ms{owner_p50:>10.3f}ms"
+                f"{array_p99:>10.3f}ms{owner_p99:>10.3f}ms{array_p50 / owner_p50:>9.1f}x"
+            )
+    finally:
+        if not args.keep:
+            await pconn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+        await pconn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--pokes", type=int, default=10000, help="pokemon per user")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema.")
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+    sys.path.insert(0, str(ROOT))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+"""
+Drives the spawn pipeline, Spawn.on_message and the catch that ends it, end to end.
+
+Postgres, mongo and redis are replaced by in-memory stand-ins that answer the
+spawn path's queries after `--rtt` milliseconds and count every round trip.
+The catalog is loaded from shared/data through the mongo stand-in, everything
+else runs as it does in the bot. Each worker spawns in its own guild and
+channel and catches every spawn by name.
+
+Reports spawns per second, the p50/p99 latency of each stage of a spawn and
+the datastore round trips per spawn. Results can be saved as a baseline, and
+later runs compared against it to catch regressions:
+
+    python benchmarks/spawn_pipeline.py [--spawns 2000] [--workers 20] [--rtt 0.5]
+    python benchmarks/spawn_pipeline.py --save baseline.json
+    python benchmarks/spawn_pipeline.py --compare baseline.json [--tolerance 0.2]
+
+Needs the bot's dependencies, discord.py in particular, to be installed.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from functools import wraps
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / "shared" / "data"
+
+# Catalog collection -> shared/data file holding the same documents
+COLLECTION_FILES = {
+    "forms": "forms.json",
+    "pfile": "pokemonfile.json",
+    "ptypes": "ptypes.json",
+    "natures": "natures.json",
+    "stat_types": "stat_types.json",
+    "poke_abilities": "pokemon_abilities.json",
+    "abilities": "abilities.json",
+    "items": "items.json",
+    "moves": "moves.json",
+    "evofile": "evofile.json",
+    "types": "types.json",
+    "egg_groups": "egg_groups.json",
+    "type_effectiveness": "tchart.json",
+}
+
+INVENTORY = {"iv-multiplier": 0, "shiny-multiplier": 0}
+
+
+class RoundTrips:
+    """Counts round trips per datastore and simulates their latency."""
+
+    def __init__(self, rtt):
+        self.rtt = rtt
+        self.counts = Counter()
+
+    async def __call__(self, store, operation):
+        self.counts[store, operation] += 1
+        if self.rtt:
+            await asyncio.sleep(self.rtt)
+
+
+class FakeConnection:
+    """Answers the queries of the spawn path like asyncpg would."""
+
+    def __init__(self, trips):
+        self.trips = trips
+        self.next_id = 1
+
+    async def fetch(self, query, *args):
+        await self.trips("postgres", "fetch")
+        return []
+
+    async def fetchval(self, query, *args):
+        await self.trips("postgres", "fetchval")
+        if "inventory" in query:
+            return dict(INVENTORY)
+        return None
+
+    async def fetchrow(self, query, *args):
+        await self.trips("postgres", "fetchrow")
+        if "INSERT INTO pokes" in query:
+            self.next_id += 1
+            return {"id": self.next_id, "skin": None}
+        return None
+
+    async def execute(self, query, *args):
+        await self.trips("postgres", "execute")
+
+
+class FakePool:
+    def __init__(self, trips):
+        self.connection = FakeConnection(trips)
+
+    def acquire(self):
+        pool = self
+
+        class Acquire:
+            async def __aenter__(self):
+                return pool.connection
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+
+class FakeCursor:
+    def __init__(self, trips, documents):
+        self.trips = trips
+        self.documents = documents
+
+    async def to_list(self, length):
+        await self.trips("mongo", "find")
+        return list(self.documents)
+
+
+class FakeCollection:
+    def __init__(self, trips, documents=()):
+        self.trips = trips
+        self.documents = list(documents)
+
+    def find(self, query=None, *args, **kwargs):
+        return FakeCursor(self.trips, self.documents)
+
+    async def find_one(self, query=None, *args, **kwargs):
+        await self.trips("mongo", "find_one")
+        return None
+
+    async def update_one(self, *args, **kwargs):
+        await self.trips("mongo", "update_one")
+
+    async def insert_one(self, *args, **kwargs):
+        await self.trips("mongo", "insert_one")
+
+
+class FakeMongo:
+    def __init__(self, trips, collections):
+        self.trips = trips
+        self.collections = {
+            name: FakeCollection(trips, documents) for name, documents in collections.items()
+        }
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(self.trips)
+        return self.collections[name]
+
+    __getattr__ = __getitem__
+
+
+class FakeRedis:
+    def __init__(self, trips):
+        self.trips = trips
+
+    async def execute(self, *args):
+        await self.trips("redis", args[0].lower())
+
+
+def load_collections():
+    collections = {}
+    for name, file in COLLECTION_FILES.items():
+        with open(DATA / file, encoding="utf-8") as f:
+            collections[name] = json.load(f)
+    # Mongo keeps types and egg groups as one document per pokemon
+    collections["ptypes"] = [
+        {"id": int(k), "types": [t["type_id"] for t in sorted(v, key=lambda t: t["slot"])]}
+        for k, v in collections["ptypes"].items()
+    ]
+    egg_groups = defaultdict(list)
+    for doc in collections["egg_groups"]:
+        egg_groups[doc["species_id"]].append(doc["egg_group_id"])
+    collections["egg_groups"] = [
+        {"species_id": k, "egg_groups": v} for k, v in egg_groups.items()
+    ]
+    return collections
+
+
+class Stages:
+    """Wraps the functions behind each stage of a spawn to time them."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def wrap(self, stage, func):
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.samples[stage].append(time.perf_counter() - start)
+
+        else:
+
+            @wraps(func)
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.samples[stage].append(time.perf_counter() - start)
+
+        return timed
+
+
+def build(rtt):
+    import discord
+
+    from dittocore.catalog import Catalog
+    from dittocore.commondb import CommonDB
+    from dittocore.guild_settings import GuildSettings
+    from dittocore.honey import HoneyIndex
+    from dittocore.queries import Queries
+    from dittocore.spawns import CatchDispatcher, SpawnAdmission
+    from dittocogs import spawn as spawn_module
+
+    trips = RoundTrips(rtt / 1000)
+
+    class Bot:
+        colors = (0xFFB6C1,)
+        cluster = {"id": 1}
+
+        def __init__(self):
+            self.logger = logging.getLogger("dittobot")
+            self.db = [
+                FakePool(trips),
+                FakeMongo(trips, load_collections()),
+                FakeRedis(trips),
+            ]
+            self.redis_manager = self
+            self.catalog = Catalog(self)
+            self.catches = CatchDispatcher(self)
+            self.guild_settings = GuildSettings(self)
+            self.honey = HoneyIndex(self)
+            self.commondb = CommonDB(self)
+            self.queries = Queries(self)
+
+        async def wait_until_ready(self):
+            pass
+
+        async def notify(self, action, args=None, scope="bot"):
+            await self.db[2].execute("PUBLISH", "dittobot_clusters", action)
+
+        def botbanned(self, id):
+            return False
+
+        def premium_server(self, guild_id):
+            return False
+
+        def dispatch(self, event, *args):
+            pass
+
+        def get_channel(self, channel_id):
+            return None
+
+        def get_partial_messageable(self, channel_id):
+            return Channel(None, channel_id)
+
+    class Permissions:
+        send_messages = embed_links = manage_messages = True
+
+    class SentMessage:
+        ids = itertools.count(4_000_000)
+
+        def __init__(self, embed):
+            self.id = next(self.ids)
+            self.embeds = [embed]
+
+        async def edit(self, **kwargs):
+            pass
+
+        async def delete(self):
+            pass
+
+        async def pin(self):
+            pass
+
+    class Channel(discord.TextChannel):
+        def __init__(self, guild, id):
+            self.guild = guild
+            self.id = id
+            self.sent = asyncio.Event()
+
+        def permissions_for(self, obj):
+            return Permissions()
+
+        async def send(self, content=None, *, embed=None, view=None):
+            self.sent.set()
+            return SentMessage(embed)
+
+    class Guild:
+        def __init__(self, id):
+            self.id = id
+            self.me = object()
+
+        def get_channel(self, channel_id):
+            return None
+
+    class Author:
+        bot = False
+
+        def __init__(self, id):
+            self.id = id
+            self.mention = f"<@{id}>"
+
+    class Message:
+        def __init__(self, channel, author, content):
+            self.guild = channel.guild
+            self.channel = channel
+            self.author = author
+            self.content = content
+
+    bot = Bot()
+    cog = spawn_module.Spawn(bot)
+    cog.always_spawn = True
+    # Workers spawn back to back, rate limits would only measure the limits
+    cog.admission = SpawnAdmission(
+        guild_rate=1e9, guild_burst=1e9, channel_rate=1e9, channel_burst=1e9
+    )
+
+    def new_channel(i):
+        return Channel(Guild(1_000_000 + i), 2_000_000 + i)
+
+    return bot, cog, spawn_module, trips, new_channel, Author, Message
+
+
+def instrument(bot, cog, spawn_module):
+    stages = Stages()
+    cog.sampler.sample = stages.wrap("roll", cog.sampler.sample)
+    spawn_module.one_in = stages.wrap("roll", spawn_module.one_in)
+    bot.guild_settings.get = stages.wrap("settings", bot.guild_settings.get)
+    bot.honey.get = stages.wrap("honey", bot.honey.get)
+    bot.catalog.form = stages.wrap("form lookup", bot.catalog.form)
+    cog.embeds.render = stages.wrap("embed", cog.embeds.render)
+    bot.commondb.settle_catch = stages.wrap("catch settlement", bot.commondb.settle_catch)
+    return stages
+
+
+async def run(args):
+    bot, cog, spawn_module, trips, new_channel, Author, Message = build(args.rtt)
+    await bot.catalog.load()
+    await bot.honey.load()
+    # shared/data lags behind the mongo collections, only spawn what it knows
+    def known(species):
+        form = bot.catalog.form(species.lower())
+        return form is not None and bot.catalog.pfile(form["pokemon_id"]) is not None
+
+    cog.sampler = spawn_module.SpawnSampler(
+        {tier: list(filter(known, species)) for tier, species in cog.sampler.species.items()}
+    )
+    # The catalog swaps in new indexes on load, so instrument after it
+    stages = instrument(bot, cog, spawn_module)
+
+    opened = []
+    open_spawn = bot.catches.open
+
+    def record_open(*a, **kwargs):
+        spawn = open_spawn(*a, **kwargs)
+        opened.append(spawn)
+        return spawn
+
+    bot.catches.open = record_open
+    spawns = defaultdict(list)
+
+    async def worker(i, count):
+        channel = new_channel(i)
+        author = Author(3_000_000 + i)
+        for _ in range(count):
+            channel.sent.clear()
+            start = time.perf_counter()
+            task = asyncio.create_task(cog.on_message(Message(channel, author, "hi")))
+            await channel.sent.wait()
+            spawns["spawn"].append(time.perf_counter() - start)
+            spawn = next(s for s in opened if s.channel_id == channel.id)
+            opened.remove(spawn)
+            # Wait for the spawn to start listening, then catch it
+            while spawn.future is None:
+                await asyncio.sleep(0)
+            bot.catches.dispatch(Message(channel, author, spawn.names[0]))
+            await task
+            spawns["spawn + catch"].append(time.perf_counter() - start)
+
+    per_worker = args.spawns // args.workers
+    trips.counts.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i, per_worker) for i in range(args.workers)))
+    elapsed = time.perf_counter() - start
+    bot.catches.stop()
+    bot.honey.stop()
+
+    total = per_worker * args.workers
+    results = {
+        "spawns_per_second": total / elapsed,
+        "stages": {},
+        "round_trips": {
+            f"{store} {operation}": count / total
+            for (store, operation), count in sorted(trips.counts.items())
+        },
+    }
+    print(f"{total} spawns and catches in {elapsed:.2f}s: {total / elapsed:,.0f} spawns/s")
+    print()
+    print(f"{'stage':<20}{'calls':>8}{'p50 us':>10}{'p99 us':>10}")
+    for name, samples in (*stages.samples.items(), *spawns.items()):
+        samples = sorted(samples)
+        p50 = statistics.median(samples) * 1e6
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6
+        results["stages"][name] = {"p50": p50, "p99": p99}
+        print(f"{name:<20}{len(samples):>8}{p50:>10.1f}{p99:>10.1f}")
+    print()
+    print(f"{'round trips':<30}{'per spawn':>10}")
+    for name, count in results["round_trips"].items():
+        print(f"{name:<30}{count:>10.2f}")
+    print(f"{'total':<30}{sum(results['round_trips'].values()):>10.2f}")
+    print()
+    embeds = cog.embeds.stats()
+    print(f"embed urls: {embeds['embed_hits']} hits, {embeds['embed_misses']} misses")
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """Returns what got worse than `baseline`, throughput beyond `tolerance` and any extra round trip."""
+    found = []
+    floor = baseline["spawns_per_second"] * (1 - tolerance)
+    if results["spawns_per_second"] < floor:
+        found.append(
+            f"spawns/s fell to {results['spawns_per_second']:,.0f} from {baseline['spawns_per_second']:,.0f}"
+        )
+    # Round trips are deterministic, any increase is a regression
+    for name, count in results["round_trips"].items():
+        before = baseline["round_trips"].get(name, 0)
+        if count > before + 0.01:
+            found.append(f"{name} round trips per spawn rose to {count:.2f} from {before:.2f}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spawns", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument(
+        "--rtt", type=float, default=0.5, help="Simulated datastore round trip, in ms."
+    )
+    parser.add_argument("--save", type=Path, help="Write the results to a JSON baseline.")
+    parser.add_argument(
+        "--compare", type=Path, help="Exit non-zero on a regression from a saved baseline."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Fraction of the baseline's spawns/s that may be lost before it counts as a regression.",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("DIRECTORY", str(ROOT))
+    sys.path.insert(0, str(ROOT / "ditto"))
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(run(args))
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        found = regressions(results, json.loads(args.compare.read_text()), args.tolerance)
+        print()
+        print("\n".join(found) or "No regressions against the baseline.")
+        sys.exit(bool(found))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Checks the spawn sampler against the rolls it replaced and times both.
+
+Draws `--samples` spawns per honey strength from the alias tables and from the
+old chained tier rolls, and compares the tier counts of each against the exact
+tier odds with a chi-squared test. Shiny rolls get the same treatment against
+`random.choice([False] * threshold + [True])`.
+
+    python benchmarks/spawn_sampler.py [--samples 2000000] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Chi-squared critical values at p = 0.001, by degrees of freedom
+CRITICAL = {1: 10.828, 4: 18.467}
+
+
+def legacy_spawn(honey, lists):
+    legend, ub, pseudo, starter, common = lists
+    legendchance = int(random.random() * (round(4000 - 7600 * honey / 100)))
+    ubchance = int(random.random() * (round(3000 - 5700 * honey / 100)))
+    pseudochance = int(random.random() * (round(1000 - 1900 * honey / 100)))
+    starterchance = int(random.random() * (round(500 - 950 * honey / 100)))
+    if legendchance < 2:
+        return random.choice(legend), "legendary"
+    elif ubchance < 2:
+        return random.choice(ub), "ultra_beast"
+    elif pseudochance < 2:
+        return random.choice(pseudo), "pseudo"
+    elif starterchance < 2:
+        return random.choice(starter), "starter"
+    return random.choice(common), "common"
+
+
+def legacy_shiny(threshold):
+    return random.choice([False for i in range(threshold)] + [True])
+
+
+def chi_squared(counts, odds, samples):
+    return sum(
+        (counts[key] - p * samples) ** 2 / (p * samples) for key, p in odds.items() if p
+    )
+
+
+def report(name, counts, odds, samples):
+    stat = chi_squared(counts, odds, samples)
+    df = sum(1 for p in odds.values() if p) - 1
+    verdict = "ok" if stat < CRITICAL[df] else "MISMATCH"
+    print(f"  {name:<8} chi2 = {stat:>7.2f} (df {df}, critical {CRITICAL[df]}) {verdict}")
+    return stat < CRITICAL[df]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=2_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DIRECTORY", str(ROOT))
+    sys.path.insert(0, str(ROOT / "ditto"))
+    from dittocore.sampler import (
+        COMMON,
+        LEGENDARY,
+        PSEUDO,
+        SPAWN_TIERS,
+        STARTER,
+        ULTRA_BEAST,
+        SpawnSampler,
+        one_in,
+        tier_odds,
+    )
+    from dittocogs.pokemon_list import LegendList, pList, pseudoList, starterList, ubList
+
+    lists = (LegendList, ubList, pseudoList, starterList, pList)
+    sampler = SpawnSampler(dict(zip((LEGENDARY, ULTRA_BEAST, PSEUDO, STARTER, COMMON), lists)))
+    tiers = [tier for tier, _, _ in SPAWN_TIERS] + [COMMON]
+    random.seed(args.seed)
+    matches = True
+
+    for honey in (0, 50):
+        odds = dict(zip(tiers, tier_odds(honey)))
+        print(f"honey {honey}%: " + ", ".join(f"{t} {p:.5f}" for t, p in odds.items()))
+        new = Counter(sampler.sample(honey)[1] for _ in range(args.samples))
+        old = Counter(legacy_spawn(honey, lists)[1] for _ in range(args.samples))
+        matches &= report("alias", new, odds, args.samples)
+        matches &= report("legacy", old, odds, args.samples)
+
+    for threshold in (4000, 2000):
+        odds = {True: 1 / (threshold + 1), False: threshold / (threshold + 1)}
+        print(f"shiny threshold {threshold}: 1 in {threshold + 1}")
+        new = Counter(one_in(threshold) for _ in range(args.samples))
+        old = Counter(legacy_shiny(threshold) for _ in range(args.samples // 100))
+        matches &= report("one_in", new, odds, args.samples)
+        matches &= report("legacy", old, odds, args.samples // 100)
+
+    print()
+    print(f"{'roll':<22}{'us/call':>10}")
+    for name, func in (
+        ("spawn (legacy)", lambda: legacy_spawn(50, lists)),
+        ("spawn (alias)", lambda: sampler.sample(50)),
+        ("shiny (legacy)", lambda: legacy_shiny(4000)),
+        ("shiny (one_in)", lambda: one_in(4000)),
+    ):
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(5, number)) / number
+        print(f"{name:<22}{best * 1e6:>10.3f}")
+
+    sys.exit(not matches)
+
+
+if __name__ == "__main__":
+    main()
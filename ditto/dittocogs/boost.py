@@ -81,61 +81,61 @@ class Boost(commands.Cog):
             await self.bot.redis_manager.redis.execute("LPUSH", "nitrorace", str(ctx.author.id))
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                await self.bot.redis_manager.redis.execute("LREM", "nitrorace", "1", str(ctx.author.id))
-                return
-            if "Rare chest - x1" in choice:
-                inventory["rare chest"] = inventory.get("rare chest", 0) + 1
+            async with pconn.transaction():
+                inventory = await ctx.bot.inventories.lock(pconn, ctx.author.id)
+                shadow_boost = None
+                if inventory is not None:
+                    deltas = {}
+                    if "Rare chest - x1" in choice:
+                        deltas["rare chest"] = 1
 
-            elif "Battle/shiny multi - x5 Breed/IV multi - x3" in choice:
-                inventory["battle-multiplier"] = min(
-                    50, inventory.get("battle-multiplier", 0) + 5
-                )
-                inventory["shiny-multiplier"] = min(
-                    50, inventory.get("shiny-multiplier", 0) + 5
-                )
-                inventory["iv-multiplier"] = min(
-                    50, inventory.get("iv-multiplier", 0) + 3
-                )
-                inventory["breeding-multiplier"] = min(
-                    50, inventory.get("breeding-multiplier", 0) + 3
-                )
+                    elif "Battle/shiny multi - x5 Breed/IV multi - x3" in choice:
+                        deltas["battle-multiplier"] = min(
+                            50, inventory.get("battle-multiplier", 0) + 5
+                        ) - inventory.get("battle-multiplier", 0)
+                        deltas["shiny-multiplier"] = min(
+                            50, inventory.get("shiny-multiplier", 0) + 5
+                        ) - inventory.get("shiny-multiplier", 0)
+                        deltas["iv-multiplier"] = min(
+                            50, inventory.get("iv-multiplier", 0) + 3
+                        ) - inventory.get("iv-multiplier", 0)
+                        deltas["breeding-multiplier"] = min(
+                            50, inventory.get("breeding-multiplier", 0) + 3
+                        ) - inventory.get("breeding-multiplier", 0)
 
-            elif "Credits - 150,000 + Redeems - x3" in choice:
-                await pconn.execute(
-                    "UPDATE users SET redeems = redeems + 3, mewcoins = mewcoins + 150000 WHERE u_id = $1",
-                    ctx.author.id,
-                )
+                    elif "Credits - 150,000 + Redeems - x3" in choice:
+                        await pconn.execute(
+                            "UPDATE users SET redeems = redeems + 3, mewcoins = mewcoins + 150000 WHERE u_id = $1",
+                            ctx.author.id,
+                        )
 
-            elif "(Temp.) Redeems - x6" in choice:
-                await pconn.execute(
-                    "UPDATE users SET redeems = redeems + 6 WHERE u_id = $1",
-                    ctx.author.id,
-                )
+                    elif "(Temp.) Redeems - x6" in choice:
+                        await pconn.execute(
+                            "UPDATE users SET redeems = redeems + 6 WHERE u_id = $1",
+                            ctx.author.id,
+                        )
             
-            elif "(Temp.) Shadow Chain Boost (up to +40)" in choice:
-                shadow_boost = int(random.randint(1, 41))
-                await pconn.execute(
-                    "UPDATE users SET chain = chain + $2 WHERE u_id = $1",
-                    ctx.author.id,
-                    shadow_boost)
-                await ctx.send(f"Your chain increased by = {shadow_boost}")
-            elif "(???) Mystery Token (currently no use)" in choice:
-                await pconn.execute(
-                    "UPDATE users SET mystery_token = mystery_token + 1 WHERE u_id = $1",
-                    ctx.author.id,
-                )
+                    elif "(Temp.) Shadow Chain Boost (up to +40)" in choice:
+                        shadow_boost = int(random.randint(1, 41))
+                        await pconn.execute(
+                            "UPDATE users SET chain = chain + $2 WHERE u_id = $1",
+                            ctx.author.id,
+                            shadow_boost)
+                    elif "(???) Mystery Token (currently no use)" in choice:
+                        await pconn.execute(
+                            "UPDATE users SET mystery_token = mystery_token + 1 WHERE u_id = $1",
+                            ctx.author.id,
+                        )
 
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
+                    if deltas:
+                        await ctx.bot.inventories.apply(pconn, ctx.author.id, deltas)
             
+            if inventory is None:
+                await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                await self.bot.redis_manager.redis.execute("LREM", "nitrorace", "1", str(ctx.author.id))
+                return
+            if shadow_boost is not None:
+                await ctx.send(f"Your chain increased by = {shadow_boost}")
             await ctx.send(f"You chose and have been given - `{choice}`\nThank you for boosting the server!.",
                                view=None)
             await ctx.bot.db[1].boosters.update_one({}, {"$push": {"boosters": ctx.author.id}})
@@ -12,6 +12,7 @@ from datetime import datetime
 from discord.ext import commands
 from utils.misc import get_emoji
 
+from dittocore.sampler import one_in
 from dittocogs.json_files import *
 from dittocogs.pokemon_list import *
 
@@ -38,38 +39,32 @@ async def get_child(ctx, father, mother, shiny=False):
 
     identifier = mother.name.lower()
 
-    pokemon_pfile = await ctx.bot.db[1].pfile.find_one({"identifier": identifier})
+    pokemon_pfile = ctx.bot.catalog.pfile_by_identifier(identifier)
     if pokemon_pfile is None:
         ctx.bot.logger.warning(f"No PFILE exists for PARENT {identifier}")
         return None, None
 
-    # Recursively find the base evo
-    while pokemon_pfile["evolves_from_species_id"]:
-        pokemon_pfile = await ctx.bot.db[1].pfile.find_one(
-            {"id": pokemon_pfile["evolves_from_species_id"]}
+    # Find the base evo
+    base_pfile = ctx.bot.catalog.evolutions.base(pokemon_pfile["id"])
+    if base_pfile is None:
+        ctx.bot.logger.warning(
+            f"No PFILE exists for an evolves_from_species_id in the evo line of {pokemon_pfile['identifier']}"
         )
-        if pokemon_pfile is None:
-            ctx.bot.logger.warning(
-                f"No PFILE exists for evolves_from_species_id of {pokemon_pfile['identifier']}"
-            )
-            return None, None
+        return None, None
+    pokemon_pfile = base_pfile
 
     # Override for possibly the stupidest edge case ever, manaphy produces phione eggs, but phione does not evolve into manaphy
     if pokemon_pfile["identifier"] == "manaphy":
-        pokemon_pfile = await ctx.bot.db[1].pfile.find_one({"identifier": "phione"})
+        pokemon_pfile = ctx.bot.catalog.pfile_by_identifier("phione")
 
     name = pokemon_pfile["identifier"]
     gender_rate = pokemon_pfile["gender_rate"]
     id = pokemon_pfile["id"]
     counter = pokemon_pfile["hatch_counter"] * 2
 
-    ab_ids = []
-    async for record in ctx.bot.db[1].poke_abilities.find({"pokemon_id": id}):
-        ab_ids.append(record["ability_id"])
+    ab_ids = ctx.bot.catalog.ability_ids(id)
 
-    egg_groups = (await ctx.bot.db[1].egg_groups.find_one({"species_id": id}))[
-        "egg_groups"
-    ]
+    egg_groups = ctx.bot.catalog.index.egg_groups(id)
 
     # two stats are passed from parents to their child
     # both parents pass one stat
@@ -234,27 +229,20 @@ async def get_parent(ctx, challenger):
         ab_id = ab_ids[ab_index]
     except:
         ab_id = ab_ids[0]
-    try:
-        egg_groups = (
-            await ctx.bot.db[1].egg_groups.find_one(
-                {"species_id": form_info["pokemon_id"]}
-            )
-        )["egg_groups"]
-
-    except:
-        await ctx.bot.db[1].egg_groups.insert_one(
-            {"species_id": form_info["pokemon_id"], "egg_groups": [1]}
+    egg_groups = ctx.bot.catalog.index.egg_groups(form_info["pokemon_id"])
+    if egg_groups is None:
+        # Upsert, another cluster may have already added the default egg group
+        await ctx.bot.db[1].egg_groups.update_one(
+            {"species_id": form_info["pokemon_id"]},
+            {"$setOnInsert": {"egg_groups": [1]}},
+            upsert=True,
         )
-
-        egg_groups = (
-            await ctx.bot.db[1].egg_groups.find_one(
-                {"species_id": form_info["pokemon_id"]}
-            )
-        )["egg_groups"]
+        egg_groups = [1]
+        ctx.bot.catalog.index.add_egg_groups(form_info["pokemon_id"], egg_groups)
 
         await ctx.send("Default egg group used.")
     try:
-        eid = [t["id"] for t in PKIDS if t["evolves_from_species_id"] == pkid[0]][0]
+        eid = ctx.bot.catalog.evolutions_of(pkid[0])[0]["id"]
     except:
         pass
     happiness = 0
@@ -282,8 +270,8 @@ async def get_parent(ctx, challenger):
 def get_insert_query(ctx, poke, counter, mother, is_shadow):
     tackle = "tackle"
     query2 = """
-    INSERT INTO pokes (pokname, hpiv, atkiv, defiv, spatkiv, spdefiv, speediv, hpev, atkev, defev, spatkev, spdefev, speedev, pokelevel, moves, hitem, exp, nature, expcap, poknick, price, market_enlist, happiness, fav, ability_index, counter, name, gender, caught_by, shiny, skin)
-    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28, $29, $30, $31) RETURNING id"""
+    INSERT INTO pokes (pokname, hpiv, atkiv, defiv, spatkiv, spdefiv, speediv, hpev, atkev, defev, spatkev, spdefev, speedev, pokelevel, moves, hitem, exp, nature, expcap, poknick, price, market_enlist, happiness, fav, ability_index, counter, name, gender, caught_by, shiny, skin, owner)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28, $29, $30, $31, $29)"""
     skin = "shadow" if is_shadow else None
     args = (
         "Egg",
@@ -545,7 +533,7 @@ class Breeding(commands.Cog):
         father, mother = male, female
         async with ctx.bot.db[0].acquire() as pconn:
             pokes = await pconn.fetchrow(
-                "SELECT pokes, daycarelimit, inventory::json FROM users WHERE u_id = $1",
+                "SELECT daycarelimit, inventory::json FROM users WHERE u_id = $1",
                 ctx.author.id,
             )
 
@@ -554,25 +542,24 @@ class Breeding(commands.Cog):
                 return
             dets = pokes["inventory"]
             s_threshold = round(8000 - 8000 * (dets["shiny-multiplier"] / 100))
-            is_shiny = random.choice([False for i in range(s_threshold)] + [True])
+            is_shiny = one_in(s_threshold)
 
             dlimit = pokes["daycarelimit"]
-            pokes = pokes["pokes"]
             daycared = await pconn.fetchval(
-                "SELECT count(*) FROM pokes WHERE id = ANY ($1) AND pokname = 'Egg'",
-                pokes,
+                "SELECT count(*) FROM pokes WHERE owner = $1 AND pokname = 'Egg'",
+                ctx.author.id,
             )
             if daycared > dlimit:
                 await ctx.send("You already have enough Pokemon in the Daycare!")
                 await self.reset_cooldown(ctx.author.id)
                 return
             father_details = await pconn.fetchrow(
-                "SELECT * FROM pokes WHERE id = (SELECT pokes[$1] FROM users WHERE u_id = $2)",
+                "SELECT * FROM pokes WHERE id = poke_at($2, $1)",
                 father,
                 ctx.author.id,
             )
             mother_details = await pconn.fetchrow(
-                "SELECT * FROM pokes WHERE id = (SELECT pokes[$1] FROM users WHERE u_id = $2)",
+                "SELECT * FROM pokes WHERE id = poke_at($2, $1)",
                 mother,
                 ctx.author.id,
             )
@@ -765,13 +752,8 @@ class Breeding(commands.Cog):
             else:
                 await pconn.execute("UPDATE achievements SET breed_success = breed_success + 1 WHERE u_id = $1", ctx.author.id)
             await pconn.execute(mother_query, *mother_args)
-            pokeid = await pconn.fetchval(query, *args)
+            await pconn.execute(query, *args)
             # a = await pconn.fetchval("SELECT currval('pokes_id_seq');")
-            await pconn.execute(
-                "UPDATE users SET pokes = array_append(pokes, $1) WHERE u_id = $2",
-                pokeid,
-                ctx.author.id,
-            )
         name = mother.name
         ivsum = (
             child.attack
@@ -841,7 +823,7 @@ class Breeding(commands.Cog):
         """Runs a version of filter that only shows pokes that can breed with a certain pokemon."""
         async with ctx.bot.db[0].acquire() as pconn:
             poke = await pconn.fetchval(
-                "SELECT pokes[$1] FROM users WHERE u_id = $2", poke_id, ctx.author.id
+                "SELECT poke_at($2, $1)", poke_id, ctx.author.id
             )
             if poke is None:
                 await ctx.send("That pokemon does not exist!")
@@ -859,24 +841,17 @@ class Breeding(commands.Cog):
             gender = "male"
         else:
             gender = "female"
-        form_info = await ctx.bot.db[1].forms.find_one(
-            {"identifier": details["pokname"].lower()}
-        )
-        egg_groups = await ctx.bot.db[1].egg_groups.find_one(
-            {"species_id": form_info["pokemon_id"]}
-        )
+        form_info = ctx.bot.catalog.form(details["pokname"].lower())
+        egg_groups = ctx.bot.catalog.index.egg_groups(form_info["pokemon_id"])
         if egg_groups is None:
             await ctx.send("That pokemon cannot be bred! It may be formed.")
             return
-        egg_groups = egg_groups["egg_groups"]
         if 15 in egg_groups:
             await ctx.send("Pokemon in the undiscovered egg group cannot breed!")
             return
         egg_groups_str = " ".join(
             [
-                (await ctx.bot.db[1].egg_groups_info.find_one({"id": egg_group_id}))[
-                    "identifier"
-                ]
+                ctx.bot.catalog.index.egg_group_by_id(egg_group_id)["identifier"]
                 for egg_group_id in egg_groups
             ]
         )
@@ -65,7 +65,7 @@ class Chests(commands.Cog):
         async with ctx.bot.db[0].acquire() as pconn:
             for p in self.EVENT_ACTIVE:
                 if not await pconn.fetchval(
-                    "SELECT count(id) FROM pokes WHERE id in (select unnest(u.pokes) from users u where u.u_id = $1) AND radiant = true AND pokname = $2",
+                    "SELECT count(id) FROM pokes WHERE owner = $1 AND radiant = true AND pokname = $2",
                     ctx.author.id,
                     p,
                 ):
@@ -76,6 +76,32 @@ class Chests(commands.Cog):
         await ctx.bot.commondb.create_poke(ctx.bot, ctx.author.id, poke, radiant=True)
         return self.EVENT_ACTIVE[poke]
 
+    async def _take_radiant_pack(self, pconn, user_id, packnum, price):
+        """
+        Takes the gems of a radiant pack from a user and gives its items, run in a transaction.
+
+        Returns a string for user facing output if the purchase failed, and None otherwise.
+        """
+        inventory = await self.bot.inventories.lock(pconn, user_id)
+        if inventory is None:
+            return "You have not Started!\nStart with `/start` first!"
+        deltas = {"radiant gem": -price}
+        if packnum in {1, 2, 3, 4}:
+            item = (
+                "shiny-multiplier",
+                "battle-multiplier",
+                "iv-multiplier",
+                "breeding-multiplier",
+            )[packnum - 1]
+            if inventory.get(item, 0) >= 50:
+                return "You have hit the cap for that multiplier!"
+            deltas[item] = 1
+        elif packnum == 5:
+            deltas["legend chest"] = 1
+        if await self.bot.inventories.apply(pconn, user_id, deltas) is None:
+            return "You cannot afford that pack!"
+        return None
+
     @commands.hybrid_group(name="open")
     async def open_cmds(self, ctx):
         """Top layer of group"""
@@ -84,22 +110,13 @@ class Chests(commands.Cog):
     async def common(self, ctx):
         """Open a common chest."""
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "common chest" not in inventory or inventory["common chest"] <= 0:
-                await ctx.send("You do not have any Common Chests!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "common chest") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any Common Chests!")
                 return
             # await self.log_chest(ctx)
-            inventory["common chest"] = inventory.get("common chest", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
             await pconn.execute("UPDATE achievements SET chests_common = chests_common + 1 WHERE u_id = $1", ctx.author.id)
         reward = random.choices(
             ("radiant", "chest", "ev", "poke", "redeem", "cred"),
@@ -113,15 +130,7 @@ class Chests(commands.Cog):
             msg = f"<a:ExcitedChika:717510691703095386> **Congratulations! You received a radiant {pokemon}!**\n"
         elif reward == "chest":
             async with ctx.bot.db[0].acquire() as pconn:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["rare chest"] = inventory.get("rare chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "rare chest")
             msg = "You received a Rare Chest!\n"
         elif reward == "redeem":
             amount = 1
@@ -158,15 +167,7 @@ class Chests(commands.Cog):
             msg = f"You received a {pokedata.emoji}{pokemon}!\n"
         if gems := 1:
             async with ctx.bot.db[0].acquire() as pconn:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["radiant gem"] = inventory.get("radiant gem", 0) + gems
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "radiant gem", gems)
             msg += f"You also received {gems} Radiant Gems <a:radiantgem:1013790990852685955>!\n"
         msg += await self._maybe_spawn_event(ctx, 0.15)
         await ctx.send(msg)
@@ -175,22 +176,13 @@ class Chests(commands.Cog):
     async def rare(self, ctx):
         """Open a rare chest."""
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "rare chest" not in inventory or inventory["rare chest"] <= 0:
-                await ctx.send("You do not have any Rare Chests!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "rare chest") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any Rare Chests!")
                 return
             # await self.log_chest(ctx)
-            inventory["rare chest"] = inventory.get("rare chest", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
             await pconn.execute("UPDATE achievements SET chests_rare = chests_rare + 1 WHERE u_id = $1", ctx.author.id)
         reward = random.choices(
             ("radiant", "redeem", "chest", "boostedshiny", "shiny"),
@@ -213,15 +205,7 @@ class Chests(commands.Cog):
             msg = f"You received {amount} redeems!\n"
         elif reward == "chest":
             async with ctx.bot.db[0].acquire() as pconn:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["mythic chest"] = inventory.get("mythic chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "mythic chest")
             msg = "You received a Mythic Chest!\n"
         elif reward == "shiny":
             pokemon = random.choice(pList)
@@ -237,15 +221,7 @@ class Chests(commands.Cog):
             msg = f"You received a shiny boosted IV {pokemon}!\n"
         gems = random.randint(1, 2)
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            inventory["radiant gem"] = inventory.get("radiant gem", 0) + gems
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
+            await ctx.bot.inventories.add(pconn, ctx.author.id, "radiant gem", gems)
         msg += f"You also received {gems} Radiant Gems <a:radiantgem:1013790990852685955>!\n"
         msg += await self._maybe_spawn_event(ctx, 0.20)
         await ctx.send(msg)
@@ -254,22 +230,13 @@ class Chests(commands.Cog):
     async def mythic(self, ctx):
         """Open a mythic chest."""
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "mythic chest" not in inventory or inventory["mythic chest"] <= 0:
-                await ctx.send("You do not have any Mythic Chests!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "mythic chest") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any Mythic Chests!")
                 return
             # await self.log_chest(ctx)
-            inventory["mythic chest"] = inventory.get("mythic chest", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
             await pconn.execute("UPDATE achievements SET chests_mythic = chests_mythic + 1 WHERE u_id = $1", ctx.author.id)
         reward = random.choices(
             ("radiant", "boostedleg", "redeem", "chest", "shiny", "boostedshiny"),
@@ -286,15 +253,7 @@ class Chests(commands.Cog):
             msg = f"You received {amount} redeems!\n"
         elif reward == "chest":
             async with ctx.bot.db[0].acquire() as pconn:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["legend chest"] = inventory.get("legend chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "legend chest")
             msg = "You received a Legend Chest!\n"
         elif reward == "boostedleg":
             pokemon = random.choice(LegendList)
@@ -322,15 +281,7 @@ class Chests(commands.Cog):
             msg = f"You received a shiny boosted IV {pokemon}!\n"
         gems = random.randint(8, 11)
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            inventory["radiant gem"] = inventory.get("radiant gem", 0) + gems
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
+            await ctx.bot.inventories.add(pconn, ctx.author.id, "radiant gem", gems)
         msg += f"You also received {gems} Radiant Gems <a:radiantgem:1013790990852685955>!\n"
         msg += await self._maybe_spawn_event(ctx, 0.25)
         await ctx.send(msg)
@@ -339,22 +290,13 @@ class Chests(commands.Cog):
     async def legend(self, ctx):
         """Open a legend chest."""
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "legend chest" not in inventory or inventory["legend chest"] <= 0:
-                await ctx.send("You do not have any Legend Chests!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "legend chest") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any Legend Chests!")
                 return
             # await self.log_chest(ctx)
-            inventory["legend chest"] = inventory.get("legend chest", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
             await pconn.execute("UPDATE achievements SET chests_legend = chests_legend + 1 WHERE u_id = $1", ctx.author.id)
         voucher_chance = 0 if ctx.author.id in (399855039130238986,) else 0.001
         reward = random.choices(
@@ -451,15 +393,7 @@ class Chests(commands.Cog):
             msg = f"You received a shiny boosted IV {pokemon}!\n"
         gems = random.randint(10, 15)
         async with ctx.bot.db[0].acquire() as pconn:
-            inv = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            inv["radiant gem"] = inv.get("radiant gem", 0) + gems
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inv,
-                ctx.author.id,
-            )
+            await ctx.bot.inventories.add(pconn, ctx.author.id, "radiant gem", gems)
         msg += f"You also received {gems} Radiant Gems <a:radiantgem:1013790990852685955>!\n"
         msg += await self._maybe_spawn_event(ctx, 0.33)
         await ctx.send(msg)
@@ -510,41 +444,16 @@ class Chests(commands.Cog):
             if choice is None:
                 await ctx.send("You did not select in time, cancelling.")
                 return
+        # await self.log_chest(ctx)
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if inventory.get("radiant gem", 0) < pack[1]:
-                await ctx.send("You cannot afford that pack!")
-                return
-            # await self.log_chest(ctx)
-            inventory["radiant gem"] = inventory.get("radiant gem", 0) - pack[1]
-            if packnum in {1, 2, 3, 4}:
-                if packnum == 1:
-                    item = "shiny-multiplier"
-                elif packnum == 2:
-                    item = "battle-multiplier"
-                elif packnum == 3:
-                    item = "iv-multiplier"
-                elif packnum == 4:
-                    item = "breeding-multiplier"
-                if inventory.get(item, 0) >= 50:
-                    await ctx.send("You have hit the cap for that multiplier!")
-                    return
-                inventory[item] = min(inventory.get(item, 0) + 1, 50)
-            elif packnum == 5:
-                inventory["legend chest"] = inventory.get("legend chest", 0) + 1
-            elif packnum in {6, 7, 8}:
-                await ctx.bot.commondb.create_poke(
-                    ctx.bot, ctx.author.id, choice, radiant=True, boosted=True
-                )
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
+            async with pconn.transaction():
+                error = await self._take_radiant_pack(pconn, ctx.author.id, packnum, pack[1])
+        if error is not None:
+            await ctx.send(error)
+            return
+        if packnum in {6, 7, 8}:
+            await ctx.bot.commondb.create_poke(
+                ctx.bot, ctx.author.id, choice, radiant=True, boosted=True
             )
         await ctx.send(
             f"You have successfully bought {pack[0]} for <a:radiantgem:1013790990852685955>x{pack[1]}."
@@ -35,8 +35,7 @@ class Battle:
         self.turn = 0
         self.last_move_effect = None
         self.metronome_moves_raw = []
-        # (AttackerType, DefenderType): Effectiveness
-        self.type_effectiveness = {}
+        self.type_chart = ctx.bot.catalog.type_chart
         self.inverse_battle = inverse_battle
         self.msg = ""
 
@@ -200,10 +199,6 @@ class Battle:
         self.metronome_moves_raw = await find(
             self.ctx, "moves", {"id": {"$nin": ignored_ids}}
         )
-        for te in await find(self.ctx, "type_effectiveness", {}):
-            self.type_effectiveness[(te["damage_type_id"], te["target_type_id"])] = te[
-                "damage_factor"
-            ]
         # This calculation only uses the primative speed attr as the pokes have not been fully initiaized yet.
         if (
             self.trainer1.current_pokemon.get_raw_speed()
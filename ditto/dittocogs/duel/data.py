@@ -4,7 +4,6 @@ from io import BytesIO
 
 import aiohttp
 import discord
-from utils.misc import get_battle_file_name
 
 from .buttons import BattlePromptView, PreviewPromptView
 
@@ -39,10 +38,7 @@ async def generate_team_preview(battle):
         "pokemon_info": [
             (
                 "pixel_sprites/"
-                + await get_battle_file_name(
-                    pokemon[0],
-                    battle.ctx.bot,
-                ),
+                + battle.ctx.bot.catalog.sprites.file_name(pokemon[0]),
                 pokemon[1],
             )
             for pokemon in player1_pokemon_info
@@ -59,10 +55,7 @@ async def generate_team_preview(battle):
         "pokemon_info": [
             (
                 "pixel_sprites/"
-                + await get_battle_file_name(
-                    pokemon[0],
-                    battle.ctx.bot,
-                ),
+                + battle.ctx.bot.catalog.sprites.file_name(pokemon[0]),
                 pokemon[1],
             )
             for pokemon in player2_pokemon_info
@@ -115,9 +108,9 @@ async def generate_main_battle_message(battle):
         directory_p1 = "skins"
 
     
-    p1_filename = await get_battle_file_name(
+    sprites = battle.ctx.bot.catalog.sprites
+    p1_filename = sprites.file_name(
         battle.trainer1.current_pokemon._name.replace(" ", "-"),
-        battle.ctx.bot,
         battle.trainer1.current_pokemon.shiny,
         radiant=battle.trainer1.current_pokemon.radiant,
         skin=skin
@@ -127,9 +120,8 @@ async def generate_main_battle_message(battle):
         skin = None
         
 
-    p2_filename = await get_battle_file_name(
+    p2_filename = sprites.file_name(
         battle.trainer2.current_pokemon._name.replace(" ", "-"),
-        battle.ctx.bot,
         battle.trainer2.current_pokemon.shiny,
         radiant=battle.trainer2.current_pokemon.radiant,
         skin=skin
@@ -5372,12 +5372,8 @@ class Move:
         for e in ElementType:
             if e == ElementType.TYPELESS:
                 continue
-            if battle.inverse_battle:
-                if battle.type_effectiveness[(movetype, e)] > 100:
-                    newtypes.add(e)
-            else:
-                if battle.type_effectiveness[(movetype, e)] < 100:
-                    newtypes.add(e)
+            if battle.type_chart.factor(movetype, e, inverse=battle.inverse_battle) < 1:
+                newtypes.add(e)
         newtypes -= set(attacker.type_ids)
         newtypes = list(newtypes)
         if not newtypes:
@@ -1,6 +1,5 @@
 import random
 
-from .data import find, find_one
 from .enums import Ability, DamageClass, ElementType
 from .misc import (
     ExpiringEffect,
@@ -2612,20 +2611,16 @@ class DuelPokemon:
                 and self.grounded(battle, attacker=attacker, move=move)
             ):
                 continue
-            e = battle.type_effectiveness[(attacker_type, defender_type)] / 100
             if (
                 defender_type == ElementType.FLYING
-                and e > 1
                 and move is not None
                 and battle.weather.get() == "h-wind"
+                and battle.type_chart.factor(attacker_type, defender_type) > 1
             ):
-                e = 1
-            if battle.inverse_battle:
-                if e < 1:
-                    e = 2
-                elif e > 1:
-                    e = 0.5
-            effectiveness *= e
+                continue
+            effectiveness *= battle.type_chart.factor(
+                attacker_type, defender_type, inverse=battle.inverse_battle
+            )
         if attacker_type == ElementType.FIRE and self.tar_shot:
             effectiveness *= 2
         return effectiveness
@@ -2825,11 +2820,12 @@ class DuelPokemon:
         nature = raw_data["nature"]
         gender = raw_data["gender"]
 
-        nature = await find_one(ctx, "natures", {"identifier": nature.lower()})
+        catalog = ctx.bot.catalog
+        nature = catalog.nature(nature.lower())
         dec_stat_id = nature["decreased_stat_id"]
         inc_stat_id = nature["increased_stat_id"]
-        dec_stat = await find_one(ctx, "stat_types", {"id": dec_stat_id})
-        inc_stat = await find_one(ctx, "stat_types", {"id": inc_stat_id})
+        dec_stat = catalog.stat_type(dec_stat_id)
+        inc_stat = catalog.stat_type(inc_stat_id)
         dec_stat = dec_stat["identifier"].capitalize().replace("-", " ")
         inc_stat = inc_stat["identifier"].capitalize().replace("-", " ")
         nature_stat_deltas = {
@@ -2935,18 +2931,12 @@ class DuelPokemon:
             pn = pn[:-5]
         # TODO: Meloetta, Shaymin
 
-        form_info = await find_one(ctx, "forms", {"identifier": pn.lower()})
+        form_info = catalog.form(pn.lower())
         # List of type ids
-        type_ids = (await find_one(ctx, "ptypes", {"id": form_info["pokemon_id"]}))[
-            "types"
-        ]
+        type_ids = catalog.ptypes(form_info["pokemon_id"])["types"].copy()
 
         # 6 element list of stat values (int)
-        stats = (
-            await find_one(
-                ctx, "pokemon_stats", {"pokemon_id": form_info["pokemon_id"]}
-            )
-        )["stats"]
+        stats = catalog.stats(form_info["pokemon_id"])["stats"]
         pokemonHp = stats[0]
 
         # Store the base stats for all forms of this poke
@@ -3045,39 +3035,25 @@ class DuelPokemon:
             if "dragon-ascent" in moves:
                 mega_form = pn + "-mega"
         if mega_form is not None:
-            mega_form_info = await find_one(
-                ctx, "forms", {"identifier": mega_form.lower()}
-            )
+            mega_form_info = catalog.form(mega_form.lower())
             if mega_form_info is not None:
-                mega_ability = await find_one(
-                    ctx, "poke_abilities", {"pokemon_id": mega_form_info["pokemon_id"]}
-                )
-                if mega_ability is None:
+                mega_ability_ids = catalog.ability_ids(mega_form_info["pokemon_id"])
+                if not mega_ability_ids:
                     raise ValueError("mega form missing ability in `poke_abilities`")
-                mega_ability_id = mega_ability["ability_id"]
-                mega_types = await find_one(
-                    ctx, "ptypes", {"id": mega_form_info["pokemon_id"]}
-                )
+                mega_ability_id = mega_ability_ids[0]
+                mega_types = catalog.ptypes(mega_form_info["pokemon_id"])
                 if mega_types is None:
                     raise ValueError("mega form missing types in `ptypes`")
-                mega_type_ids = mega_types["types"]
+                mega_type_ids = mega_types["types"].copy()
                 extra_forms.append(mega_form)
 
         for f_name in extra_forms:
-            f_info = await find_one(ctx, "forms", {"identifier": f_name.lower()})
-            f_stats = (
-                await find_one(
-                    ctx, "pokemon_stats", {"pokemon_id": f_info["pokemon_id"]}
-                )
-            )["stats"]
+            f_info = catalog.form(f_name.lower())
+            f_stats = catalog.stats(f_info["pokemon_id"])["stats"]
             base_stats[f_name] = f_stats
 
         # Builds a list of the possible ability ids for this poke, `ab_index` is the currently selected ability from this list
-        ab_ids = []
-        for record in await find(
-            ctx, "poke_abilities", {"pokemon_id": form_info["pokemon_id"]}
-        ):
-            ab_ids.append(record["ability_id"])
+        ab_ids = catalog.ability_ids(form_info["pokemon_id"])
 
         try:
             ab_id = ab_ids[ab_index]
@@ -3249,14 +3225,12 @@ class DuelPokemon:
             ]
         ):
             name = pn.lower().split("-")[0]
-            pid = (await find_one(ctx, "forms", {"identifier": name}))["pokemon_id"]
+            pid = catalog.form(name)["pokemon_id"]
         else:
             pid = form_info["pokemon_id"]
 
         # True if any possible future evo exists
-        can_still_evolve = bool(
-            await find_one(ctx, "pfile", {"evolves_from_species_id": pid})
-        )
+        can_still_evolve = bool(catalog.evolutions_of(pid))
         # Unreleased pokemon that is treated like a form in the bot, monkeypatch fix.
         if pn == "Floette-eternal":
             can_still_evolve = False
@@ -3267,12 +3241,12 @@ class DuelPokemon:
             (((2 * pokemonHp + hpiv + (hpev / 4)) * plevel) / 100) + plevel + 10
         )
 
-        hitem = await find_one(ctx, "items", {"identifier": hitem})
+        hitem = catalog.item(hitem)
 
         if pn == "Shedinja":
             pokemonHp = 1
 
-        weight = (await find_one(ctx, "forms", {"identifier": pn.lower()}))["weight"]
+        weight = form_info["weight"]
         if weight is None:
             weight = 20
 
@@ -3283,12 +3257,11 @@ class DuelPokemon:
                 element = move.split("-")[2]
                 move = "hidden-power"
                 type_override = ElementType[element.upper()]
-            move = await find_one(ctx, "moves", {"identifier": move})
+            move = catalog.move(move)
             if move is None:
-                move = await find_one(ctx, "moves", {"identifier": "tackle"})
-            else:
-                if type_override is not None:
-                    move["type_id"] = type_override
+                move = catalog.move("tackle")
+            elif type_override is not None:
+                move = {**move, "type_id": type_override}
             object_moves.append(Move(**move))
         p = cls(
             pokemon_id=pid,
@@ -1,7 +1,6 @@
 import asyncio
 import contextlib
 import random
-import time
 from collections import defaultdict
 from datetime import datetime
 
@@ -243,10 +242,8 @@ class Events(commands.Cog):
             data = await pconn.fetchrow(
                 "SELECT * FROM eggs WHERE u_id = $1", ctx.author.id
             )
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-        if inventory is None:
+            started = await ctx.bot.queries.has_started(pconn, ctx.author.id)
+        if not started:
             await ctx.send(f"You haven't started!\nStart with `/start` first!")
             return
         if data is None:
@@ -276,12 +273,8 @@ class Events(commands.Cog):
                     "WHERE u_id = $1",
                     ctx.author.id,
                 )
-                inventory["common chest"] = inventory.get("common chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins + 10000, inventory = $1::json WHERE u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "common chest")
+                await ctx.bot.queries.add_credits(pconn, ctx.author.id, 10000)
             await ctx.send("You have received 10k credits and 1 common chest.")
         elif choice == 2:
             if not all(
@@ -304,12 +297,8 @@ class Events(commands.Cog):
                     "omastar = omastar - 1, chansey = chansey - 1 WHERE u_id = $1",
                     ctx.author.id,
                 )
-                inventory["common chest"] = inventory.get("common chest", 0) + 2
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins + 25000, inventory = $1::json WHERE u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "common chest", 2)
+                await ctx.bot.queries.add_credits(pconn, ctx.author.id, 25000)
             await ctx.send("You have received 25k credits and 2 common chests.")
         elif choice == 3:
             if not all(
@@ -323,12 +312,8 @@ class Events(commands.Cog):
                     "WHERE u_id = $1",
                     ctx.author.id,
                 )
-                inventory["rare chest"] = inventory.get("rare chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins + 50000, inventory = $1::json WHERE u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "rare chest")
+                await ctx.bot.queries.add_credits(pconn, ctx.author.id, 50000)
             await ctx.send("You have received 50k credits and 1 rare chest.")
         elif choice == 4:
             if not all((data["kyogre"], data["dialga"])):
@@ -341,12 +326,8 @@ class Events(commands.Cog):
                     "UPDATE eggs SET kyogre = kyogre - 1, dialga = dialga - 1 WHERE u_id = $1",
                     ctx.author.id,
                 )
-                inventory["mythic chest"] = inventory.get("mythic chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins + 50000, inventory = $1::json WHERE u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "mythic chest")
+                await ctx.bot.queries.add_credits(pconn, ctx.author.id, 50000)
             await ctx.send("You have received 50k credits and 1 mythic chest.")
         elif choice == 5:
             if not all(data[x] for x in self.EGG_EMOJIS.keys()):
@@ -362,12 +343,7 @@ class Events(commands.Cog):
                     ctx.author.id,
                 )
                 if data["got_radiant"]:
-                    inventory["legend chest"] = inventory.get("legend chest", 0) + 1
-                    await pconn.execute(
-                        "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                        inventory,
-                        ctx.author.id,
-                    )
+                    await ctx.bot.inventories.add(pconn, ctx.author.id, "legend chest")
                     await ctx.send("You have received 1 legend chest.")
                 else:
                     await ctx.bot.commondb.create_poke(
@@ -545,50 +521,18 @@ class Events(commands.Cog):
                 price,
             )
             if option == 2:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["ghost detector"] = inventory.get("ghost detector", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "ghost detector")
                 await ctx.send(
                     f"Successfully bought a ghost detector for {price} bones."
                 )
             elif option == 3:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["spooky chest"] = inventory.get("spooky chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "spooky chest")
                 await ctx.send(f"Successfully bought a spooky chest for {price} bones.")
             elif option == 4:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["fleshy chest"] = inventory.get("fleshy chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "fleshy chest")
                 await ctx.send(f"Successfully bought a fleshy chest for {price} bones.")
             elif option == 5:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["horrific chest"] = inventory.get("horrific chest", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "horrific chest")
                 await ctx.send(
                     f"Successfully bought a horrific chest for {price} bones."
                 )
@@ -681,21 +625,12 @@ class Events(commands.Cog):
             await ctx.send("This command can only be used during the halloween season!")
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "spooky chest" not in inventory or inventory["spooky chest"] <= 0:
-                await ctx.send("You do not have any Spooky Chests!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "spooky chest") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any Spooky Chests!")
                 return
-            inventory["spooky chest"] = inventory.get("spooky chest", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
         reward = random.choices(
             ("radiant", "ev", "missingno", "redeem", "cred", "trick"),
             weights=(0.005, 0.2, 0.2, 0.05, 0.03, 0.515),
@@ -758,21 +693,12 @@ class Events(commands.Cog):
             await ctx.send("This command can only be used during the halloween season!")
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "fleshy chest" not in inventory or inventory["fleshy chest"] <= 0:
-                await ctx.send("You do not have any Fleshy Chests!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "fleshy chest") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any Fleshy Chests!")
                 return
-            inventory["fleshy chest"] = inventory.get("fleshy chest", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
         reward = random.choices(
             ("radiant", "redeem", "boostedshiny", "missingno", "trick"),
             weights=(0.1, 0.2, 0.05, 0.15, 0.5),
@@ -823,21 +749,12 @@ class Events(commands.Cog):
             await ctx.send("This command can only be used during the halloween season!")
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "horrific chest" not in inventory or inventory["horrific chest"] <= 0:
-                await ctx.send("You do not have any Horrific Chests!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "horrific chest") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any Horrific Chests!")
                 return
-            inventory["horrific chest"] = inventory.get("horrific chest", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
         reward = random.choices(
             ("boostedshiny", "missingno", "radiant", "trick"),
             weights=(0.155, 0.3, 0.235, 0.31),
@@ -875,38 +792,24 @@ class Events(commands.Cog):
     @halloween_cmds.command()
     async def spread_ghosts(self, ctx):
         async with ctx.bot.db[0].acquire() as pconn:
-            inv = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if not inv:
+            if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
                 await ctx.send(f"You have not Started!\nStart with `/start` first!")
                 return
-            honey = await pconn.fetchval(
-                "SELECT * FROM honey WHERE channel = $1 LIMIT 1",
-                ctx.channel.id,
-            )
-            if honey is not None:
+            if ctx.bot.honey.get(ctx.channel.id) is not None:
                 await ctx.send(
                     "There is already honey in this channel! You can't add more yet."
                 )
                 return
-            if "ghost detector" in inv and inv["ghost detector"] >= 1:
-                inv["ghost detector"] -= 1
-            else:
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "ghost detector") is None:
                 await ctx.send("You do not have any ghost detectors!")
                 return
-            expires = int(time.time() + (60 * 60))
-            await pconn.execute(
-                "INSERT INTO honey (channel, hour, owner, type) VALUES ($1, $2, $3, 'ghost')",
-                ctx.channel.id,
-                expires,
-                ctx.author.id,
-            )
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                inv,
-                ctx.author.id,
-            )
+            if await ctx.bot.honey.spread(ctx.channel.id, ctx.author.id, "ghost") is None:
+                # Someone spread honey since, give back what was taken
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "ghost detector")
+                await ctx.send(
+                    "There is already honey in this channel! You can't add more yet."
+                )
+                return
             await ctx.send(
                 "You have successfully started a ghost detector, ghost spawn chances are greatly increased for the next hour!"
             )
@@ -922,40 +825,26 @@ class Events(commands.Cog):
             await ctx.send("This command can only be used during the christmas season!")
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            inv = await pconn.fetchval(
-                "SELECT holidayinv::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inv is None:
+            if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
                 await ctx.send(f"You have not Started!\nStart with `/start` first!")
                 return
-            honey = await pconn.fetchval(
-                "SELECT * FROM honey WHERE channel = $1 LIMIT 1",
-                ctx.channel.id,
-            )
-            if honey is not None:
+            if ctx.bot.honey.get(ctx.channel.id) is not None:
                 await ctx.send(
                     "There is already honey in this channel! You can't add more yet."
                 )
                 return
-            if "holiday cheer" in inv and inv["holiday cheer"] >= 1:
-                inv["holiday cheer"] -= 1
-            else:
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "holiday cheer", column="holidayinv") is None:
                 await ctx.send(
                     "You do not have any holiday cheer, catch some pokemon to find some!"
                 )
                 return
-            expires = int(time.time() + (60 * 60))
-            await pconn.execute(
-                "INSERT INTO honey (channel, expires, owner, type) VALUES ($1, $2, $3, 'cheer')",
-                ctx.channel.id,
-                expires,
-                ctx.author.id,
-            )
-            await pconn.execute(
-                "UPDATE users SET holidayinv = $1::json WHERE u_id = $2",
-                inv,
-                ctx.author.id,
-            )
+            if await ctx.bot.honey.spread(ctx.channel.id, ctx.author.id, "cheer") is None:
+                # Someone spread honey since, give back what was taken
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "holiday cheer", column="holidayinv")
+                await ctx.send(
+                    "There is already honey in this channel! You can't add more yet."
+                )
+                return
             await ctx.send(
                 f"You have successfully spread holiday cheer! Christmas spirits will be attracted to this channel for 1 hour."
             )
@@ -977,93 +866,49 @@ class Events(commands.Cog):
             if "coal" not in holidayinv:
                 await ctx.send("You haven't gotten any coal yet!")
                 return
-            if option == 1:
-                if holidayinv["coal"] < 20:
-                    await ctx.send("You don't have enough coal for that!")
-                    return
-                holidayinv["coal"] -= 20
-                await pconn.execute(
-                    "UPDATE users SET redeems = redeems + 1, holidayinv = $1::json WHERE u_id = $2",
-                    holidayinv,
-                    ctx.author.id,
-                )
-                await ctx.send("You bought 1 redeem.")
-            elif option == 2:
-                if holidayinv["coal"] < 50:
-                    await ctx.send("You don't have enough coal for that!")
-                    return
-                holidayinv["coal"] -= 50
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["battle-multiplier"] = min(
-                    inventory.get("battle-multiplier", 0) + 2, 50
-                )
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json, holidayinv = $2::json WHERE u_id = $3",
-                    inventory,
-                    holidayinv,
-                    ctx.author.id,
-                )
-                await ctx.send("You bought 2x battle multipliers.")
-            elif option == 3:
-                if holidayinv["coal"] < 50:
-                    await ctx.send("You don't have enough coal for that!")
-                    return
-                holidayinv["coal"] -= 50
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["shiny-multiplier"] = min(
-                    inventory.get("shiny-multiplier", 0) + 2, 50
-                )
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json, holidayinv = $2::json WHERE u_id = $3",
-                    inventory,
-                    holidayinv,
-                    ctx.author.id,
-                )
-                await ctx.send("You bought 2x shiny multipliers.")
-            elif option == 4:
-                if holidayinv["coal"] < 85:
-                    await ctx.send("You don't have enough coal for that!")
-                    return
-                holidayinv["coal"] -= 85
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["radiant gem"] = inventory.get("radiant gem", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json, holidayinv = $2::json WHERE u_id = $3",
-                    inventory,
-                    holidayinv,
-                    ctx.author.id,
-                )
-                await ctx.send("You bought 1x radiant gem.")
-            elif option == 5:
-                if holidayinv["coal"] < 200:
-                    await ctx.send("You don't have enough coal for that!")
-                    return
-                holidayinv["coal"] -= 200
-                skins = await pconn.fetchval(
-                    "SELECT skins::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                pokemon = random.choice(list(self.CHRISTMAS_MOVES.keys())).lower()
-                if pokemon not in skins:
-                    skins[pokemon] = {}
-                if "xmas" not in skins[pokemon]:
-                    skins[pokemon]["xmas"] = 1
-                else:
-                    skins[pokemon]["xmas"] += 1
-                await pconn.execute(
-                    "UPDATE users SET skins = $1::json, holidayinv = $2::json WHERE u_id = $3",
-                    skins,
-                    holidayinv,
-                    ctx.author.id,
-                )
-                await ctx.send(
-                    f"You got a {pokemon} christmas skin! Apply it with `/skin apply`."
-                )
+            price = (20, 50, 50, 85, 200)[option - 1]
+            async with pconn.transaction():
+                if await self.bot.inventories.take(
+                    pconn, ctx.author.id, "coal", price, column="holidayinv"
+                ) is None:
+                    msg = "You don't have enough coal for that!"
+                elif option == 1:
+                    await pconn.execute(
+                        "UPDATE users SET redeems = redeems + 1 WHERE u_id = $1",
+                        ctx.author.id,
+                    )
+                    msg = "You bought 1 redeem."
+                elif option in {2, 3}:
+                    item = "battle-multiplier" if option == 2 else "shiny-multiplier"
+                    inventory = await self.bot.inventories.lock(pconn, ctx.author.id)
+                    await self.bot.inventories.add(
+                        pconn,
+                        ctx.author.id,
+                        item,
+                        min(inventory.get(item, 0) + 2, 50) - inventory.get(item, 0),
+                    )
+                    msg = f"You bought 2x {'battle' if option == 2 else 'shiny'} multipliers."
+                elif option == 4:
+                    await self.bot.inventories.add(pconn, ctx.author.id, "radiant gem")
+                    msg = "You bought 1x radiant gem."
+                elif option == 5:
+                    skins = await pconn.fetchval(
+                        "SELECT skins::json FROM users WHERE u_id = $1", ctx.author.id
+                    )
+                    pokemon = random.choice(list(self.CHRISTMAS_MOVES.keys())).lower()
+                    if pokemon not in skins:
+                        skins[pokemon] = {}
+                    if "xmas" not in skins[pokemon]:
+                        skins[pokemon]["xmas"] = 1
+                    else:
+                        skins[pokemon]["xmas"] += 1
+                    await pconn.execute(
+                        "UPDATE users SET skins = $1::json WHERE u_id = $2",
+                        skins,
+                        ctx.author.id,
+                    )
+                    msg = f"You got a {pokemon} christmas skin! Apply it with `/skin apply`."
+        await ctx.send(msg)
 
     @christmas_cmds.command()
     async def inventory(self, ctx):
@@ -1124,21 +969,12 @@ class Events(commands.Cog):
             await ctx.send("This command can only be used during the christmas season!")
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT holidayinv::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "small gift" not in inventory or inventory["small gift"] <= 0:
-                await ctx.send("You do not have any small gifts!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "small gift", column="holidayinv") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any small gifts!")
                 return
-            inventory["small gift"] = inventory.get("small gift", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET holidayinv = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
         reward = random.choices(
             ("skin", "coal", "redeem", "boostedice", "shinyice"),
             weights=(0.04, 0.41, 0.15, 0.2, 0.1),
@@ -1166,15 +1002,7 @@ class Events(commands.Cog):
             )
         elif reward == "coal":
             async with ctx.bot.db[0].acquire() as pconn:
-                inventory = await pconn.fetchval(
-                    "SELECT holidayinv::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["coal"] = inventory.get("coal", 0) + 2
-                await pconn.execute(
-                    "UPDATE users SET holidayinv = $1::json WHERE u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "coal", 2, column="holidayinv")
             msg = "You opened the gift, and inside was 2 coal...\n"
         elif reward == "redeem":
             amount = 1
@@ -1213,21 +1041,12 @@ class Events(commands.Cog):
             await ctx.send("This command can only be used during the christmas season!")
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT holidayinv::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send(f"You have not Started!\nStart with `/start` first!")
-                return
-            if "large gift" not in inventory or inventory["large gift"] <= 0:
-                await ctx.send("You do not have any large gifts!")
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "large gift", column="holidayinv") is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send(f"You have not Started!\nStart with `/start` first!")
+                else:
+                    await ctx.send("You do not have any large gifts!")
                 return
-            inventory["large gift"] = inventory.get("large gift", 0) - 1
-            await pconn.execute(
-                "UPDATE users SET holidayinv = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
         reward = random.choices(
             ("skin", "coal", "redeem", "energy", "shinyice"),
             weights=(0.1, 0.25, 0.6, 0.2, 0.01),
@@ -1256,15 +1075,7 @@ class Events(commands.Cog):
         elif reward == "coal":
             amount = random.randint(4, 5)
             async with ctx.bot.db[0].acquire() as pconn:
-                inventory = await pconn.fetchval(
-                    "SELECT holidayinv::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory["coal"] = inventory.get("coal", 0) + amount
-                await pconn.execute(
-                    "UPDATE users SET holidayinv = $1::json WHERE u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "coal", amount, column="holidayinv")
             msg = f"You opened the gift, and inside was {amount} coal...\n"
         elif reward == "redeem":
             amount = random.randint(1, 2)
@@ -1371,22 +1182,14 @@ class Events(commands.Cog):
             await ctx.send("That is not an English letter!")
             return
         async with ctx.bot.db[0].acquire() as pconn:
-            letters = await pconn.fetchval(
-                "SELECT holidayinv::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-        if letters is None:
-            await ctx.send("You have not started yet.\nStart with `/start` first!")
-            return
-        if letters.get(letter, 0) <= 0:
-            await ctx.send(f"You don't have any {self.UNOWN_CHARACTERS[1][letter]}s!")
-            return
-        letters[letter] -= 1
-        async with ctx.bot.db[0].acquire() as pconn:
-            await pconn.execute(
-                "UPDATE users SET holidayinv = $2::json WHERE u_id = $1",
-                ctx.author.id,
-                letters,
-            )
+            if await ctx.bot.inventories.take(
+                pconn, ctx.author.id, letter, column="holidayinv"
+            ) is None:
+                if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                    await ctx.send("You have not started yet.\nStart with `/start` first!")
+                else:
+                    await ctx.send(f"You don't have any {self.UNOWN_CHARACTERS[1][letter]}s!")
+                return
         for idx, character in enumerate(self.UNOWN_WORD):
             if character == letter and self.UNOWN_GUESSES[idx] is None:
                 self.UNOWN_GUESSES[idx] = ctx.author.id
@@ -1532,26 +1335,14 @@ class Events(commands.Cog):
 
     async def give_cheer(self, channel, user):
         async with self.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT holidayinv::json FROM users WHERE u_id = $1", user.id
-            )
-            inventory["holiday cheer"] = inventory.get("holiday cheer", 0) + 1
-            await pconn.execute(
-                "UPDATE users SET holidayinv = $1::json where u_id = $2",
-                inventory,
-                user.id,
-            )
+            await self.bot.inventories.add(pconn, user.id, "holiday cheer", column="holidayinv")
         await channel.send(
             f"The pokemon dropped some holiday cheer!\nUse command `/spread cheer` to share it with the rest of the server."
         )
 
     async def maybe_spawn_christmas(self, channel):
-        async with self.bot.db[0].acquire() as pconn:
-            honey = await pconn.fetchval(
-                "SELECT type FROM honey WHERE channel = $1 LIMIT 1",
-                channel.id,
-            )
-        if honey != "cheer":
+        honey = self.bot.honey.get(channel.id)
+        if honey is None or honey.type != "cheer":
             return
         await asyncio.sleep(random.randint(30, 90))
         await ChristmasSpawn(
@@ -1587,16 +1378,7 @@ class Events(commands.Cog):
             return
 
         async with self.bot.db[0].acquire() as pconn:
-            letters = await pconn.fetchval(
-                "SELECT holidayinv::json FROM users WHERE u_id = $1", winner.author.id
-            )
-            if letters is not None:
-                letters[letter] = letters.get(letter, 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET holidayinv = $2::json WHERE u_id = $1",
-                    winner.author.id,
-                    letters,
-                )
+            await self.bot.inventories.add(pconn, winner.author.id, letter, column="holidayinv")
 
         embed = discord.Embed(
             title="Guessed!",
@@ -1624,17 +1406,7 @@ class Events(commands.Cog):
                 for uid, points in winners.items():
                     if points > 10:
                         points //= 10
-                        inventory = await pconn.fetchval(
-                            "SELECT inventory::json FROM users WHERE u_id = $1", uid
-                        )
-                        inventory["rare chest"] = (
-                            inventory.get("rare chest", 0) + points
-                        )
-                        await pconn.execute(
-                            "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                            inventory,
-                            uid,
-                        )
+                        await self.bot.inventories.add(pconn, uid, "rare chest", points)
                         points = 10
                     await pconn.execute(
                         "UPDATE users SET mewcoins = mewcoins + $1 WHERE u_id = $2",
@@ -1765,7 +1537,7 @@ class ChristmasSpawn(discord.ui.View):
         pokeurl = "https://skylarr1227.github.io/images/" + await get_battle_file_name(
             self.poke, self.cog.bot, skin="xmas"
         )
-        guild = await self.cog.bot.mongo_find("guilds", {"id": self.channel.guild.id})
+        guild = await self.cog.bot.guild_settings.get(self.channel.guild.id)
         if guild is None:
             small_images = False
         else:
@@ -1826,22 +1598,11 @@ class ChristmasSpawn(discord.ui.View):
             return
         async with self.cog.bot.db[0].acquire() as pconn:
             for attacker, damage in self.attacked.items():
-                inventory = await pconn.fetchval(
-                    "SELECT holidayinv::json FROM users WHERE u_id = $1", attacker.id
-                )
-                if inventory is None:
-                    continue
-                if damage == 2:
-                    inventory["large gift"] = inventory.get("large gift", 0) + 1
-                elif damage == 1:
-                    inventory["small gift"] = inventory.get("small gift", 0) + 1
-                elif damage == 0:
-                    inventory["coal"] = inventory.get("coal", 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET holidayinv = $1::json WHERE u_id = $2",
-                    inventory,
-                    attacker.id,
-                )
+                reward = {2: "large gift", 1: "small gift", 0: "coal"}.get(damage)
+                if reward is not None:
+                    await self.cog.bot.inventories.add(
+                        pconn, attacker.id, reward, column="holidayinv"
+                    )
         self.embed = discord.Embed(
             title="The Christmas Pokémon was defeated! Attackers have been awarded.",
             color=color,
@@ -12,6 +12,8 @@ from discord.ext import commands
 from utils.checks import tradelock
 from utils.misc import ConfirmView, MenuView, get_pokemon_image, pagify
 
+from dittocore.honey import HONEY_NAMES
+from dittocore.listing import KeysetPages
 from dittocogs.json_files import *
 from dittocogs.market import (
     CRYSTAL_PATREON_SLOT_BONUS,
@@ -84,32 +86,20 @@ class Extras(commands.Cog):
             if not inv:
                 await ctx.send(f"You have not Started!\nStart with `/start` first!")
                 return
-            honey = await pconn.fetchval(
-                "SELECT * FROM honey WHERE channel = $1 LIMIT 1",
-                ctx.channel.id,
-            )
-            if honey is not None:
+            if ctx.bot.honey.get(ctx.channel.id) is not None:
                 await ctx.send(
                     "There is already honey in this channel! You can't add more yet."
                 )
                 return
-            if "honey" in inv and inv["honey"] >= 1:
-                inv["honey"] -= 1
-            else:
+            if await ctx.bot.inventories.take(pconn, ctx.author.id, "honey") is None:
                 await ctx.send("You do not have any units of Honey!")
                 return
-            expires = int(time.time() + (60 * 60))
-            await pconn.execute(
-                "INSERT INTO honey (channel, expires, owner, type) VALUES ($1, $2, $3, 'honey')",
-                ctx.channel.id,
-                expires,
-                ctx.author.id,
-            )
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                inv,
-                ctx.author.id,
-            )
+            if await ctx.bot.honey.spread(ctx.channel.id, ctx.author.id, "honey") is None:
+                await ctx.bot.inventories.add(pconn, ctx.author.id, "honey")
+                await ctx.send(
+                    "There is already honey in this channel! You can't add more yet."
+                )
+                return
             await ctx.send(
                 "You have successfully spread some of your honey, rare spawn chance increased by nearly 20 times normal in this channel for the next hour!"
             )
@@ -120,29 +110,33 @@ class Extras(commands.Cog):
             195938951188578304,  # gomp
             3746,  # not a real user, just used to store pokes and such
         ]
+        # Staff and immune users are left out of the boards
+        ranked = "staff IS DISTINCT FROM 'Developer' AND NOT u_id = ANY($1)"
         if board.lower() == "vote":
-            async with ctx.bot.db[0].acquire() as pconn:
-                leaders = await pconn.fetch(
-                    "SELECT tnick, vote_streak, u_id, staff FROM users WHERE last_vote >= $1 ORDER BY vote_streak DESC",
-                    time.time() - (36 * 60 * 60),
-                )
-            names = [record["tnick"] for record in leaders]
-            votes = [record["vote_streak"] for record in leaders]
-            ids = [record["u_id"] for record in leaders]
-            staffs = [record["staff"] for record in leaders]
+
+            def format_page(records, index):
+                desc = ""
+                for idx, record in enumerate(records, start=index * 15 + 1):
+                    if record["tnick"] is not None:
+                        name = f"{record['tnick']} - ({record['u_id']})"
+                    else:
+                        name = f"Unknown user - ({record['u_id']})"
+                    desc += f"{idx}. {record['vote_streak']:,} votes - {name}\n"
+                return desc
+
             embed = discord.Embed(title="Upvote Streak Rankings!", color=0xFFB6C1)
-            desc = ""
-            true_idx = 1
-            for idx, vote in enumerate(votes):
-                if staffs[idx] == "Developer" or ids[idx] in LEADERBOARD_IMMUNE_USERS:
-                    continue
-                if names[idx] is not None:
-                    name = f"{names[idx]} - ({ids[idx]})"
-                else:
-                    name = f"Unknown user - ({ids[idx]})"
-                desc += f"{true_idx}. {vote:,} votes - {name}\n"
-                true_idx += 1
-            pages = pagify(desc, base_embed=embed)
+            pages = KeysetPages(
+                ctx.bot.db[0],
+                table="users",
+                where=f"{ranked} AND last_vote >= $2",
+                args=[LEADERBOARD_IMMUNE_USERS, time.time() - (36 * 60 * 60)],
+                tiebreak="u_id",
+                key="COALESCE(vote_streak,0)",
+                descending=True,
+                columns="tnick, COALESCE(vote_streak,0) AS vote_streak, u_id",
+                format_page=format_page,
+                base_embed=embed,
+            )
             await MenuView(ctx, pages).start()
         elif board.lower() == "servers":
             total = []
@@ -180,7 +174,7 @@ class Extras(commands.Cog):
         elif board.lower() == "pokemon":
             async with ctx.bot.db[0].acquire() as pconn:
                 details = await pconn.fetch(
-                    """SELECT u_id, cardinality(pokes) as pokenum, staff, tnick FROM users ORDER BY pokenum DESC"""
+                    """SELECT users.u_id, owned.pokenum, users.staff, users.tnick FROM users INNER JOIN (SELECT owner, count(*) as pokenum FROM pokes WHERE owner IS NOT NULL GROUP BY owner) owned ON owned.owner = users.u_id ORDER BY pokenum DESC"""
                 )
             pokes = [record["pokenum"] for record in details]
             ids = [record["u_id"] for record in details]
@@ -202,31 +196,30 @@ class Extras(commands.Cog):
             pages = pagify(desc, base_embed=embed)
             await MenuView(ctx, pages).start()
         elif board.lower() == "fishing":
-            async with ctx.bot.db[0].acquire() as pconn:
-                details = await pconn.fetch(
-                    """SELECT u_id, fishing_exp, fishing_level as pokenum, staff, tnick FROM users ORDER BY fishing_exp DESC"""
-                )
 
-            pokes = [record["pokenum"] for record in details]
-            exps = [t["fishing_exp"] for t in details]
-            ids = [record["u_id"] for record in details]
-            staffs = [record["staff"] for record in details]
-            names = [record["tnick"] for record in details]
+            def format_page(records, index):
+                desc = ""
+                for idx, record in enumerate(records, start=index * 15 + 1):
+                    if record["tnick"] is not None:
+                        name = f"{record['tnick']} - ({record['u_id']})"
+                    else:
+                        name = f"Unknown user - ({record['u_id']})"
+                    desc += f"__{idx}__. `FishEXP` : **{record['fishing_exp']}** - `{name}`\n"
+                return desc
+
             embed = discord.Embed(title="Fishing Leaderboard!", color=0xFFB6C1)
-            desc = ""
-            true_idx = 1
-            for idx, id in enumerate(ids):
-                if staffs[idx] == "Developer" or ids[idx] in LEADERBOARD_IMMUNE_USERS:
-                    continue
-                pokenum = pokes[idx]
-                exp = exps[idx]
-                if names[idx] is not None:
-                    name = f"{names[idx]} - ({id})"
-                else:
-                    name = f"Unknown user - ({id})"
-                desc += f"__{true_idx}__. `FishEXP` : **{exp}** - `{name}`\n"
-                true_idx += 1
-            pages = pagify(desc, base_embed=embed)
+            pages = KeysetPages(
+                ctx.bot.db[0],
+                table="users",
+                where=ranked,
+                args=[LEADERBOARD_IMMUNE_USERS],
+                tiebreak="u_id",
+                key="COALESCE(fishing_exp,0)",
+                descending=True,
+                columns="tnick, COALESCE(fishing_exp,0) AS fishing_exp, u_id",
+                format_page=format_page,
+                base_embed=embed,
+            )
             await MenuView(ctx, pages).start()
 
     @commands.hybrid_command()
@@ -236,27 +229,15 @@ class Extras(commands.Cog):
             name="Official Server",
             value="[Join the Official Server](https://discord.gg/ditto)",
         )
-        async with ctx.bot.db[0].acquire() as pconn:
-            honeys = await pconn.fetch(
-                "SELECT channel, expires, type FROM honey WHERE channel = ANY ($1) ",
-                [channel.id for channel in ctx.guild.text_channels],
-            )
+        honeys = [ctx.bot.honey.get(channel.id) for channel in ctx.guild.text_channels]
         desc = ""
         for t in honeys:
-            channel = t["channel"]
-            expires = t["expires"]
-            honey_type = t["type"]
-            if honey_type == "honey":
-                honey_type = "Honey"
-            elif honey_type == "ghost":
-                honey_type = "Ghost Detector"
-            elif honey_type == "cheer":
-                honey_type = "Christmas Cheer"
-            # Convert the expire timestamp to 10 minute buckets of time remaining
-            # Since the task that clears honey only runs every 10 minutes, it doesn't make much sense to try to be more accurate than that
-            minutes = int((expires - time.time()) // 60)
-            minutes -= minutes % 10
-            minutes = "Less than 10 minutes" if minutes < 0 else f"{minutes} minutes"
+            if t is None:
+                continue
+            channel = t.channel
+            honey_type = HONEY_NAMES.get(t.type, t.type)
+            minutes = int((t.expires - time.time()) // 60)
+            minutes = "Less than a minute" if minutes < 1 else f"{minutes} minutes"
             desc += f"{honey_type} Stats for <#{channel}>\n\t**__-__Expires in {minutes}**\n"
         pages = pagify(desc, base_embed=embed)
         await MenuView(ctx, pages).start()
@@ -288,20 +269,25 @@ class Extras(commands.Cog):
                 "You have no nature capsules! Buy some with `/redeem nature capsules`."
             )
             return
-        dets["nature-capsules"] = dets["nature-capsules"] - 1
         async with ctx.bot.db[0].acquire() as pconn:
             _id = await pconn.fetchval(
                 "SELECT selected FROM users WHERE u_id = $1", ctx.author.id
             )
             name = await pconn.fetchval("SELECT pokname FROM pokes WHERE id = $1", _id)
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                dets,
-                ctx.author.id,
-            )
-            await pconn.execute(
-                "UPDATE pokes SET nature = $1 WHERE id = $2", nature, _id
-            )
+            async with pconn.transaction():
+                if (
+                    await ctx.bot.inventories.take(
+                        pconn, ctx.author.id, "nature-capsules"
+                    )
+                    is None
+                ):
+                    await ctx.send(
+                        "You have no nature capsules! Buy some with `/redeem nature capsules`."
+                    )
+                    return
+                await pconn.execute(
+                    "UPDATE pokes SET nature = $1 WHERE id = $2", nature, _id
+                )
         await ctx.send(
             f"You have successfully changed your selected Pokemon's nature to {nature}"
         )
@@ -822,10 +808,9 @@ class Extras(commands.Cog):
                     f"You are not permitted to see the Trainer card of {user.name}"
                 )
                 return
-            pokes = details["pokes"]
-            daycared = await tconn.fetchval(
-                "SELECT count(*) FROM pokes WHERE id = ANY ($1) AND pokname = 'Egg'",
-                pokes,
+            count, daycared = await tconn.fetchrow(
+                "SELECT count(*), count(*) FILTER (WHERE pokname = 'Egg') FROM pokes WHERE owner = $1",
+                user.id,
             )
             usedmarket = await tconn.fetchval(
                 "SELECT count(id) FROM market WHERE owner = $1 AND buyer IS NULL",
@@ -843,7 +828,6 @@ class Extras(commands.Cog):
         hitem = details["held_item"]
         marketlimit = details["marketlimit"]
         dets = details["inventory"]
-        count = len(pokes)
         is_staff = details["staff"]
 
         embed = Embed(color=0xFFB6C1)
@@ -1039,7 +1023,6 @@ class Extras(commands.Cog):
                 vote_streak = 0
             else:
                 vote_streak = details["vote_streak"]
-            pokes = details["pokes"]
             mystery_token = details["mystery_token"]
             details["visible"]
             details["u_id"]
@@ -1048,7 +1031,6 @@ class Extras(commands.Cog):
             uppoints = details["upvotepoints"]
             mewcoins = details["mewcoins"]
             evpoints = details["evpoints"]
-            len(pokes)
             is_staff = details["staff"]
             region = details["region"]
             staffrank = await tconn.fetchval(
@@ -1191,10 +1173,9 @@ class Extras(commands.Cog):
                     f"You are not permitted to see how many chests {user.name} has"
                 )
                 return
-            pokes = details["pokes"]
-            daycared = await pconn.fetchval(
-                "SELECT count(*) FROM pokes WHERE id = ANY ($1) AND pokname = 'Egg'",
-                pokes,
+            count, daycared = await pconn.fetchrow(
+                "SELECT count(*), count(*) FILTER (WHERE pokname = 'Egg') FROM pokes WHERE owner = $1",
+                user.id,
             )
             usedmarket = await pconn.fetchval(
                 "SELECT count(id) FROM market WHERE owner = $1 AND buyer IS NULL",
@@ -1208,7 +1189,6 @@ class Extras(commands.Cog):
         hitem = details["held_item"]
         marketlimit = details["marketlimit"]
         dets = details["inventory"]
-        count = len(pokes)
         is_staff = details["staff"]
         hunt = details["hunt"]
         huntprogress = details["chain"]
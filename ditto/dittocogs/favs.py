@@ -37,7 +37,7 @@ class Favs(commands.Cog):
                     await ctx.send("You don't have that Pokemon")
                     return
                 _id = await pconn.fetchval(
-                    "SELECT pokes[$1] FROM users WHERE u_id = $2",
+                    "SELECT poke_at($2, $1)",
                     poke,
                     ctx.author.id,
                 )
@@ -62,7 +62,7 @@ class Favs(commands.Cog):
                     await ctx.send("You don't have that Pokemon")
                     return
                 _id = await pconn.fetchval(
-                    "SELECT pokes[$1] FROM users WHERE u_id = $2",
+                    "SELECT poke_at($2, $1)",
                     poke,
                     ctx.author.id,
                 )
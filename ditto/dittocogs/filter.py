@@ -2,8 +2,9 @@ from datetime import datetime, timedelta
 
 import discord
 from discord.ext import commands
-from utils.misc import AsyncIter, MenuView, get_emoji, pagify
+from utils.misc import MenuView, get_emoji
 
+from dittocore.listing import EV_SUM, IV_SUM, POKE_STATS, KeysetPages, OwnedPages
 from dittocogs.json_files import *
 from dittocogs.pokemon_list import *
 
@@ -63,8 +64,16 @@ KEYS = {
 }
 PRECEDENCE = {"!": 3, "&": 2, "|": 1}
 PER_PAGE = 15
-PAGE_COUNT = 150
-POKE_COUNT = PER_PAGE * PAGE_COUNT
+# order_col to the key a listing is sorted by, None sorts by the tiebreak alone
+SORT_KEYS = {
+    "pokname": "COALESCE(pokname,'')",
+    "pokelevel": "COALESCE(pokelevel,0)",
+    "pokeprice": "market.price",
+    1: IV_SUM,
+    2: EV_SUM,
+    "position": None,
+    "orderid": None,
+}
 
 
 class ExtractionException(ValueError):
@@ -96,7 +105,7 @@ class Filter(commands.Cog):
         except ExtractionException as e:
             await ctx.send(f"Your filter args were not valid.\n{e}")
 
-    async def _expand_forms(self, ctx, names):
+    def _expand_forms(self, names):
         forms = set()
         for name in names:
             forms.add(name)
@@ -106,12 +115,9 @@ class Filter(commands.Cog):
             if any(name.endswith(x) for x in ["-galar", "-alola", "-hisui"]):
                 region = name[:-6]
                 name = name[:-6]
-            cursor = ctx.bot.db[1].forms.find(
-                {"identifier": {"$regex": f"{name.lower()}-.*"}}
-            )
             forms |= {
                 t.capitalize() + region
-                for t in await cursor.distinct("identifier")
+                for t in self.bot.catalog.forms_with_prefix(f"{name.lower()}-")
                 if not any(t.endswith(x) for x in ["-galar", "-alola", "-hisui"])
             }
 
@@ -136,19 +142,12 @@ class Filter(commands.Cog):
 
         if filter_type == "p":
             async with ctx.bot.db[0].acquire() as pconn:
-                pokes = await pconn.fetchval(
-                    "SELECT pokes FROM users WHERE u_id = $1", ctx.author.id
-                )
-                mother_raw = await pconn.fetch(
-                    f"SELECT pokemon_id, entry_time FROM mothers WHERE pokemon_id = ANY($1)",
-                    pokes,
-                )
-                mothers = {t["pokemon_id"]: t["entry_time"] for t in mother_raw}
-            if pokes is None:
+                started = await ctx.bot.queries.has_started(pconn, ctx.author.id)
+                mothers = await ctx.bot.queries.mothers(pconn, ctx.author.id)
+            if not started:
                 await ctx.send(f"You have not started!\nStart with `/start` first.")
                 return
-            pokes = tuple(pokes)
-            sql_data.append(pokes)
+            sql_data.append(ctx.author.id)
 
         # Splits the raw args string into a list of "tokens" that are easier for the code to understand.
         tokens = []
@@ -215,112 +214,85 @@ class Filter(commands.Cog):
                         for name in data:
                             name = name.replace(".", "").capitalize()
                             names.add(name)
-                        names = await self._expand_forms(ctx, names)
+                        names = self._expand_forms(names)
                         sql_data.append(list(names))
                         postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "evo":
-                    names = set()
+                    chains = set()
                     for evo in data:
                         evo = evo.replace(".", "").lower()
-                        evo_poke = await ctx.bot.db[1].pfile.find_one(
-                            {"identifier": evo.lower()}
-                        )
+                        evo_poke = ctx.bot.catalog.pfile_by_identifier(evo)
                         if not evo_poke:
                             continue
-                        evo_chain = evo_poke["evolution_chain_id"]
-                        async for file in ctx.bot.db[1].pfile.find(
-                            {"evolution_chain_id": evo_chain}
-                        ):
-                            names.add(file["identifier"].capitalize())
-                    names = await self._expand_forms(ctx, names)
+                        chains.add(evo_poke["evolution_chain_id"])
+                    names = {
+                        name.capitalize()
+                        for name in ctx.bot.catalog.index.forms(chains=chains)
+                    }
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "starter":
                     names = set(starterList)
-                    names = await self._expand_forms(ctx, names)
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "legend":
                     names = set(LegendList)
-                    names = await self._expand_forms(ctx, names)
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "ultra":
                     names = set(ubList)
-                    names = await self._expand_forms(ctx, names)
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "pseudo":
                     names = set(pseudoList)
-                    names = await self._expand_forms(ctx, names)
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "alola":
                     names = set(alolans)
-                    names = await self._expand_forms(ctx, names)
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "galar":
                     names = set(galarians)
-                    names = await self._expand_forms(ctx, names)
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "hisui":
                     names = set(hisuians)
-                    names = await self._expand_forms(ctx, names)
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "type":
-                    names = set()
+                    type_ids = set()
                     for type in data:
-                        type = type.lower()
-                        type_info = await ctx.bot.db[1].types.find_one(
-                            {"identifier": type}
-                        )
+                        type_info = ctx.bot.catalog.index.type(type.lower())
                         if not type_info:
                             continue
-                        cursor = ctx.bot.db[1].ptypes.find({"types": type_info["id"]})
-                        pokemon_ids = [
-                            record["id"] for record in await cursor.to_list(length=None)
-                        ]
-                        cursor = ctx.bot.db[1].forms.find(
-                            {"pokemon_id": {"$in": pokemon_ids}}
-                        )
-                        names.update(
-                            [
-                                record["identifier"].capitalize()
-                                for record in await cursor.to_list(length=None)
-                            ]
-                        )
+                        type_ids.add(type_info["id"])
+                    names = {
+                        name.capitalize()
+                        for name in ctx.bot.catalog.index.forms(types=type_ids)
+                    }
                     # Does NOT expand forms, as forms can have different types
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "egg-group":
-                    names = set()
-                    egg_group_ids = [
-                        result["id"]
-                        for result in await ctx.bot.db[1]
-                        .egg_groups_info.find(
-                            {"identifier": {"$in": [group.lower() for group in data]}}
-                        )
-                        .to_list(length=None)
-                    ]
-                    pokemon_ids = [
-                        result["species_id"]
-                        for result in await ctx.bot.db[1]
-                        .egg_groups.find({"egg_groups": {"$in": egg_group_ids}})
-                        .to_list(length=800)
-                    ]
-                    cursor = ctx.bot.db[1].forms.find(
-                        {"pokemon_id": {"$in": pokemon_ids}}
-                    )
-                    names.update(
-                        [
-                            record["identifier"].capitalize()
-                            for record in await cursor.to_list(length=None)
-                        ]
-                    )
-                    names = await self._expand_forms(ctx, names)
+                    egg_group_ids = set()
+                    for group in data:
+                        egg_group = ctx.bot.catalog.index.egg_group(group.lower())
+                        if not egg_group:
+                            continue
+                        egg_group_ids.add(egg_group["id"])
+                    names = {
+                        name.capitalize()
+                        for name in ctx.bot.catalog.index.forms(egg_groups=egg_group_ids)
+                    }
+                    names = self._expand_forms(names)
                     sql_data.append(list(names))
                     postfix.append(f"pokname = ANY(${len(sql_data)})")
                 elif key == "item":
@@ -379,7 +351,7 @@ class Filter(commands.Cog):
                             "`owned` is only a valid key in market filters."
                         )
                     sql_data.append(ctx.author.id)
-                    postfix.append(f"owner = ${len(sql_data)}")
+                    postfix.append(f"market.owner = ${len(sql_data)}")
                 elif key == "ot":
                     if not data:
                         sql_data.append(ctx.author.id)
@@ -649,20 +621,14 @@ class Filter(commands.Cog):
                         order_dir = "ASC"
                     postfix.append("false")
                 elif key == "id":
-                    order_col = "orderid"
+                    # Market listings are ordered by listing id, pokemon by their number
+                    order_col = "orderid" if filter_type == "m" else "position"
                     if not data:
                         order_dir = "ASC"
                     elif data[0].startswith("d"):
                         order_dir = "DESC"
                     elif data[0].startswith("a"):
                         order_dir = "ASC"
-                    if filter_type != "m":
-                        # Extract out only the pokemon that actually need to get searched
-                        # to reduce O(N^2)'s N from len(pokes) to min(len(pokes), POKE_COUNT)
-                        if order_dir == "ASC":
-                            sql_data[0] = sql_data[0][:POKE_COUNT]
-                        else:
-                            sql_data[0] = list(reversed(sql_data[0][-POKE_COUNT:]))
                     postfix.append("false")
                 elif key == "hidden-power":
                     if not data:
@@ -730,130 +696,136 @@ class Filter(commands.Cog):
             )
         conditions = stack[0]
 
-        # Build the full query based on what type of filter this is
+        # Since order args require a token to place them, they add a hanging false. This removes it in AND cases.
+        conditions = f"true AND {conditions}".replace(" AND false", "").replace("false AND ", "")
+        key = SORT_KEYS.get(order_col)
+        # Without a sort, pokemon are listed in catch order and listings by id
+        descending = order_col is not None and order_dir == "DESC"
+
+        def format_page(records, index):
+            # Prep the results for formatting
+            max_id = 0
+            max_lvl = 0
+            max_name = 0
+            max_price = 0
+            for record in records:
+                name = record["pokname"]
+                if name.capitalize() == "Egg":
+                    name = record["name"]
+                max_name = max(max_name, len(name))
+                if filter_type == "p":
+                    cur_id = str(record["num"])
+                elif filter_type == "m":
+                    cur_id = str(record["orderid"])
+                    cur_price = f"{record['pokeprice']:,.0f}"
+                    max_price = max(max_price, len(cur_price))
+                max_id = max(max_id, len(cur_id))
+                max_lvl = 3
+
+            # Format the returned pokes
+            desc = ""
+            for record in records:
+                nr = record["pokname"].capitalize()
+                is_egg = False
+                if nr == "Egg":
+                    is_egg = True
+                    nr = record["name"].capitalize()
+                formatted_name = nr.ljust(max_name, " ")
+                if filter_type == "p":
+                    pn = record["num"]
+                    price = ""
+                elif filter_type == "m":
+                    pn = record["orderid"]
+                    price = record["pokeprice"]
+                pn = str(pn).rjust(max_id, " ")
+                gid = record["id"]
+                iv = record["ivs"]
+                shiny = record["shiny"]
+                radiant = record["radiant"]
+                level = str(record["pokelevel"]).rjust(max_lvl, " ")
+                level = f"<:stop:1012773630649827451>`{level}`"
+                emoji = get_emoji(
+                    blank="<:blank:942623726715936808>",
+                    shiny=shiny,
+                    radiant=radiant,
+                    skin=record["skin"],
+                )
+                extra_text = ""
+                if filter_type == "m":
+                    price = f"{price:,.0f}".rjust(max_price, " ")
+                    extra_text = f"<:dittocoin:1010679749212901407>`{price})`"
+                elif is_egg:
+                    level = str(record["counter"]).rjust(max_lvl, " ")
+                    level = f"<:egg:844434416200712193>`{level}`"
+                elif gid in mothers:
+                    end = mothers[gid] + timedelta(hours=6)
+                    now = datetime.now()
+                    expires_in = end - now
+                    if now > end:
+                        time = "0s"
+                    elif expires_in.seconds // 3600:
+                        time = str(expires_in.seconds // 3600) + "h"
+                    elif expires_in.seconds // 60:
+                        time = str(expires_in.seconds // 60) + "m"
+                    else:
+                        time = str(expires_in.seconds) + "s"
+                    extra_text = f"\N{STOPWATCH}`{time}`"
+                gender = (
+                    "<:male:1011932024438800464>"
+                    if record["gender"] == "-m"
+                    else "<:female:1011935234067021834>"
+                    if record["gender"] == "-f"
+                    else "<:ditto_genderless:1004767591237169223>"
+                    if record["gender"] == "-x"
+                    else ""
+                )
+                iv = f"{iv/186:02.0%}".rjust(4, " ")
+                desc += (
+                    f"{emoji}{gender}"
+                    f"<:our:1012769128085463170>**`{pn}`** "
+                    f"__`{formatted_name}`__"
+                    f"{level}"
+                    f"<:stealing:1012771006278021141>`{iv}`"
+                    f"{extra_text}\n"
+                )
+            return desc
+
+        # Send the result
+        embed = discord.Embed(title="Filtered Pokemon", color=0xFFB6C1)
         if filter_type == "p":
-            extra = (
-                ", array_position($1, id) as orderid" if order_col == "orderid" else ""
-            )
-            query = (
-                "SELECT COALESCE(atkiv,0) + COALESCE(defiv,0) + COALESCE(spatkiv,0) + COALESCE(spdefiv,0) + COALESCE(speediv,0) + COALESCE(hpiv,0) AS ivs, "
-                "COALESCE(atkev,0) + COALESCE(defev,0) + COALESCE(spatkev,0) + COALESCE(spdefev,0) + COALESCE(speedev,0) + COALESCE(hpev,0) as evs, "
-                f"pokelevel, pokname, name{extra}, * FROM pokes WHERE id = ANY($1) AND {conditions}"
+            pages = OwnedPages(
+                ctx.bot.db[0],
+                sql_data[0],
+                where=conditions,
+                args=sql_data[1:],
+                key=key,
+                descending=descending,
+                format_page=format_page,
+                base_embed=embed,
+                per_page=PER_PAGE,
+                timeout=20,
             )
         elif filter_type == "m":
-            query = (
-                "SELECT COALESCE(atkiv,0) + COALESCE(defiv,0) + COALESCE(spatkiv,0) + COALESCE(spdefiv,0) + COALESCE(speediv,0) + COALESCE(hpiv,0) AS ivs, "
-                "COALESCE(atkev,0) + COALESCE(defev,0) + COALESCE(spatkev,0) + COALESCE(spdefev,0) + COALESCE(speedev,0) + COALESCE(hpev,0) as evs, "
-                "pokelevel, pokname, market.id as orderid, market.price as pokeprice, * "
-                "FROM pokes INNER JOIN market ON pokes.id = market.poke WHERE "
-                f"buyer IS NULL AND {conditions}"
+            pages = KeysetPages(
+                ctx.bot.db[0],
+                table="pokes INNER JOIN market ON pokes.id = market.poke",
+                where=f"buyer IS NULL AND {conditions}",
+                args=sql_data,
+                tiebreak="market.id",
+                key=key,
+                descending=descending,
+                columns=f"{POKE_STATS}, market.id as orderid, market.price as pokeprice, *",
+                format_page=format_page,
+                base_embed=embed,
+                per_page=PER_PAGE,
+                timeout=20,
             )
-        if order_col:
-            query += f" ORDER BY {order_col} {order_dir}"
-        # Since order args require a token to place them, they add a hanging false. This removes it in AND cases.
-        query = query.replace(" AND false", "").replace("false AND ", "")
-
-        # Fetch the pokes that satisfy the filter
-        async with self.bot.db[0].acquire() as pconn:
-            async with pconn.transaction():
-                cur = await pconn.cursor(query, *sql_data)
-                records = await cur.fetch(POKE_COUNT, timeout=20)
-        if not records:
+        await pages.prepare()
+        if not pages.count:
             await ctx.send(
                 "Your filter did not find any pokemon. Try a less narrow search."
             )
             return
-
-        # Prep the results for formatting
-        max_id = 0
-        max_lvl = 0
-        max_name = 0
-        max_price = 0
-        async for record in AsyncIter(records):
-            name = record["pokname"]
-            if name.capitalize() == "Egg":
-                name = record["name"]
-            max_name = max(max_name, len(name))
-            if filter_type == "p":
-                cur_id = str(pokes.index(record["id"]) + 1)
-            elif filter_type == "m":
-                cur_id = str(record["orderid"])
-                cur_price = f"{record['pokeprice']:,.0f}"
-                max_price = max(max_price, len(cur_price))
-            max_id = max(max_id, len(cur_id))
-            max_lvl = 3
-
-        # Format the returned pokes
-        desc = ""
-        async for record in AsyncIter(records):
-            nr = record["pokname"].capitalize()
-            is_egg = False
-            if nr == "Egg":
-                is_egg = True
-                nr = record["name"].capitalize()
-            formatted_name = nr.ljust(max_name, " ")
-            if filter_type == "p":
-                pn = pokes.index(record["id"]) + 1
-                price = ""
-            elif filter_type == "m":
-                pn = record["orderid"]
-                price = record["pokeprice"]
-            pn = str(pn).rjust(max_id, " ")
-            gid = record["id"]
-            nick = record["poknick"]
-            iv = record["ivs"]
-            shiny = record["shiny"]
-            radiant = record["radiant"]
-            level = str(record["pokelevel"]).rjust(max_lvl, " ")
-            level = f"<:stop:1012773630649827451>`{level}`"
-            emoji = get_emoji(
-                blank="<:blank:942623726715936808>",
-                shiny=shiny,
-                radiant=radiant,
-                skin=record["skin"],
-            )
-            extra_text = ""
-            if filter_type == "m":
-                price = f"{price:,.0f}".rjust(max_price, " ")
-                extra_text = f"<:dittocoin:1010679749212901407>`{price})`"
-            elif is_egg:
-                level = str(record["counter"]).rjust(max_lvl, " ")
-                level = f"<:egg:844434416200712193>`{level}`"
-            elif gid in mothers:
-                end = mothers[gid] + timedelta(hours=6)
-                now = datetime.now()
-                expires_in = end - now
-                if now > end:
-                    time = "0s"
-                elif expires_in.seconds // 3600:
-                    time = str(expires_in.seconds // 3600) + "h"
-                elif expires_in.seconds // 60:
-                    time = str(expires_in.seconds // 60) + "m"
-                else:
-                    time = str(expires_in.seconds) + "s"
-                extra_text = f"\N{STOPWATCH}`{time}`"
-            gender = (
-                "<:male:1011932024438800464>"
-                if record["gender"] == "-m"
-                else "<:female:1011935234067021834>"
-                if record["gender"] == "-f"
-                else "<:ditto_genderless:1004767591237169223>"
-                if record["gender"] == "-x"
-                else ""
-            )
-            iv = f"{iv/186:02.0%}".rjust(4, " ")
-            desc += (
-                f"{emoji}{gender}"
-                f"<:our:1012769128085463170>**`{pn}`** "
-                f"__`{formatted_name}`__"
-                f"{level}"
-                f"<:stealing:1012771006278021141>`{iv}`"
-                f"{extra_text}\n"
-            )
-
-        # Send the result
-        embed = discord.Embed(title="Filtered Pokemon", color=0xFFB6C1)
-        pages = pagify(desc, per_page=PER_PAGE, base_embed=embed)
         await MenuView(ctx, pages).start()
     
     @commands.hybrid_command()    
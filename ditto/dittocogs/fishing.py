@@ -192,25 +192,11 @@ class Fishing(commands.Cog):
         async with ctx.bot.db[0].acquire() as pconn:
             await pconn.execute("UPDATE achievements SET fishing_success = fishing_success + 1 WHERE u_id = $1", ctx.author.id)
             if item not in ("common chest", "rare chest"):
-                items = await pconn.fetchval(
-                    "SELECT items::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                items[item] = items.get(item, 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET items = $1::json WHERE u_id = $2",
-                    items,
-                    ctx.author.id,
+                await ctx.bot.inventories.add(
+                    pconn, ctx.author.id, item, column="items"
                 )
             else:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inventory[item] = inventory.get(item, 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                await ctx.bot.inventories.add(pconn, ctx.author.id, item)
             leveled_up = cap < (exp_gain + exp) and level < 100
             if leveled_up:
                 newcap = getcap(level)
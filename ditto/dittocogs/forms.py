@@ -89,7 +89,7 @@ class Forms(commands.Cog):
 
                 return
             num = await pconn.fetchval(
-                "SELECT pokes[$1] FROM users WHERE u_id = $2", val, ctx.author.id
+                "SELECT poke_at($2, $1)", val, ctx.author.id
             )
 
             lunala = await pconn.fetchval(
@@ -123,7 +123,7 @@ class Forms(commands.Cog):
             )
 
             num = await pconn.fetchval(
-                "SELECT pokes[$1] FROM users WHERE u_id = $2", val, ctx.author.id
+                "SELECT poke_at($2, $1)", val, ctx.author.id
             )
 
             details = await pconn.fetchrow(
@@ -185,7 +185,7 @@ class Forms(commands.Cog):
     async def fuse(self, ctx, form, val: int):
         async with ctx.bot.db[0].acquire() as pconn:
             data = await pconn.fetchrow(
-                "SELECT selected, pokes[$2] FROM users WHERE u_id = $1",
+                "SELECT selected, poke_at(u_id, $2) FROM users WHERE u_id = $1",
                 ctx.author.id,
                 val,
             )
@@ -1088,13 +1088,10 @@ class Forms(commands.Cog):
             if pokename is None:
                 await ctx.send("No Pokemon Selected")
                 return
-            order = [t["order"] for t in FORMS if t["identifier"] == pokename.lower()]
-            formnum = order[0]
+            formnum = ctx.bot.catalog.form(pokename.lower())["order"]
             formnum -= 1
-            pokemon = [t["identifier"] for t in FORMS if t["order"] == formnum]
-            megaable = [t["is_mega"] for t in FORMS if t["identifier"] == pokemon[0]]
-            mega = pokemon[0]
-            megaable = megaable[0]
+            mega = ctx.bot.catalog.form_by_order(formnum)["identifier"]
+            megaable = ctx.bot.catalog.form(mega)["is_mega"]
             if megaable == 1:
                 await ctx.send("This Pokemon cannot Mega Devolve!")
                 return
@@ -554,28 +554,29 @@ class GameCorner(commands.Cog):
             reward["coin-case"], luck = await _error(ctx, bet, luck)
 
         # Helper function to give rewards
-        async def give_reward(ctx, items, reward, luck):
+        async def give_reward(ctx, reward, luck):
             async with ctx.bot.db[0].acquire() as pconn:
-                items["coin-case"] += reward["coin-case"]
-                items["coin-case"] = max(items["coin-case"], 0)
-                items["coin-case"] = ceil(items["coin-case"])
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                    items,
-                    ctx.author.id,
-                )
-                await pconn.execute(
-                    "UPDATE users SET energy = energy - 1 WHERE u_id = $1",
-                    ctx.author.id,
-                )
-                await pconn.execute(
-                    "UPDATE users SET luck = $1 WHERE u_id = $2",
-                    floor(luck),
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    inventory = await ctx.bot.inventories.lock(pconn, ctx.author.id)
+                    coins = inventory.get("coin-case", 0)
+                    await ctx.bot.inventories.add(
+                        pconn,
+                        ctx.author.id,
+                        "coin-case",
+                        ceil(max(coins + reward["coin-case"], 0)) - coins,
+                    )
+                    await pconn.execute(
+                        "UPDATE users SET energy = energy - 1 WHERE u_id = $1",
+                        ctx.author.id,
+                    )
+                    await pconn.execute(
+                        "UPDATE users SET luck = $1 WHERE u_id = $2",
+                        floor(luck),
+                        ctx.author.id,
+                    )
 
         if reroll_new == Reroll.OFF:
-            await give_reward(ctx, items, reward, luck)
+            await give_reward(ctx, reward, luck)
             if energy <= 1:
                 await ctx.send(
                     "You have used up all of your energy!\nYou will get an energy bar every 20 Minutes or you can also upvote DittoBOT if you haven't done it yet to get an energy bar"
@@ -602,7 +603,7 @@ class GameCorner(commands.Cog):
                             reroll_luck=luck,
                         ),
                         give_reward(
-                            ctx, items, reward, luck
+                            ctx, reward, luck
                         ),  # Give them the reward on timeout
                         ctx.author.id,
                     ),
@@ -623,7 +624,7 @@ class GameCorner(commands.Cog):
                             reroll_luck=luck,
                         ),
                         give_reward(
-                            ctx, items, reward, luck
+                            ctx, reward, luck
                         ),  # Give them the reward on timeout
                         ctx.author.id,
                     ),
@@ -712,11 +713,8 @@ class GameCorner(commands.Cog):
                 f"Your winnings before hitting Jackpot - {winnings}\nTotal winnings after hitting Jackpot {jackpot_winnings}!!!"
             )
             async with ctx.bot.db[0].acquire() as pconn:
-                items["coin-case"] += jackpot_winnings
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json WHERE u_id = $2",
-                    items,
-                    ctx.author.id,
+                await ctx.bot.inventories.add(
+                    pconn, ctx.author.id, "coin-case", jackpot_winnings
                 )
                 await pconn.execute(
                     "UPDATE users SET energy = energy - 1 WHERE u_id = $1",
@@ -730,11 +728,8 @@ class GameCorner(commands.Cog):
             await ctx.send("Congratulations!\nYou hit two rows!")
             await ctx.send(f"Your Total winnings! {winnings}")
             async with ctx.bot.db[0].acquire() as pconn:
-                items["coin-case"] += winnings
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json wHERE u_id = $2",
-                    items,
-                    ctx.author.id,
+                await ctx.bot.inventories.add(
+                    pconn, ctx.author.id, "coin-case", winnings
                 )
                 await pconn.execute(
                     "UPDATE users SET energy = energy - 1 WHERE u_id = $1",
@@ -745,12 +740,14 @@ class GameCorner(commands.Cog):
                 )
         else:
             async with ctx.bot.db[0].acquire() as pconn:
-                items["coin-case"] -= bet
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json wHERE u_id = $2",
-                    items,
-                    ctx.author.id,
-                )
+                if (
+                    await ctx.bot.inventories.take(
+                        pconn, ctx.author.id, "coin-case", bet
+                    )
+                    is None
+                ):
+                    await ctx.send("You don't have enough coins")
+                    return
                 await pconn.execute(
                     "UPDATE users SET energy = energy - 1 WHERE u_id = $1",
                     ctx.author.id,
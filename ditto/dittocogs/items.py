@@ -13,6 +13,19 @@ class Items(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    @staticmethod
+    async def _use_item(ctx, pconn, item_name):
+        """Takes one `item_name` from the author's items. Returns False, telling them, if they have none left."""
+        if (
+            await ctx.bot.inventories.take(
+                pconn, ctx.author.id, item_name, column="items"
+            )
+            is None
+        ):
+            await ctx.send(f"You do not have any {item_name}!")
+            return False
+        return True
+
     @staticmethod
     async def prep_item_remove(ctx):
         """Handles ensuring a user can unequip an item. Returns None if they cannot, (held_item, pokname, items) if they can."""
@@ -57,11 +70,8 @@ class Items(commands.Cog):
             return
         held_item, name, items = data
         async with ctx.bot.db[0].acquire() as pconn:
-            items[held_item] = items.get(held_item, 0) + 1
-            await pconn.execute(
-                "UPDATE users SET items = $1::json WHERE u_id = $2",
-                items,
-                ctx.author.id,
+            await ctx.bot.inventories.add(
+                pconn, ctx.author.id, held_item, column="items"
             )
             await pconn.execute(
                 "UPDATE pokes SET hitem = 'None' WHERE id = (SELECT selected FROM users WHERE u_id = $1)",
@@ -93,7 +103,6 @@ class Items(commands.Cog):
         if dets.get(item_name, 0) == 0:
             await ctx.send(f"You do not have any {item_name}!")
             return
-        dets[item_name] = dets[item_name] - 1
         async with ctx.bot.db[0].acquire() as pconn:
             _id = await pconn.fetchval(
                 "SELECT selected FROM users WHERE u_id = $1", ctx.author.id
@@ -133,39 +142,39 @@ class Items(commands.Cog):
                     new_index = ab_ids.index(new_ab)
                 except IndexError:
                     new_index = 0
-                await pconn.execute(
-                    "UPDATE pokes SET ability_index = $1 WHERE id = $2", new_index, _id
-                )
+                async with pconn.transaction():
+                    if not await self._use_item(ctx, pconn, item_name):
+                        return
+                    await pconn.execute(
+                        "UPDATE pokes SET ability_index = $1 WHERE id = $2",
+                        new_index,
+                        _id,
+                    )
                 ab_id = ab_ids[new_index]
                 new_ability = await ctx.bot.db[1].abilities.find_one({"id": ab_id})
 
-                await pconn.execute(
-                    "UPDATE users SET items = $1::json WHERE u_id = $2",
-                    dets,
-                    ctx.author.id,
-                )
                 await ctx.send(
                     f"You have Successfully changed your Pokémons ability to {new_ability['identifier']}"
                 )
                 return
             if item_name == "daycare-space":
-                await pconn.execute(
-                    "UPDATE users SET items = $1::json, daycarelimit = daycarelimit + 1 WHERE u_id = $2",
-                    dets,
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    if not await self._use_item(ctx, pconn, item_name):
+                        return
+                    await pconn.execute(
+                        "UPDATE users SET daycarelimit = daycarelimit + 1 WHERE u_id = $1",
+                        ctx.author.id,
+                    )
                 await ctx.send("You have successfully equipped an Extra Daycare Space!")
                 return
             if item_name == "ev-reset":
-                await pconn.execute(
-                    "UPDATE users SET items = $1::json WHERE u_id = $2",
-                    dets,
-                    ctx.author.id,
-                )
-                await pconn.execute(
-                    "UPDATE pokes SET hpev = 0, atkev = 0, defev = 0, spatkev = 0, spdefev = 0, speedev = 0 WHERE id = $1",
-                    _id,
-                )
+                async with pconn.transaction():
+                    if not await self._use_item(ctx, pconn, item_name):
+                        return
+                    await pconn.execute(
+                        "UPDATE pokes SET hpev = 0, atkev = 0, defev = 0, spatkev = 0, spdefev = 0, speedev = 0 WHERE id = $1",
+                        _id,
+                    )
                 await ctx.send(
                     "You have successfully reset the Effort Values (EVs) of your selected Pokemon!"
                 )
@@ -177,56 +186,57 @@ class Items(commands.Cog):
                 return
             if item_name in {"zinc", "hp-up", "protein", "calcium", "iron", "carbos"}:
                 try:
-                    if item_name == "calcium":
-                        await pconn.execute(
-                            "UPDATE pokes SET spatkev = spatkev + 10 WHERE id = $1", _id
-                        )
-                    elif item_name == "carbos":
-                        await pconn.execute(
-                            "UPDATE pokes SET speedev = speedev + 10 WHERE id = $1", _id
-                        )
-                    elif item_name == "hp-up":
-                        await pconn.execute(
-                            "UPDATE pokes SET hpev = hpev + 10 WHERE id = $1", _id
-                        )
-                    elif item_name == "iron":
-                        await pconn.execute(
-                            "UPDATE pokes SET defev = defev + 10 WHERE id = $1", _id
-                        )
-                    elif item_name == "protein":
-                        await pconn.execute(
-                            "UPDATE pokes SET atkev = atkev + 10 WHERE id = $1", _id
-                        )
-                    elif item_name == "zinc":
-                        await pconn.execute(
-                            "UPDATE pokes SET spdefev = spdefev + 10 WHERE id = $1", _id
-                        )
-                    await pconn.execute(
-                        "UPDATE users SET items = $1::json WHERE u_id = $2",
-                        dets,
-                        ctx.author.id,
-                    )
+                    # Rolled back, item and all, if the EVs are maxed
+                    async with pconn.transaction():
+                        if not await self._use_item(ctx, pconn, item_name):
+                            return
+                        if item_name == "calcium":
+                            await pconn.execute(
+                                "UPDATE pokes SET spatkev = spatkev + 10 WHERE id = $1", _id
+                            )
+                        elif item_name == "carbos":
+                            await pconn.execute(
+                                "UPDATE pokes SET speedev = speedev + 10 WHERE id = $1", _id
+                            )
+                        elif item_name == "hp-up":
+                            await pconn.execute(
+                                "UPDATE pokes SET hpev = hpev + 10 WHERE id = $1", _id
+                            )
+                        elif item_name == "iron":
+                            await pconn.execute(
+                                "UPDATE pokes SET defev = defev + 10 WHERE id = $1", _id
+                            )
+                        elif item_name == "protein":
+                            await pconn.execute(
+                                "UPDATE pokes SET atkev = atkev + 10 WHERE id = $1", _id
+                            )
+                        elif item_name == "zinc":
+                            await pconn.execute(
+                                "UPDATE pokes SET spdefev = spdefev + 10 WHERE id = $1", _id
+                            )
                 except:
                     await ctx.send("Your Pokemon has maxed all 510 EVs")
                     return
                 await ctx.send(f"You have successfully used your {item_name}")
                 return
             if item_name.endswith("-rod"):
-                await pconn.execute(
-                    "UPDATE users SET items = $1::json, held_item = $3 WHERE u_id = $2",
-                    dets,
-                    ctx.author.id,
-                    item_name,
-                )
+                async with pconn.transaction():
+                    if not await self._use_item(ctx, pconn, item_name):
+                        return
+                    await pconn.execute(
+                        "UPDATE users SET held_item = $2 WHERE u_id = $1",
+                        ctx.author.id,
+                        item_name,
+                    )
                 await ctx.send(f"You have successfully equiped your {item_name}")
                 return
             name = await pconn.fetchval("SELECT pokname FROM pokes WHERE id = $1", _id)
-            await pconn.execute(
-                "UPDATE pokes set hitem = $2 WHERE id = $1", _id, item_name
-            )
-            await pconn.execute(
-                "UPDATE users SET items = $1::json WHERE u_id = $2", dets, ctx.author.id
-            )
+            async with pconn.transaction():
+                if not await self._use_item(ctx, pconn, item_name):
+                    return
+                await pconn.execute(
+                    "UPDATE pokes set hitem = $2 WHERE id = $1", _id, item_name
+                )
             await ctx.send(
                 f"You have successfully given your selected Pokemon a {item_name}"
             )
@@ -259,7 +269,7 @@ class Items(commands.Cog):
         held_item, name, items = data
         async with ctx.bot.db[0].acquire() as pconn:
             poke = await pconn.fetchval(
-                "SELECT pokes[$1] FROM users WHERE u_id = $2",
+                "SELECT poke_at($2, $1)",
                 pokemon_number,
                 ctx.author.id,
             )
@@ -306,12 +316,13 @@ class Items(commands.Cog):
         if dets.get(item_name, 0) == 0:
             await ctx.send(f"You do not have any {item_name}!")
             return
-        dets[item_name] = dets[item_name] - 1
         async with ctx.bot.db[0].acquire() as pconn:
             _id = await pconn.fetchval(
                 "SELECT selected FROM users WHERE u_id = $1", ctx.author.id
             )
             poke = await pconn.fetchrow("SELECT * FROM pokes WHERE id = $1", _id)
+            if poke is not None and not await self._use_item(ctx, pconn, item_name):
+                return
         if poke is None:
             await ctx.send(
                 "You do not have a pokemon selected! Select one with `/select` first."
@@ -325,12 +336,12 @@ class Items(commands.Cog):
             active_item=item_name,
         )
         if evo_result is False or not evo_result.used_active_item():
+            async with ctx.bot.db[0].acquire() as pconn:
+                await ctx.bot.inventories.add(
+                    pconn, ctx.author.id, item_name, column="items"
+                )
             await ctx.send(f"The {item_name} had no effect!")
             return
-        async with ctx.bot.db[0].acquire() as pconn:
-            await pconn.execute(
-                "UPDATE users SET items = $1::json WHERE u_id = $2", dets, ctx.author.id
-            )
         await ctx.send(f"Your {item_name} was consumed!")
 
     @commands.hybrid_group(name="buy")
@@ -370,12 +381,12 @@ class Items(commands.Cog):
                 if item in inventory:
                     await ctx.send("You already have a Coin Case!")
                     return
-                inventory["coin-case"] = 0
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json, mewcoins = mewcoins - 1000 WHERE u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    await ctx.bot.inventories.add(pconn, ctx.author.id, "coin-case", 0)
+                    await pconn.execute(
+                        "UPDATE users SET mewcoins = mewcoins - 1000 WHERE u_id = $1",
+                        ctx.author.id,
+                    )
                 await ctx.send("You have successfully purchased a Coin Case!")
                 return
             if item == "market-space":
@@ -412,16 +423,15 @@ class Items(commands.Cog):
                 await ctx.send(f"You have successfully bought the {item}!")
                 return
             if item in activeItemList:
-                dets = await pconn.fetchval(
-                    "SELECT items::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                dets[item] = dets.get(item, 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins - $1, items = $2::json WHERE u_id = $3",
-                    price,
-                    dets,
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    await ctx.bot.inventories.add(
+                        pconn, ctx.author.id, item, column="items"
+                    )
+                    await pconn.execute(
+                        "UPDATE users SET mewcoins = mewcoins - $1 WHERE u_id = $2",
+                        price,
+                        ctx.author.id,
+                    )
                 await ctx.send(
                     f"You have successfully bought a {item}! Use it with `/apply {item}`."
                 )
@@ -558,13 +568,15 @@ class Items(commands.Cog):
                 await ctx.send(f"You do not have {total} Credits ({amount} Coins)!")
                 return
             if "coin-case" in items:
-                items["coin-case"] += amount
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins - $1, inventory = $2::json WHERE u_id = $3",
-                    amount / 2,
-                    items,
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    await ctx.bot.inventories.add(
+                        pconn, ctx.author.id, "coin-case", amount
+                    )
+                    await pconn.execute(
+                        "UPDATE users SET mewcoins = mewcoins - $1 WHERE u_id = $2",
+                        amount / 2,
+                        ctx.author.id,
+                    )
                 await ctx.send(
                     f"You have Successfully purchased {amount} Coins ({total} Credits)"
                 )
@@ -827,16 +839,7 @@ class Items(commands.Cog):
                 )
             else:
                 return
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            item = f"{ct} chest"
-            inventory[item] = inventory.get(item, 0) + 1
-            await pconn.execute(
-                "UPDATE users SET inventory = $1::json where u_id = $2",
-                inventory,
-                ctx.author.id,
-            )
+            await ctx.bot.inventories.add(pconn, ctx.author.id, f"{ct} chest")
         await ctx.send(
             f"You have successfully bought a {ct} chest for {price} {cor}!\n"
             f"You can open it with `/open {ct}`."
@@ -974,13 +977,22 @@ class Items(commands.Cog):
                 await ctx.send(f"You do not have {amount} Coins in your coin case!")
                 return
             if "coin-case" in items:
-                items["coin-case"] -= amount
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins + $1, inventory = $2::json WHERE u_id = $3",
-                    amount / 2,
-                    items,
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    if (
+                        await ctx.bot.inventories.take(
+                            pconn, ctx.author.id, "coin-case", amount
+                        )
+                        is None
+                    ):
+                        await ctx.send(
+                            f"You do not have {amount} Coins in your coin case!"
+                        )
+                        return
+                    await pconn.execute(
+                        "UPDATE users SET mewcoins = mewcoins + $1 WHERE u_id = $2",
+                        amount / 2,
+                        ctx.author.id,
+                    )
                 await ctx.send(
                     f"You have Successfully Cashed out {amount} Coins ({total} Credits)"
                 )
@@ -1,50 +1,107 @@
 import os
 import random
+import time
 from pathlib import Path
 
 import discord
 import ujson
 
+from dittocore.snapshot import load_snapshot
+
 RESOURCES = Path(os.environ["DIRECTORY"]) / "shared" / "data"
+# Built by the launcher, falls back to parsing the JSON when missing or stale.
+SNAPSHOT = load_snapshot(RESOURCES)
+
+
+def load_data(name):
+    """Returns the contents of a JSON file in shared/data, read from the snapshot if possible."""
+    if SNAPSHOT is not None:
+        return SNAPSHOT[name]
+    with open(RESOURCES / name) as f:
+        return ujson.load(f)
+
+
+# Every Dataset, by file name
+DATASETS = {}
+
+
+class Dataset:
+    """
+    A JSON file in shared/data that is only loaded the first time it is used.
+
+    Behaves like the list or dict it wraps, so it can be star imported and used
+    exactly like the eagerly loaded data it replaces.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.load_time = None
+        self._data = None
+        DATASETS[name] = self
+
+    @property
+    def loaded(self):
+        return self.load_time is not None
+
+    @property
+    def data(self):
+        if self._data is None:
+            start = time.perf_counter()
+            self._data = load_data(self.name)
+            self.load_time = time.perf_counter() - start
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, item):
+        return item in self.data
+
+    def __getattr__(self, name):
+        # Anything else, like dict.get or dict.items, goes to the loaded data.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.data, name)
+
+    def __repr__(self):
+        return f"<Dataset {self.name} loaded={self.loaded}>"
+
+
+def preload_datasets():
+    """Loads every dataset that has not been used yet."""
+    for dataset in list(DATASETS.values()):
+        dataset.data
+
+
+def loaded_datasets():
+    return {name for name, dataset in DATASETS.items() if dataset.loaded}
+
 
-REDEEM_DROPS = ujson.load(open(RESOURCES / "redeem_drops.json"))
-
-with open(RESOURCES / "pokemons.json") as f:
-    PMONS = ujson.load(f)
-with open(RESOURCES / "battle_items.json") as f:
-    BATTLE_ITEMS = ujson.load(f)
-with open(RESOURCES / "shop.json") as f:
-    SHOP = ujson.load(f)
-with open(RESOURCES / "pokemonfile.json") as f:
-    PFILE = ujson.load(f)
-with open(RESOURCES / "evofile.json") as f:
-    EVOFILE = ujson.load(f)
-with open(RESOURCES / "forms.json") as f:
-    FORMS = ujson.load(f)
-with open(RESOURCES / "statfile") as f:
-    STATS = ujson.load(f)
-with open(RESOURCES / "types.json") as f:
-    TYPES = ujson.load(f)
-with open(RESOURCES / "ptypes.json") as f:
-    PTYPES = ujson.load(f)
-with open(RESOURCES / "items.json") as f:
-    ITEMS = ujson.load(f)
-with open(RESOURCES / "moves.json") as f:
-    MOVES = ujson.load(f)
-with open(RESOURCES / "pokemon_abilities.json") as f:
-    POKE_ABILITIES = ujson.load(f)
-with open(RESOURCES / "abilities.json") as f:
-    ABILITIES = ujson.load(f)
-with open(RESOURCES / "region_starters.json") as f:
-    REGION_STARTERS = ujson.load(f)
-with open(RESOURCES / "pokemon_moves.json") as f:
-    PMOVES = ujson.load(f)
-with open(RESOURCES / "natures.json") as f:
-    NATURES = ujson.load(f)
-with open(RESOURCES / "stat_types.json") as f:
-    STAT_TYPES = ujson.load(f)
-with open(RESOURCES / "npc_images.json") as f:
-    NPCS = ujson.load(f)
+REDEEM_DROPS = Dataset("redeem_drops.json")
+PMONS = Dataset("pokemons.json")
+BATTLE_ITEMS = Dataset("battle_items.json")
+SHOP = Dataset("shop.json")
+PFILE = Dataset("pokemonfile.json")
+EVOFILE = Dataset("evofile.json")
+FORMS = Dataset("forms.json")
+STATS = Dataset("statfile")
+TYPES = Dataset("types.json")
+PTYPES = Dataset("ptypes.json")
+ITEMS = Dataset("items.json")
+MOVES = Dataset("moves.json")
+POKE_ABILITIES = Dataset("pokemon_abilities.json")
+ABILITIES = Dataset("abilities.json")
+REGION_STARTERS = Dataset("region_starters.json")
+PMOVES = Dataset("pokemon_moves.json")
+NATURES = Dataset("natures.json")
+STAT_TYPES = Dataset("stat_types.json")
+NPCS = Dataset("npc_images.json")
 
 PKIDS = PFILE
 T_IDS = PTYPES
@@ -1,7 +1,6 @@
 import contextlib
 from collections import defaultdict
 
-import aiohttp
 import discord
 from discord.ext import commands
 
@@ -26,6 +25,8 @@ ELEMENTS = {
     "fairy": 0xF6C9E3,
 }
 
+DAMAGE_CLASSES = {1: "Status", 2: "Physical", 3: "Special"}
+
 
 class AbilityView(discord.ui.View):
     def __init__(self, ctx, base_embed, poke_embed):
@@ -71,49 +72,39 @@ class Lookup(commands.Cog):
     async def move(self, ctx, move: str):
         move = move.lower().replace(" ", "-")
 
-        # Validate the move exists, to make the API happy and to prevent injections
-        exists = await ctx.bot.db[1].moves.find_one({"identifier": move})
-        if exists is None:
+        data = ctx.bot.catalog.move(move)
+        if data is None:
             await ctx.send("That move does not exist!")
             return
-
-        # Call the API to fetch the data for the move
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://pokeapi.co/api/v2/move/{move}"
-            ) as response:
-                if response.status != 200:
-                    await ctx.send("That move does not exist!")
-                    return
-                data = await response.json()
+        entry = ctx.bot.encyclopedia.move(move)
+        if entry is None:
+            await ctx.bot.encyclopedia.fetch_missing(moves=[move])
+            entry = ctx.bot.encyclopedia.move(move) or {}
 
         # Build the embed
         prio = data["priority"]
         pp = data["pp"]
-        type = data["type"]["name"].title()
+        type_info = ctx.bot.catalog.index.type_by_id(data["type_id"])
+        type = type_info["identifier"] if type_info else "???"
         acc = data["accuracy"]
         power = data["power"]
-        dclass = data["damage_class"]["name"].title()
+        dclass = DAMAGE_CLASSES.get(data["damage_class_id"], "???")
         desc = ""
         desc += f"**Damage Class:** `{dclass}` "
         if power:
             desc += f"| **Power:** `{power}`"
         desc += f"\n**Accuracy:** `{acc}` "
-        desc += f"| **Type:** `{type}` "
+        desc += f"| **Type:** `{type.title()}` "
         desc += f"| **PP:** `{pp}` "
         if prio:
             desc += f"\n**Priority:** `{prio}`"
 
         embed = discord.Embed(
             title=move.title().replace("-", " "),
-            color=ELEMENTS.get(data["type"]["name"], 0x000001),
+            color=ELEMENTS.get(type, 0x000001),
             description=desc,
         )
-        effects = "".join(
-            "- " + effect["short_effect"] + "\n"
-            for effect in data["effect_entries"]
-            if effect["language"]["name"] == "en"
-        )
+        effects = "".join("- " + effect + "\n" for effect in entry.get("effects", []))
 
         if data["effect_chance"]:
             effects = effects.replace("$effect_chance", str(data["effect_chance"]))
@@ -126,21 +117,14 @@ class Lookup(commands.Cog):
     async def ability(self, ctx, ability: str):
         ability = ability.lower().replace(" ", "-")
 
-        # Validate the ability exists, to make the API happy and to prevent injections
-        exists = await ctx.bot.db[1].abilities.find_one({"identifier": ability})
-        if exists is None:
+        data = ctx.bot.catalog.ability(ability)
+        if data is None:
             await ctx.send("That ability does not exist!")
             return
-
-        # Call the API to fetch the data for the ability
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://pokeapi.co/api/v2/ability/{ability}"
-            ) as response:
-                if response.status != 200:
-                    await ctx.send("That ability does not exist!")
-                    return
-                data = await response.json()
+        entry = ctx.bot.encyclopedia.ability(ability)
+        if entry is None:
+            await ctx.bot.encyclopedia.fetch_missing(abilities=[ability])
+            entry = ctx.bot.encyclopedia.ability(ability) or {}
 
         # Build the base embed
         desc = ""
@@ -149,23 +133,23 @@ class Lookup(commands.Cog):
             color=0xF699CD,
             description=desc,
         )
-        effects = "".join(
-            "- " + effect["short_effect"] + "\n"
-            for effect in data["effect_entries"]
-            if effect["language"]["name"] == "en"
-        )
+        effects = "".join("- " + effect + "\n" for effect in entry.get("effects", []))
 
         if not effects:
-            for effect in data["flavor_text_entries"]:
-                if effect["language"]["name"] == "en":
-                    effects += effect["flavor_text"] + "\n"
+            for effect in entry.get("flavor_text", []):
+                effects += effect + "\n"
         if effects:
             embed.add_field(name="Effect", value=effects, inline=False)
 
-        # Build the embed of pokemon
-        desc = "".join(
-            pokemon["pokemon"]["name"].title() + "\n" for pokemon in data["pokemon"]
-        )
+        # Build the embed of pokemon, falling back to the shipped pokemon_abilities
+        pokemon = entry.get("pokemon")
+        if pokemon is None:
+            pokemon = []
+            for pokemon_id in ctx.bot.catalog.pokemon_with_ability(data["id"]):
+                forms = ctx.bot.catalog.forms_of(pokemon_id)
+                if forms:
+                    pokemon.append(forms[0]["identifier"])
+        desc = "".join(name.title() + "\n" for name in pokemon)
 
         poke_embed = discord.Embed(
             title="Pokemon with " + ability.title().replace("-", " "),
@@ -197,12 +181,6 @@ class Lookup(commands.Cog):
             17: "Dark",
             18: "Fairy",
         }
-        type_effectiveness = {}
-        for te in await ctx.bot.db[1].type_effectiveness.find({}).to_list(None):
-            if te["damage_type_id"] in type_ids and te["target_type_id"] in type_ids:
-                type_effectiveness[
-                    (type_ids[te["damage_type_id"]], type_ids[te["target_type_id"]])
-                ] = (te["damage_factor"] / 100)
         type1 = type1.title()
         types = [type1]
         if type2:
@@ -213,18 +191,19 @@ class Lookup(commands.Cog):
                 await ctx.send(f"{t} is not a valid type.")
                 return
 
+        ids = {name: type_id for type_id, name in type_ids.items()}
+        chart = ctx.bot.catalog.type_chart
+
+        # Both charts are single vectorized lookups, ordered by type id like type_ids
         atk_effs = defaultdict(list)
         if not type2:
-            for d in type_ids.values():
-                eff = 1
-                eff *= type_effectiveness[(type1, d)]
+            effs = chart.attacking(ids[type1])[: len(type_ids)].tolist()
+            for d, eff in zip(type_ids.values(), effs):
                 atk_effs[eff].append(d)
 
         def_effs = defaultdict(list)
-        for a in type_ids.values():
-            eff = 1
-            for d in types:
-                eff *= type_effectiveness[(a, d)]
+        effs = chart.defending([ids[t] for t in types])[: len(type_ids)].tolist()
+        for a, eff in zip(type_ids.values(), effs):
             def_effs[eff].append(a)
 
         desc = ""
@@ -56,7 +56,7 @@ class Market(commands.Cog):
             return
         async with ctx.bot.db[0].acquire() as pconn:
             data = await pconn.fetchrow(
-                "SELECT pokes[$1], marketlimit, mewcoins, tradelock FROM users WHERE u_id = $2",
+                "SELECT poke_at(u_id, $1), marketlimit, mewcoins, tradelock FROM users WHERE u_id = $2",
                 poke,
                 ctx.author.id,
             )
@@ -169,10 +169,7 @@ class Market(commands.Cog):
         )
         try:
             async with ctx.bot.db[0].acquire() as pconn:
-                details = await pconn.fetchrow(
-                    "SELECT poke, owner, price, buyer FROM market WHERE id = $1",
-                    listing_id,
-                )
+                details = await ctx.bot.queries.market_listing(pconn, listing_id)
                 if not details:
                     await ctx.send("That listing does not exist.")
                     await self.bot.redis_manager.redis.execute(
@@ -242,18 +239,14 @@ class Market(commands.Cog):
                     listing_id,
                 )
                 await pconn.execute(
-                    "UPDATE users SET pokes = array_append(pokes, $1), mewcoins = mewcoins - $2 WHERE u_id = $3",
+                    "UPDATE pokes SET owner = $2, position = DEFAULT WHERE id = $1",
                     poke,
-                    price,
                     ctx.author.id,
                 )
+                await ctx.bot.queries.add_credits(pconn, ctx.author.id, -price)
                 deposit = int(price * DEPOSIT_RATE)
                 gain = price + deposit
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins + $1 WHERE u_id = $2",
-                    gain,
-                    owner,
-                )
+                await ctx.bot.queries.add_credits(pconn, owner, gain)
                 await pconn.execute("UPDATE achievements SET market_purchased = market_purchased + 1 WHERE u_id = $1", ctx.author.id)
                 await pconn.execute("UPDATE achievements SET market_sold = market_sold + 1 WHERE u_id = $1", owner)
             with contextlib.suppress(discord.HTTPException):
@@ -315,7 +308,7 @@ class Market(commands.Cog):
                 "UPDATE market SET buyer = $1 WHERE id = $2", 0, listing_id
             )
             await pconn.execute(
-                "UPDATE users SET pokes = array_append(pokes, $1) WHERE u_id = $2",
+                "UPDATE pokes SET owner = $2, position = DEFAULT WHERE id = $1",
                 poke,
                 ctx.author.id,
             )
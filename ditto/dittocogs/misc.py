@@ -103,25 +103,13 @@ class Misc(commands.Cog):
         if time.time() < self.user_cache[message.author.id]:
             return
         self.user_cache[message.author.id] = time.time() + 5
+        self.bot.activity.add(message)
+
+    @commands.Cog.listener()
+    async def on_message_activity(
+        self, message, hatched_party_pokemon, hatched_pokemon, level_pokemon
+    ):
         async with self.bot.db[0].acquire() as pconn:
-            try:
-                if (
-                    await pconn.fetchval(
-                        "SELECT true FROM users WHERE u_id = $1", message.author.id
-                    )
-                    is None
-                ):
-                    return
-                (
-                    hatched_party_pokemon,
-                    hatched_pokemon,
-                    level_pokemon,
-                ) = await pconn.fetchrow(
-                    "SELECT party_counter($1), selected_counter($1), level_pokemon($1)",
-                    message.author.id,
-                )
-            except Exception:
-                return
             response = ""
             if hatched_party_pokemon:
                 for egg_name in hatched_party_pokemon:
@@ -140,16 +128,8 @@ class Misc(commands.Cog):
                     response += f"Congratulations!\nYour {egg_name} Egg has hatched!\n"
                     chest_chance = not random.randint(0, 200)
                     if chest_chance:
-                        inventory = await pconn.fetchval(
-                            "SELECT inventory::json FROM users WHERE u_id = $1",
-                            message.author.id,
-                        )
-                        item = "common chest"
-                        inventory[item] = inventory.get(item, 0) + 1
-                        await pconn.execute(
-                            "UPDATE users SET inventory = $1::json where u_id = $2",
-                            inventory,
-                            message.author.id,
+                        await self.bot.inventories.add(
+                            pconn, message.author.id, "common chest"
                         )
                         response += "It was holding a common chest!\n"
             if hatched_pokemon:
@@ -170,27 +150,16 @@ class Misc(commands.Cog):
                 )
                 chest_chance = not random.randint(0, 200)
                 if chest_chance:
-                    inventory = await pconn.fetchval(
-                        "SELECT inventory::json FROM users WHERE u_id = $1",
-                        message.author.id,
-                    )
-                    item = "common chest"
-                    inventory[item] = inventory.get(item, 0) + 1
-                    await pconn.execute(
-                        "UPDATE users SET inventory = $1::json where u_id = $2",
-                        inventory,
-                        message.author.id,
+                    await self.bot.inventories.add(
+                        pconn, message.author.id, "common chest"
                     )
                     response += "It was holding a common chest!\n"
             if level_pokemon:
-                pokemon_details = await pconn.fetchrow(
-                    "SELECT users.silenced, pokes.* FROM users INNER JOIN pokes on pokes.id = (SELECT selected FROM users WHERE u_id = $1) AND users.u_id = $1",
-                    message.author.id,
+                pokemon_details = await self.bot.queries.selected_details(
+                    pconn, message.author.id
                 )
                 silenced = pokemon_details.get("silenced")
-                guild_details = await self.bot.db[1].guilds.find_one(
-                    {"id": message.guild.id}
-                )
+                guild_details = await self.bot.guild_settings.get(message.guild.id)
                 if guild_details:
                     silenced = silenced or guild_details["silence_levels"]
                 if not silenced:
@@ -218,6 +187,7 @@ class Misc(commands.Cog):
         guild_data = GUILD_DEFAULT.copy()
         guild_data["id"] = guild.id
         await self.bot.db[1].guilds.insert_one(guild_data)
+        await self.bot.guild_settings.publish_invalidate(guild.id)
         owner = await self.bot.fetch_user(guild.owner_id)
         guild_name = guild.name
         owner_id = owner.id
@@ -249,6 +219,7 @@ class Misc(commands.Cog):
     async def on_guild_remove(self, guild):
         if self.bot.user.id == 1000125868938633297:
             await self.bot.db[1].guilds.delete_one({"id": guild.id})
+            await self.bot.guild_settings.publish_invalidate(guild.id)
 
     @commands.hybrid_command()
     async def donate(self, ctx):
@@ -290,8 +261,6 @@ class Misc(commands.Cog):
                 1004571779886501969,
                 f"{ctx.author.name} - {ctx.author.id} used {ctx.command.name} command\nArguments - {ctx.args}\n{ctx.kwargs}",
             )
-        if ctx.command.cog_name == "Settings":
-            await self.bot.load_guild_settings()
 
     @commands.Cog.listener()
     async def on_command_error(self, ctx, error):
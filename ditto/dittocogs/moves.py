@@ -6,109 +6,8 @@ from pokemon_utils.utils import evolve
 from dittocogs.json_files import *
 
 
-async def get_moves(ctx, pokemon_name):
-    if pokemon_name == "smeargle":
-        # Moves which are not coded in the bot
-        uncoded_ids = [
-            266,
-            270,
-            476,
-            495,
-            502,
-            511,
-            597,
-            602,
-            603,
-            607,
-            622,
-            623,
-            624,
-            625,
-            626,
-            627,
-            628,
-            629,
-            630,
-            631,
-            632,
-            633,
-            634,
-            635,
-            636,
-            637,
-            638,
-            639,
-            640,
-            641,
-            642,
-            643,
-            644,
-            645,
-            646,
-            647,
-            648,
-            649,
-            650,
-            651,
-            652,
-            653,
-            654,
-            655,
-            656,
-            657,
-            658,
-            671,
-            695,
-            696,
-            697,
-            698,
-            699,
-            700,
-            701,
-            702,
-            703,
-            719,
-            723,
-            724,
-            725,
-            726,
-            727,
-            728,
-            811,
-            10001,
-            10002,
-            10003,
-            10004,
-            10005,
-            10006,
-            10007,
-            10008,
-            10009,
-            10010,
-            10011,
-            10012,
-            10013,
-            10014,
-            10015,
-            10016,
-            10017,
-            10018,
-        ]
-        all_moves = (
-            await ctx.bot.db[1]
-            .moves.find(
-                {
-                    "id": {"$nin": uncoded_ids},
-                }
-            )
-            .to_list(None)
-        )
-        return [t["identifier"] for t in all_moves]
-    moves = await ctx.bot.db[1].pokemon_moves.find_one({"pokemon": pokemon_name})
-    if moves is None:
-        return None
-    moves = moves["moves"]
-    return sorted(set(moves))
+def get_moves(ctx, pokemon_name):
+    return ctx.bot.catalog.learnsets.moves(pokemon_name)
 
 
 class Moves(commands.Cog):
@@ -129,14 +28,14 @@ class Moves(commands.Cog):
                 await ctx.send("You do not have that Pokemon!")
                 return
             poke = dets["pokname"]
-            moves = await get_moves(ctx, poke.lower())
+            moves = get_moves(ctx, poke.lower())
             if moves is None:
                 await ctx.send(
                     "That pokemon cannot learn any moves! You might need to `/deform` it first."
                 )
                 ctx.bot.logger.warning(f"Could not get moves for {poke}")
                 return
-            if move not in moves:
+            if not ctx.bot.catalog.learnsets.can_learn(poke.lower(), move):
                 await ctx.send(f"Your {poke} can not learn that Move")
                 return
             await pconn.execute(
@@ -204,7 +103,7 @@ class Moves(commands.Cog):
         if pokename == "egg":
             await ctx.send("There are no available moves for an Egg")
             return
-        moves = await get_moves(ctx, pokename)
+        moves = get_moves(ctx, pokename)
         if moves is None:
             await ctx.send(
                 "That pokemon cannot learn any moves! You might need to `/deform` it first."
@@ -213,15 +112,11 @@ class Moves(commands.Cog):
             return
         len(moves)
         desc = ""
-        for move in moves:
-            move = move.capitalize().replace("'", "")
+        for identifier in moves:
+            move = identifier.capitalize().replace("'", "")
             if ctx.author == ctx.bot.owner:
                 print(move)
-            move_info = await ctx.bot.db[1].moves.find_one({"identifier": move.lower()})
-            if not move_info:
-                move_info = await ctx.bot.db[1].moves.find_one(
-                    {"identifier": move.lower().rsplit("-", 1)[0]}
-                )
+            move_info = ctx.bot.catalog.learnsets.move_info(identifier)
             if move_info is None:
                 await ctx.send("An error occurred finding moves for that pokemon.")
                 ctx.bot.logger.warn(f"A move is not in mongo moves - {move}")
@@ -236,9 +131,7 @@ class Moves(commands.Cog):
                 damage_class = "<:phys1:1013111228803059754><:phys2:1013111230937960479>"
             elif damage_class == 3:
                 damage_class = "<:special1:1013111240966557706><:special2:1013111242547802183> "
-            type = [t["identifier"] for t in TYPES if t["id"] == type_id][
-                0
-            ].capitalize()
+            type = ctx.bot.catalog.index.type_by_id(type_id)["identifier"].capitalize()
             desc += f"**{damage_class} {move.replace('-', ' ')}** - Power:`{power}` Acc:`{accuracy}` Type:`{type}`\n"
         embed = discord.Embed(
             title="Learnable Move List", colour=random.choice(ctx.bot.colors)
@@ -30,7 +30,7 @@ class Party(commands.Cog):
                     t_name = "None"
                 else:
                     num = await pconn.fetchval(
-                        "SELECT array_position(pokes, $1) FROM users WHERE u_id = $2",
+                        "SELECT poke_number($2, $1)",
                         _id,
                         ctx.author.id,
                     )
@@ -57,7 +57,7 @@ class Party(commands.Cog):
                 return
             if poke is not None:
                 _id = await pconn.fetchval(
-                    "SELECT pokes[$1] FROM users WHERE u_id = $2", poke, ctx.author.id
+                    "SELECT poke_at($2, $1)", poke, ctx.author.id
                 )
             else:
                 _id = await pconn.fetchval(
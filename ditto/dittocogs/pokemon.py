@@ -14,6 +14,7 @@ from utils.misc import (
 )
 from pokemon_utils.utils import get_pokemon_info, get_pokemon_qinfo
 
+from dittocore.listing import USER_ORDERS, OwnedPages
 from dittocogs.json_files import *
 from dittocogs.pokemon_list import *
 
@@ -97,14 +98,13 @@ class Pokemon(commands.Cog):
     async def _build_pokedex(self, ctx, include_owned: bool):
         """Helper func to build & send the pokedex."""
         async with self.bot.db[0].acquire() as pconn:
-            pokes = await pconn.fetchval(
-                "SELECT pokes FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if pokes is None:
+            if not await pconn.fetchval(
+                "SELECT EXISTS(SELECT 1 FROM users WHERE u_id = $1)", ctx.author.id
+            ):
                 return
             owned = await pconn.fetch(
-                "SELECT DISTINCT pokname FROM pokes WHERE id = ANY($1) AND pokname != ANY($2)",
-                pokes,
+                "SELECT DISTINCT pokname FROM pokes WHERE owner = $1 AND pokname != ANY($2)",
+                ctx.author.id,
                 custom_poke,
             )
         allpokes = self.bot.db[1].pfile.find(
@@ -143,7 +143,7 @@ class Pokemon(commands.Cog):
         async with self.bot.db[0].acquire() as pconn:
             if poke_id in {"newest", "new", "latest"}:
                 _id = await pconn.fetchval(
-                    "SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1",
+                    "SELECT newest_poke($1)",
                     ctx.author.id,
                 )
             else:
@@ -156,7 +156,7 @@ class Pokemon(commands.Cog):
                     await ctx.send("You do not have that many pokemon!")
                     return
                 _id = await pconn.fetchval(
-                    "SELECT pokes[$1] FROM users WHERE u_id = $2", poke_id, ctx.author.id
+                    "SELECT poke_at($2, $1)", poke_id, ctx.author.id
                 )
             if _id is None:
                 await ctx.send("You have not started or that Pokemon does not exist!")
@@ -178,7 +178,7 @@ class Pokemon(commands.Cog):
         if pokemon.lower() in ("new", "latest"):
             async with self.bot.db[0].acquire() as pconn:
                 poke = await pconn.fetchval(
-                    "SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1 AND array_length(pokes, 1) > 1",
+                    "SELECT newest_poke($1) WHERE poke_at($1, 2) IS NOT NULL",
                     ctx.author.id,
                 )
                 if poke is None:
@@ -188,7 +188,7 @@ class Pokemon(commands.Cog):
         else:
             async with self.bot.db[0].acquire() as pconn:
                 stmt = await pconn.prepare(
-                    "SELECT pokes[$1] FROM users WHERE u_id = $2"
+                    "SELECT poke_at($2, $1)"
                 )
                 for p in pokemon.split():
                     try:
@@ -259,51 +259,43 @@ class Pokemon(commands.Cog):
     @commands.hybrid_command()
     async def p(self, ctx):
         async with ctx.bot.db[0].acquire() as pconn:
-            pokes = await pconn.fetchval(
-                "SELECT pokes FROM users WHERE u_id = $1", ctx.author.id
+            user = await pconn.fetchrow(
+                "SELECT user_order FROM users WHERE u_id = $1", ctx.author.id
             )
-            if pokes is None:
+            if user is None:
                 await ctx.send(f"You have not Started!\nStart with `/start` first!")
                 return
-            user_order = await pconn.fetchval(
-                "SELECT user_order FROM users WHERE u_id = $1", ctx.author.id
-            )
-
-        orders = {
-            "iv": "ORDER by ivs DESC",
-            "level": "ORDER by pokelevel DESC",
-            "ev": "ORDER by evs DESC",
-            "name": "order by pokname DESC",
-            "kek": "",
-        }
-        order = orders.get(user_order)
-        query = f"""SELECT *, COALESCE(atkiv,0) + COALESCE(defiv,0) + COALESCE(spatkiv,0) + COALESCE(spdefiv,0) + COALESCE(speediv,0) + COALESCE(hpiv,0) AS ivs, COALESCE(atkev,0) + COALESCE(defev,0) + COALESCE(spatkev,0) + COALESCE(spdefev,0) + COALESCE(speedev,0) + COALESCE(hpev,0) AS evs FROM pokes WHERE id = ANY ($1) {order}"""
+            user_order = user["user_order"]
 
-        async with self.bot.db[0].acquire() as pconn:
-            async with pconn.transaction():
-                cur = await pconn.cursor(query, pokes)
-                records = await cur.fetch(15 * 250)
-
-        desc = ""
-        async for record in AsyncIter(records):
-            nr = record["pokname"]
-            pn = pokes.index(record["id"]) + 1
-            record["poknick"]
-            iv = record["ivs"]
-            shiny = record["shiny"]
-            radiant = record["radiant"]
-            level = record["pokelevel"]
-            emoji = get_emoji(
-                blank="<:blank:942623726715936808>",
-                shiny=shiny,
-                radiant=radiant,
-                skin=record["skin"],
-            )
-            gender = ctx.bot.misc.get_gender_emote(record["gender"])
-            desc += f"{emoji}{gender}**{nr.capitalize()}** | **__No.__** - {pn} | **Level** {level} | **IV%** {iv/186:.2%}\n"
+        def format_page(records, index):
+            desc = ""
+            for record in records:
+                nr = record["pokname"]
+                pn = record["num"]
+                iv = record["ivs"]
+                shiny = record["shiny"]
+                radiant = record["radiant"]
+                level = record["pokelevel"]
+                emoji = get_emoji(
+                    blank="<:blank:942623726715936808>",
+                    shiny=shiny,
+                    radiant=radiant,
+                    skin=record["skin"],
+                )
+                gender = ctx.bot.misc.get_gender_emote(record["gender"])
+                desc += f"{emoji}{gender}**{nr.capitalize()}** | **__No.__** - {pn} | **Level** {level} | **IV%** {iv/186:.2%}\n"
+            return desc
 
+        key, descending = USER_ORDERS.get(user_order, USER_ORDERS["kek"])
         embed = discord.Embed(title="Your Pokemon", color=0xFFB6C1)
-        pages = pagify(desc, base_embed=embed)
+        pages = OwnedPages(
+            ctx.bot.db[0],
+            ctx.author.id,
+            key=key,
+            descending=descending,
+            format_page=format_page,
+            base_embed=embed,
+        )
         await MenuView(ctx, pages).start()
 
     @commands.hybrid_group(name="tags")
@@ -316,7 +308,7 @@ class Pokemon(commands.Cog):
         async with self.bot.db[0].acquire() as pconn:
             if poke.lower() in {"new", "latest"}:
                 gid = await pconn.fetchval(
-                    "SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1 AND array_length(pokes, 1) > 1",
+                    "SELECT newest_poke($1) WHERE poke_at($1, 2) IS NOT NULL",
                     ctx.author.id,
                 )
             else:
@@ -326,7 +318,7 @@ class Pokemon(commands.Cog):
                     await ctx.send("You need to provide a valid pokemon number.")
                     return
                 gid = await pconn.fetchval(
-                    "SELECT pokes[$1] FROM users WHERE u_id = $2", poke, ctx.author.id
+                    "SELECT poke_at($2, $1)", poke, ctx.author.id
                 )
             if gid is None:
                 await ctx.send("That pokemon does not exist!")
@@ -358,7 +350,7 @@ class Pokemon(commands.Cog):
             for poke in pokes:
                 if poke.lower() in ("new", "latest"):
                     gid = await pconn.fetchval(
-                        "SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1 AND array_length(pokes, 1) > 1",
+                        "SELECT newest_poke($1) WHERE poke_at($1, 2) IS NOT NULL",
                         ctx.author.id,
                     )
                 else:
@@ -368,7 +360,7 @@ class Pokemon(commands.Cog):
                         failed.append(str(poke))
                         continue
                     gid = await pconn.fetchval(
-                        "SELECT pokes[$1] FROM users WHERE u_id = $2",
+                        "SELECT poke_at($2, $1)",
                         poke,
                         ctx.author.id,
                     )
@@ -411,7 +403,7 @@ class Pokemon(commands.Cog):
             for poke in pokes:
                 if poke.lower() in ("new", "latest"):
                     gid = await pconn.fetchval(
-                        "SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1 AND array_length(pokes, 1) > 1",
+                        "SELECT newest_poke($1) WHERE poke_at($1, 2) IS NOT NULL",
                         ctx.author.id,
                     )
                 else:
@@ -421,7 +413,7 @@ class Pokemon(commands.Cog):
                         not_exist.append(str(poke))
                         continue
                     gid = await pconn.fetchval(
-                        "SELECT pokes[$1] FROM users WHERE u_id = $2",
+                        "SELECT poke_at($2, $1)",
                         poke,
                         ctx.author.id,
                     )
@@ -543,7 +535,7 @@ class Pokemon(commands.Cog):
         if pokemon in {"newest", "latest", "atest", "ewest", "new"}:
             async with ctx.bot.db[0].acquire() as pconn:
                 records = await pconn.fetchrow(
-                    "SELECT * FROM pokes WHERE id = (SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1)",
+                    "SELECT * FROM pokes WHERE id = newest_poke($1)",
                     ctx.author.id,
                 )
             if records is None:
@@ -565,7 +557,7 @@ class Pokemon(commands.Cog):
                 return
             async with ctx.bot.db[0].acquire() as pconn:
                 records = await pconn.fetchrow(
-                    "SELECT * FROM pokes WHERE id = (SELECT pokes[$1] FROM users WHERE u_id = $2)",
+                    "SELECT * FROM pokes WHERE id = poke_at($2, $1)",
                     pokemon,
                     ctx.author.id,
                 )
@@ -772,7 +764,7 @@ class Pokemon(commands.Cog):
         if pokemon in {"newest", "latest", "atest", "ewest", "new"}:
             async with ctx.bot.db[0].acquire() as pconn:
                 records = await pconn.fetchrow(
-                    "SELECT * FROM pokes WHERE id = (SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1)",
+                    "SELECT * FROM pokes WHERE id = newest_poke($1)",
                     ctx.author.id,
                 )
             await ctx.send(embed=await get_pokemon_qinfo(ctx, records))
@@ -788,7 +780,7 @@ class Pokemon(commands.Cog):
                 return
             async with ctx.bot.db[0].acquire() as pconn:
                 records = await pconn.fetchrow(
-                    "SELECT * FROM pokes WHERE id = (SELECT pokes[$1] FROM users WHERE u_id = $2)",
+                    "SELECT * FROM pokes WHERE id = poke_at($2, $1)",
                     pokemon,
                     ctx.author.id,
                 )
@@ -908,7 +900,7 @@ class Pokemon(commands.Cog):
         if pokemon in {"newest", "latest", "atest", "ewest", "new"}:
             async with ctx.bot.db[0].acquire() as pconn:
                 records = await pconn.fetchrow(
-                    "SELECT * FROM pokes WHERE id = (SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1)",
+                    "SELECT * FROM pokes WHERE id = newest_poke($1)",
                     ctx.author.id,
                 )
             await ctx.send(embed=await get_pokemon_qinfo(ctx, records))
@@ -924,7 +916,7 @@ class Pokemon(commands.Cog):
                 return
             async with ctx.bot.db[0].acquire() as pconn:
                 records = await pconn.fetchrow(
-                    "SELECT * FROM pokes WHERE id = (SELECT pokes[$1] FROM users WHERE u_id = $2)",
+                    "SELECT * FROM pokes WHERE id = poke_at($2, $1)",
                     pokemon,
                     ctx.author.id,
                 )
@@ -3,8 +3,6 @@ import re
 
 import discord
 
-from dittocogs.json_files import FORMS
-
 # NATURES, BERRIES, & ITEMS, NOT POKEMON ---------------------------------------------
 natlist = [
     "Lonely",
@@ -1680,21 +1678,13 @@ async def tr(text: str, variables):
         for word in text.split():
             if word.capitalize() in totalList:
                 if is_formed(word):
-                    id = [
-                        i["pokemon_id"]
-                        for i in FORMS
-                        if i["identifier"] == word.split("-")[0].lower()
-                    ][0]
+                    id = ctx.bot.catalog.form(word.split("-")[0].lower())["pokemon_id"]
                     text = (
                         text.replace(word, ctx.bot.pokemon_names.get(language)[id - 1])
                         + word.split("-")[1:]
                     )
                 else:
-                    id = [
-                        i["pokemon_id"]
-                        for i in FORMS
-                        if i["identifier"] == word.lower()
-                    ][0]
+                    id = ctx.bot.catalog.form(word.lower())["pokemon_id"]
                     text = text.replace(
                         word, ctx.bot.pokemon_names.get(language)[id - 1]
                     )
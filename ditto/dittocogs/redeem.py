@@ -400,53 +400,46 @@ class Redeem(commands.Cog):
             pack.pop("price", None)
             pack.pop("daycare-limit", None)
             async with ctx.bot.db[0].acquire() as pconn:
-                current_inv = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                current_items = await pconn.fetchval(
-                    "SELECT items::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-            # current_inv.pop('coin-case', None) if 'coin-case' in current_inv else None
-            extra_creds = 0
-            for item in pack:
                 try:
-                    if item.endswith("-z"):
-                        current_items[item] = current_items.get(item, 0) + 1
-                        async with ctx.bot.db[0].acquire() as pconn:
-                            await pconn.execute(
-                                "UPDATE users SET items = $1::json where u_id = $2",
-                                current_items,
-                                ctx.author.id,
-                            )
-                    elif item == "bike":
-                        async with ctx.bot.db[0].acquire() as pconn:
-                            await pconn.execute(
-                                "UPDATE users SET bike = $2 where u_id = $1",
-                                ctx.author.id,
-                                True,
-                            )
-                    else:
-                        extra = max(
-                            0,
-                            (current_inv.get(item, 0) + pack[item])
-                            - (multiplier_max.get(item, 9999999999999999999999999)),
+                    async with pconn.transaction():
+                        current_inv = await ctx.bot.inventories.lock(pconn, ctx.author.id)
+                        # current_inv.pop('coin-case', None) if 'coin-case' in current_inv else None
+                        extra_creds = 0
+                        inv_deltas = {}
+                        item_deltas = {}
+                        for item in pack:
+                            try:
+                                if item.endswith("-z"):
+                                    item_deltas[item] = 1
+                                elif item == "bike":
+                                    await pconn.execute(
+                                        "UPDATE users SET bike = $2 where u_id = $1",
+                                        ctx.author.id,
+                                        True,
+                                    )
+                                else:
+                                    extra = max(
+                                        0,
+                                        (current_inv.get(item, 0) + pack[item])
+                                        - (multiplier_max.get(item, 9999999999999999999999999)),
+                                    )
+                                    extra_creds += extra * self.CREDITS_PER_MULTI
+                                    inv_deltas[item] = min(
+                                        current_inv.get(item, 0) + pack[item],
+                                        multiplier_max.get(item, 9999999999999999999999999),
+                                    ) - current_inv.get(item, 0)
+                            except:
+                                continue
+                        await ctx.bot.inventories.apply(pconn, ctx.author.id, inv_deltas)
+                        await ctx.bot.inventories.apply(
+                            pconn, ctx.author.id, item_deltas, column="items"
                         )
-                        extra_creds += extra * self.CREDITS_PER_MULTI
-                        current_inv[item] = min(
-                            current_inv.get(item, 0) + pack[item],
-                            multiplier_max.get(item, 9999999999999999999999999),
+                        await pconn.execute(
+                            "UPDATE users SET daycarelimit = daycarelimit + $2, mewcoins = mewcoins + $3 WHERE u_id = $1",
+                            ctx.author.id,
+                            daycarelimit,
+                            extra_creds,
                         )
-                except:
-                    continue
-            async with ctx.bot.db[0].acquire() as pconn:
-                try:
-                    await pconn.execute(
-                        "UPDATE users SET inventory = $1::json, daycarelimit = daycarelimit + $3, mewcoins = mewcoins + $4 WHERE u_id = $2",
-                        current_inv,
-                        ctx.author.id,
-                        daycarelimit,
-                        extra_creds,
-                    )
                 except Exception as e:
                     raise e
                     # await ctx.send(
@@ -491,16 +484,13 @@ class Redeem(commands.Cog):
                 await ctx.send("50,000 Has been credited to your balance!")
         elif val == "honey":
             async with ctx.bot.db[0].acquire() as pconn:
-                inv = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inv["honey"] = inv.get("honey", 0) + 1
                 try:
-                    await pconn.execute(
-                        "UPDATE users SET inventory = $1::json, redeems = redeems - 5 WHERE u_id = $2",
-                        inv,
-                        ctx.author.id,
-                    )
+                    async with pconn.transaction():
+                        await pconn.execute(
+                            "UPDATE users SET redeems = redeems - 5 WHERE u_id = $1",
+                            ctx.author.id,
+                        )
+                        await ctx.bot.inventories.add(pconn, ctx.author.id, "honey")
                     await pconn.execute("UPDATE achievements SET redeems_used = redeems_used + 5 WHERE u_id = $1", ctx.author.id)
                 except:
                     await ctx.send("You do not have enough redeems")
@@ -522,16 +512,13 @@ class Redeem(commands.Cog):
                 )
         elif val.lower().endswith("capsules") or val.lower().endswith("capsule"):
             async with ctx.bot.db[0].acquire() as pconn:
-                inv = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-                inv["nature-capsules"] = inv.get("nature-capsules", 0) + 5
                 try:
-                    await pconn.execute(
-                        "UPDATE users SET redeems = redeems - 1, inventory = $1::json WHERE u_id = $2",
-                        inv,
-                        ctx.author.id,
-                    )
+                    async with pconn.transaction():
+                        await pconn.execute(
+                            "UPDATE users SET redeems = redeems - 1 WHERE u_id = $1",
+                            ctx.author.id,
+                        )
+                        await ctx.bot.inventories.add(pconn, ctx.author.id, "nature-capsules", 5)
                     await pconn.execute("UPDATE achievements SET redeems_used = redeems_used + 1 WHERE u_id = $1", ctx.author.id)
                 except:
                     await ctx.send("You do not have enough redeems")
@@ -541,8 +528,8 @@ class Redeem(commands.Cog):
             pokemon = val.capitalize().replace(" ", "-")
             threshold = 4000
             async with ctx.bot.db[0].acquire() as pconn:
-                inventory, items, redeems = await pconn.fetchrow(
-                    "SELECT inventory::json, items::json, redeems FROM users WHERE u_id = $1",
+                inventory, redeems = await pconn.fetchrow(
+                    "SELECT inventory::json, redeems FROM users WHERE u_id = $1",
                     ctx.author.id,
                 )
 
@@ -562,13 +549,13 @@ class Redeem(commands.Cog):
                     and pokemon.lower() in REDEEM_DROPS
                 ):
                     item = REDEEM_DROPS[pokemon.lower()]
-                    items[item] = items.get(item, 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET redeems = redeems - 1, items = $1::json, inventory = $2::json WHERE u_id = $3",
-                    items,
-                    inventory,
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    await pconn.execute(
+                        "UPDATE users SET redeems = redeems - 1 WHERE u_id = $1",
+                        ctx.author.id,
+                    )
+                    if item:
+                        await ctx.bot.inventories.add(pconn, ctx.author.id, item, column="items")
                 await pconn.execute("UPDATE achievements SET redeems_used = redeems_used + 1 WHERE u_id = $1", ctx.author.id)
             pokedata = await ctx.bot.commondb.create_poke(
                 ctx.bot, ctx.author.id, pokemon, shiny=shiny
@@ -635,13 +622,13 @@ class Redeem(commands.Cog):
         threshold = 4000
         async with ctx.bot.db[0].acquire() as pconn:
             details = await pconn.fetchrow(
-                "SELECT inventory::json, items::json, redeems FROM users WHERE u_id = $1",
+                "SELECT inventory::json, redeems FROM users WHERE u_id = $1",
                 ctx.author.id,
             )
         if details is None:
             await ctx.send("You have not started!\nStart with `/start` first.")
             return
-        inventory, items, redeems = details
+        inventory, redeems = details
         threshold = round(threshold - threshold * (inventory["shiny-multiplier"] / 100))   
         if redeems < amount:
             await ctx.send("You do not have enough redeems")
@@ -655,6 +642,7 @@ class Redeem(commands.Cog):
             )
             await ctx.send(f"Redeeming {amount} {pokemon}...")
             iters = 0
+            drops = {}
             for i in range(amount):
                 item = None
                 shiny = not random.randrange(threshold)
@@ -663,18 +651,18 @@ class Redeem(commands.Cog):
                 )
                 if not random.randrange(30) and pokemon.lower() in REDEEM_DROPS:
                     item = REDEEM_DROPS[pokemon.lower()]
-                    items[item] = items.get(item, 0) + 1
+                    drops[item] = drops.get(item, 0) + 1
                 iters += 1
                 if item:
                     await ctx.send(f"Dropped - {iters}x {item}")
             async with ctx.bot.db[0].acquire() as pconn:
-                await pconn.execute(
-                    "UPDATE users SET redeems = redeems - $1, items = $2::json, inventory = $3::json WHERE u_id = $4",
-                    amount,
-                    items,
-                    inventory,
-                    ctx.author.id,
-                )
+                async with pconn.transaction():
+                    await pconn.execute(
+                        "UPDATE users SET redeems = redeems - $1 WHERE u_id = $2",
+                        amount,
+                        ctx.author.id,
+                    )
+                    await ctx.bot.inventories.apply(pconn, ctx.author.id, drops, column="items")
                 await pconn.execute("UPDATE achievements SET redeems_used = redeems_used + $2 WHERE u_id = $1", ctx.author.id, amount)
                 #await ctx.bot.get_partial_messageable(1004755418511310878).send(
                 #   f"``User:`` {ctx.author} | ``ID:`` {ctx.author.id}\nHas redeemed a {pokedata.emoji}{pokemon} (`{pokedata.id}`) with redeem-multiple command.\n----------------------------------"
@@ -734,6 +722,7 @@ class Redeem(commands.Cog):
                         ctx.author.id,
                     )
 
+                chests = {"mythic chest": 1}
                 if patreon_status in (
                     "Crystal Patreon",
                     "Elite Patreon",
@@ -741,29 +730,8 @@ class Redeem(commands.Cog):
                     "Silver Patreon",
                     "MewBot Patreon",
                 ):
-                    inventory = await pconn.fetchval(
-                        "SELECT inventory::json FROM users WHERE u_id = $1",
-                        ctx.author.id,
-                    )
-
-                    inventory["legend chest"] = inventory.get("legend chest", 0) + 1
-                    await pconn.execute(
-                        "UPDATE users SET inventory = $1::json where u_id = $2",
-                        inventory,
-                        ctx.author.id,
-                    )
-
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1", ctx.author.id
-                )
-
-                inventory["mythic chest"] = inventory.get("mythic chest", 0) + 1
-
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    ctx.author.id,
-                )
+                    chests["legend chest"] = 1
+                await ctx.bot.inventories.apply(pconn, ctx.author.id, chests)
 
                 await pconn.execute(
                     "UPDATE users SET redeems = redeems + 100 WHERE u_id = $1",
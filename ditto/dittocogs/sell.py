@@ -53,29 +53,19 @@ class Sell(commands.Cog):
 
         shop_price = item["price"]
 
-        # Pull their current bag and process sell
+        # Take the items and pay for them together, the take fails if they no longer have enough
+        credits_gained = round((shop_price * 0.65) * amount_sold)
         async with ctx.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT items::json FROM users WHERE u_id = $1", ctx.author.id
-            )
-            if inventory is None:
-                await ctx.send("You have not started!\nStart with `/start` first!")
-                return
-
-            # Check if they even have it
-            if inventory.get(item_name, 0) < amount_sold:
-                await ctx.send(f"You don't have enough `{item_name}`s!")
-                return
-
-            inventory[item_name] -= amount_sold
-            credits_gained = round((shop_price * 0.65) * amount_sold)
-
-            await pconn.execute(
-                "UPDATE users SET items = $1::json, mewcoins = mewcoins + $2 WHERE u_id = $3",
-                inventory,
-                credits_gained,
-                ctx.author.id,
-            )
+            async with pconn.transaction():
+                if await ctx.bot.inventories.take(
+                    pconn, ctx.author.id, item_name, amount_sold, column="items"
+                ) is None:
+                    if not await ctx.bot.queries.has_started(pconn, ctx.author.id):
+                        await ctx.send("You have not started!\nStart with `/start` first!")
+                    else:
+                        await ctx.send(f"You don't have enough `{item_name}`s!")
+                    return
+                await ctx.bot.queries.add_credits(pconn, ctx.author.id, credits_gained)
         await ctx.send(
             f"You have successfully sold `{amount_sold}x {item_name}` for {credits_gained:,} credits!"
         )
@@ -87,7 +77,7 @@ class Sell(commands.Cog):
         async with ctx.bot.db[0].acquire() as pconn:
             if egg_num in {"newest", "new", "latest"}:
                 egg_id = await pconn.fetchval(
-                    "SELECT pokes[array_upper(pokes, 1)] FROM users WHERE u_id = $1",
+                    "SELECT newest_poke($1)",
                     ctx.author.id,
                 )
             else:
@@ -101,7 +91,7 @@ class Sell(commands.Cog):
                     return
                 # Check for num entered
                 egg_id = await pconn.fetchval(
-                    "SELECT pokes[$1] FROM users WHERE u_id = $2",
+                    "SELECT poke_at($2, $1)",
                     egg_num,
                     ctx.author.id,
                 )
@@ -46,7 +46,6 @@ class Settings(commands.Cog):
             return
         await ctx.bot.mongo_update("guilds", {"id": ctx.guild.id}, {"prefix": val})
         await ctx.send(f"Prefix has been set to {val}")
-        await ctx.bot.load_guild_settings()
 
     @commands.hybrid_group(name="auto")
     async def auto_cmds(self, ctx):
@@ -216,7 +215,7 @@ class Settings(commands.Cog):
             )
             return
 
-        guild = await self.bot.mongo_find("guilds", {"id": ctx.guild.id})
+        guild = await self.bot.guild_settings.get(ctx.guild.id)
 
         if not guild:
             await ctx.send(
@@ -3,6 +3,7 @@ import random
 import time
 
 import discord
+import numpy as np
 from discord.ext import commands
 from utils.checks import tradelock
 from utils.misc import (
@@ -91,7 +92,7 @@ class Skins(commands.Cog):
         """Apply a skin to a pokemon."""
         async with ctx.bot.db[0].acquire() as pconn:
             data = await pconn.fetchrow(
-                "SELECT skins::json, pokes[$1] FROM users WHERE u_id = $2",
+                "SELECT skins::json, poke_at(u_id, $1) FROM users WHERE u_id = $2",
                 poke,
                 ctx.author.id,
             )
@@ -132,7 +133,7 @@ class Skins(commands.Cog):
                 return
 
             data = await pconn.fetchrow(
-                "SELECT skins::json, pokes[$1] FROM users WHERE u_id = $2",
+                "SELECT skins::json, poke_at(u_id, $1) FROM users WHERE u_id = $2",
                 poke,
                 ctx.author.id,
             )
@@ -361,12 +362,7 @@ class Skins(commands.Cog):
             return
         if random.randrange(15):
             return
-        async with self.bot.db[0].acquire() as pconn:
-            honey = await pconn.fetchval(
-                "SELECT type FROM honey WHERE channel = $1 LIMIT 1",
-                channel.id,
-            )
-        if honey is None:
+        if self.bot.honey.get(channel.id) is None:
             return
         await asyncio.sleep(random.randint(30, 90))
         skin = random.choice(list(BUYABLE_SKINS.keys()))
@@ -419,7 +415,7 @@ class RaidSpawn(discord.ui.View):
         pokeurl = "https://skylarr1227.github.io/images/" + await get_battle_file_name(
             self.poke, self.bot, skin=self.skin
         )
-        guild = await self.bot.mongo_find("guilds", {"id": self.channel.guild.id})
+        guild = await self.bot.guild_settings.get(self.channel.guild.id)
         if guild is None:
             small_images = False
         else:
@@ -452,58 +448,26 @@ class RaidSpawn(discord.ui.View):
             return
 
         # Calculate valid moves of each effectiveness tier
-        form_info = await self.bot.db[1].forms.find_one(
-            {"identifier": self.poke.lower()}
-        )
-        type_ids = (
-            await self.bot.db[1].ptypes.find_one({"id": form_info["pokemon_id"]})
-        )["types"]
-        type_effectiveness = {}
-        for te in await self.bot.db[1].type_effectiveness.find({}).to_list(None):
-            type_effectiveness[(te["damage_type_id"], te["target_type_id"])] = te[
-                "damage_factor"
-            ]
-        super_types = []
-        normal_types = []
-        un_types = []
-        for attacker_type in range(1, 19):
-            effectiveness = 1
-            for defender_type in type_ids:
-                effectiveness *= (
-                    type_effectiveness[(attacker_type, defender_type)] / 100
-                )
-            if effectiveness > 1:
-                super_types.append(attacker_type)
-            elif effectiveness < 1:
-                un_types.append(attacker_type)
-            else:
-                normal_types.append(attacker_type)
-        super_raw = (
-            await self.bot.db[1]
-            .moves.find(
-                {"type_id": {"$in": super_types}, "damage_class_id": {"$ne": 1}}
-            )
-            .to_list(None)
-        )
+        form_info = self.bot.catalog.form(self.poke.lower())
+        type_ids = self.bot.catalog.ptypes(form_info["pokemon_id"])["types"]
+        # Effectiveness of every attacking type except TYPELESS, index i is type id i + 1
+        effectiveness = self.bot.catalog.type_chart.defending(type_ids)[:18]
+        super_types = (np.flatnonzero(effectiveness > 1) + 1).tolist()
+        normal_types = (np.flatnonzero(effectiveness == 1) + 1).tolist()
+        un_types = (np.flatnonzero(effectiveness < 1) + 1).tolist()
+        learnsets = self.bot.catalog.learnsets
         super_moves = [
-            x["identifier"].capitalize().replace("-", " ") for x in super_raw
+            x["identifier"].capitalize().replace("-", " ")
+            for x in learnsets.damaging_moves(super_types)
         ]
-        normal_raw = (
-            await self.bot.db[1]
-            .moves.find(
-                {"type_id": {"$in": normal_types}, "damage_class_id": {"$ne": 1}}
-            )
-            .to_list(None)
-        )
         normal_moves = [
-            x["identifier"].capitalize().replace("-", " ") for x in normal_raw
+            x["identifier"].capitalize().replace("-", " ")
+            for x in learnsets.damaging_moves(normal_types)
+        ]
+        un_moves = [
+            x["identifier"].capitalize().replace("-", " ")
+            for x in learnsets.damaging_moves(un_types)
         ]
-        un_raw = (
-            await self.bot.db[1]
-            .moves.find({"type_id": {"$in": un_types}, "damage_class_id": {"$ne": 1}})
-            .to_list(None)
-        )
-        un_moves = [x["identifier"].capitalize().replace("-", " ") for x in un_raw]
 
         # Add the moves to the view
         moves = []
@@ -1,19 +1,77 @@
 import asyncio
 import contextlib
+import functools
+import os
 import random
-import time
-from collections import defaultdict
 
 import discord
 from discord.ext import commands
-from utils.misc import get_file_name
 
+from dittocore.sampler import (
+    COMMON,
+    LEGENDARY,
+    PSEUDO,
+    STARTER,
+    ULTRA_BEAST,
+    SpawnSampler,
+    one_in,
+)
+from dittocore.spawns import SpawnAdmission, SpawnEmbeds
 from dittocogs.fishing import is_key
 from dittocogs.json_files import *
 from dittocogs.json_files import make_embed
 from dittocogs.pokemon_list import *
 
 
+@functools.cache
+def drop_pools():
+    """Returns the (cheap, expensive) shop items a catch can drop."""
+    cheaps = [t["item"] for t in SHOP if t["price"] <= 8000 and not is_key(t["item"])]
+    expensives = [
+        t["item"]
+        for t in SHOP
+        if t["price"] in range(8000, 20000) and not is_key(t["item"])
+    ]
+    return cheaps, expensives
+
+
+def roll_drops(premium):
+    """Rolls the item, chest and credits dropped by a catch, returns (item, chest, credits)."""
+    berry = None
+    berry_chance = max(1, int(random.random() * 350))
+    expensive_chance = max(1, int(random.random() * 25))
+    if berry_chance in range(1, 8):
+        cheaps, expensives = drop_pools()
+        if berry_chance == 1:
+            berry = random.choice(cheaps)
+        elif berry_chance == expensive_chance:
+            berry = random.choice(expensives)
+        else:
+            berry = random.choice(list(berryList))
+    chest = "common chest" if not random.randint(0, 200) else None
+    credits = random.randint(100, 250) if premium else 0
+    return berry, chest, credits
+
+
+def catch_names(pokemon):
+    """Returns the names `pokemon` can be caught by, its own and the variations in naming."""
+    names = [pokemon]
+    if pokemon == "mr-mime":
+        names.append("mr.-mime")
+    elif pokemon == "mime-jr":
+        names.append("mime-jr.")
+    elif pokemon.endswith("-alola"):
+        names.append(f"alola-{pokemon[:-6]}")
+        names.append(f"alolan-{pokemon[:-6]}")
+    elif pokemon.endswith("-galar"):
+        names.append(f"galar-{pokemon[:-6]}")
+        names.append(f"galarian-{pokemon[:-6]}")
+    elif pokemon.endswith("-hisui"):
+        names.append(f"hisui-{pokemon[:-6]}")
+        names.append(f"hisuian-{pokemon[:-6]}")
+    return names
+
+
 def despawn_embed(e, status):
     e.title = "Despawned!" if status == "despawn" else "Caught!"
     # e.set_image(url=e.image.url)
@@ -27,8 +85,7 @@ class SpawnView(discord.ui.View):
         delspawn: bool,
         pinspawn: bool,
         spawn_channel: discord.TextChannel,
-        legendchance: int,
-        ubchance: int,
+        rare: bool,
         shiny: bool,
     ):
         self.modal = SpawnModal(
@@ -36,8 +93,7 @@ class SpawnView(discord.ui.View):
             delspawn,
             pinspawn,
             spawn_channel,
-            legendchance,
-            ubchance,
+            rare,
             shiny,
             self,
         )
@@ -65,8 +121,7 @@ class SpawnModal(discord.ui.Modal, title="Catch!"):
         delspawn: bool,
         pinspawn: bool,
         spawn_channel: discord.TextChannel,
-        legendchance: int,
-        ubchance: int,
+        rare: bool,
         shiny: bool,
         view: discord.ui.View,
     ):
@@ -75,8 +130,7 @@ class SpawnModal(discord.ui.Modal, title="Catch!"):
         self.delspawn = delspawn
         self.pinspawn = pinspawn
         self.spawn_channel = spawn_channel
-        self.legendchance = legendchance
-        self.ubchance = ubchance
+        self.rare = rare
         self.shiny = shiny
         self.view = view
         super().__init__()
@@ -98,34 +152,17 @@ class SpawnModal(discord.ui.Modal, title="Catch!"):
                 "Someone's already guessed this pokemon!", ephemeral=True
             )
 
-        # Add additional valid names to support variations in naming
-        catch_options = [pokemon]
-        if pokemon == "mr-mime":
-            catch_options.append("mr.-mime")
-        elif pokemon == "mime-jr":
-            catch_options.append("mime-jr.")
-        elif pokemon.endswith("-alola"):
-            catch_options.append(f"alola-{pokemon[:-6]}")
-            catch_options.append(f"alolan-{pokemon[:-6]}")
-        elif pokemon.endswith("-galar"):
-            catch_options.append(f"galar-{pokemon[:-6]}")
-            catch_options.append(f"galarian-{pokemon[:-6]}")
-        elif pokemon.endswith("-hisui"):
-            catch_options.append(f"hisui-{pokemon[:-6]}")
-            catch_options.append(f"hisuian-{pokemon[:-6]}")
-
         if str(self.name).lower().replace(
             " ", "-"
-        ) not in catch_options or interaction.client.botbanned(interaction.user.id):
+        ) not in catch_names(pokemon) or interaction.client.botbanned(interaction.user.id):
             return await interaction.followup.send(
                 "Incorrect name! Try again :(", ephemeral=True
             )
 
         # Someone caught the poke, create it
         async with interaction.client.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json from users WHERE u_id = $1",
-                interaction.user.id,
+            inventory = await interaction.client.queries.inventory(
+                pconn, interaction.user.id
             )
             if inventory is None:
                 return await interaction.followup.send(
@@ -140,94 +177,29 @@ class SpawnModal(discord.ui.Modal, title="Catch!"):
         # 0%-10% chance from 0-50 iv multis
         boosted = random.randrange(500) < ivmulti
         plevel = random.randint(1, 60)
-        pokedata = await interaction.client.commondb.create_poke(
-            interaction.client,
+        berry, chest, credits = roll_drops(
+            interaction.client.premium_server(interaction.message.guild.id)
+        )
+        pokedata = await interaction.client.commondb.settle_catch(
             interaction.user.id,
             pokemon,
             shiny=self.shiny,
             boosted=boosted,
             level=plevel,
+            item=berry,
+            chest=chest,
+            credits=credits,
         )
+        if pokedata is None:
+            return
         ivpercent = round((pokedata.iv_sum / 186) * 100, 2)
-        credits = None
-
-        async with interaction.client.db[0].acquire() as pconn:
-            items = await pconn.fetchval(
-                "SELECT items::json FROM users WHERE u_id = $1",
-                interaction.message.author.id,
-            )
-
-            if not items:
-                items = {}
-            #
-            user = await interaction.client.mongo_find(
-                "users",
-                {"user": interaction.user.id},
-                default={"user": interaction.user.id, "progress": {}},
-            )
-            progress = user["progress"]
-            progress["catch-count"] = progress.get("catch-count", 0) + 1
-            await interaction.client.mongo_update(
-                "users", {"user": interaction.user.id}, {"progress": progress}
-            )
-            #
-            berry_chance = max(1, int(random.random() * 350))
-            expensive_chance = max(1, int(random.random() * 25))
-            if berry_chance in range(1, 8):
-                cheaps = [
-                    t["item"]
-                    for t in SHOP
-                    if t["price"] <= 8000 and not is_key(t["item"])
-                ]
-                expensives = [
-                    t["item"]
-                    for t in SHOP
-                    if t["price"] in range(8000, 20000) and not is_key(t["item"])
-                ]
-                if berry_chance == 1:
-                    berry = random.choice(cheaps)
-                elif berry_chance == expensive_chance:
-                    berry = random.choice(expensives)
-                else:
-                    berry = random.choice(list(berryList))
-                # items = user_info["items"]
-                items[berry] = items.get(berry, 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET items = $1::json WHERE u_id = $2",
-                    items,
-                    interaction.user.id,
-                )
-
-            else:
-                berry_chance = None
-            #
-            chest_chance = not random.randint(0, 200)
-            if chest_chance:
-                inventory = await pconn.fetchval(
-                    "SELECT inventory::json FROM users WHERE u_id = $1",
-                    interaction.user.id,
-                )
-                chest = "common chest"
-                inventory[chest] = inventory.get(chest, 0) + 1
-                await pconn.execute(
-                    "UPDATE users SET inventory = $1::json where u_id = $2",
-                    inventory,
-                    interaction.user.id,
-                )
-            if interaction.client.premium_server(interaction.message.guild.id):
-                credits = random.randint(100, 250)
-                await pconn.execute(
-                    "UPDATE users SET mewcoins = mewcoins + $1 where u_id = $2",
-                    credits,
-                    interaction.user.id,
-                )
         author = interaction.user.mention
         teext = f"Congratulations {author}, you have caught a {pokedata.emoji}{pokemon} ({ivpercent}% iv)!\n"
         if boosted:
             teext += "It was boosted by your IV multiplier!\n"
-        if berry_chance:
+        if berry:
             teext += f"It also dropped a {berry}!\n"
-        if chest_chance:
+        if chest:
             teext += f"It also dropped a {chest}!\n"
         if credits:
             teext += f"You also found {credits} credits!\n"
@@ -245,7 +217,7 @@ class SpawnModal(discord.ui.Modal, title="Catch!"):
                     and self.spawn_channel.permissions_for(
                         interaction.message.guild.me
                     ).manage_messages
-                ) and any([self.legendchance < 2, self.ubchance < 2]):
+                ) and self.rare:
                     await self.embedmsg.pin()
         self.view.stop()
 
@@ -257,11 +229,26 @@ class SpawnModal(discord.ui.Modal, title="Catch!"):
 class Spawn(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.spawn_cache = defaultdict(
-            int
-        )  # This doesn't need to be put in Redis, because it's a cache of Guild ID's, which aren't cross-cluster
+        # A per channel cooldown tighter than the guild's is opt in
+        channel_cooldown = os.environ.get("SPAWN_CHANNEL_COOLDOWN")
+        # This doesn't need to be put in Redis, guilds and their channels aren't cross-cluster
+        self.admission = SpawnAdmission(
+            channel_rate=1 / float(channel_cooldown) if channel_cooldown else None
+        )
+        self.embeds = SpawnEmbeds(bot)
+        # Restored spawns being awaited, the loop only holds tasks weakly
+        self._resumes = set()
         self.always_spawn = False
         self.modal_view = False
+        self.sampler = SpawnSampler(
+            {
+                LEGENDARY: LegendList,
+                ULTRA_BEAST: ubList,
+                PSEUDO: pseudoList,
+                STARTER: starterList,
+                COMMON: pList,
+            }
+        )
 
     # @check_owner()
     # @commands.hybrid_command(name="lop")
@@ -273,14 +260,9 @@ class Spawn(commands.Cog):
     #        self.always_spawn = True
     #        await ctx.send("Always spawning enabled.")
 
-    async def get_type(self, type_id):
-        data = await self.bot.db[1].ptypes.find({"types": type_id}).to_list(None)
-        data = [x["id"] for x in data]
-        data = (
-            await self.bot.db[1].forms.find({"pokemon_id": {"$in": data}}).to_list(None)
-        )
-        data = [x["identifier"].title() for x in data]
-        return list(set(data) & set(totalList))
+    def get_type(self, type_id):
+        data = {x.title() for x in self.bot.catalog.index.forms(types=[type_id])}
+        return list(data & set(totalList))
 
     @commands.Cog.listener()
     async def on_message(self, message):
@@ -289,23 +271,24 @@ class Spawn(commands.Cog):
             return
         if message.author.bot:
             return
+        # Catch attempts for spawns open in this channel
+        self.bot.catches.dispatch(message)
         # if self.bot.botbanned(message.author.id):
         # return
         if message.guild.id in (264445053596991498, 446425626988249089):
             return
-        if time.time() < self.spawn_cache[message.guild.id]:
-            return
         if random.random() >= 0.05 and not self.always_spawn:
             return
         if isinstance(message.channel, discord.threads.Thread):
             return
         if isinstance(message.channel, discord.VoiceChannel):
             return
-        self.spawn_cache[message.guild.id] = time.time() + 5
+        if not self.admission.admit(message.guild.id, message.channel.id):
+            return
         
         # See if we are allowed to spawn in this channel & get the spawn channel
         try:
-            guild = await self.bot.mongo_find("guilds", {"id": message.guild.id})
+            guild = await self.bot.guild_settings.get(message.guild.id)
             (
                 redirects,
                 delspawn,
@@ -354,21 +337,17 @@ class Spawn(commands.Cog):
         override_with_ghost = False
         override_with_ice = False
         async with self.bot.db[0].acquire() as pconn:
-            inventory = await pconn.fetchval(
-                "SELECT inventory::json FROM users WHERE u_id = $1",
-                message.author.id,
-            )
+            inventory = await self.bot.queries.inventory(pconn, message.author.id)
             threshold = 4000
             if inventory is not None:
                 threshold = round(
                     threshold - threshold * (inventory.get("shiny-multiplier", 0) / 100)
                 )
-            shiny = random.choice([False for i in range(threshold)] + [True])
+            shiny = one_in(threshold)
 
-            honey = await pconn.fetchval(
-                "SELECT type FROM honey WHERE channel = $1 LIMIT 1",
-                message.channel.id,
-            )
+            honey = self.bot.honey.get(message.channel.id)
+            if honey is not None:
+                honey = honey.type
             if honey is None:
                 honey = 0
             elif honey == "ghost":
@@ -380,60 +359,30 @@ class Spawn(commands.Cog):
             else:
                 honey = 50
 
-            legendchance = int(random.random() * (round(4000 - 7600 * honey / 100)))
-            ubchance = int(random.random() * (round(3000 - 5700 * honey / 100)))
-            pseudochance = int(random.random() * (round(1000 - 1900 * honey / 100)))
-            starterchance = int(random.random() * (round(500 - 950 * honey / 100)))
-
         # Pick which type of pokemon to spawn
-        if message.guild.id == 999953429751414784 and False:
-            pass
-        elif override_with_ghost:
-            pokemon = random.choice(await self.get_type(8))
+        rare = False
+        if override_with_ghost:
+            pokemon = random.choice(self.get_type(8))
         elif override_with_ice:
-            pokemon = random.choice(await self.get_type(15))
-        elif legendchance < 2:
-            pokemon = random.choice(LegendList)
-        elif ubchance < 2:
-            pokemon = random.choice(ubList)
-        elif pseudochance < 2:
-            pokemon = random.choice(pseudoList)
-        elif starterchance < 2:
-            pokemon = random.choice(starterList)
+            pokemon = random.choice(self.get_type(15))
         else:
-            pokemon = random.choice(pList)
+            pokemon, tier = self.sampler.sample(honey)
+            rare = tier in (LEGENDARY, ULTRA_BEAST)
         pokemon = pokemon.lower()
 
         # Get the data for the pokemon that is about to spawn
-        form_info = await self.bot.db[1].forms.find_one({"identifier": pokemon})
-        if form_info is None:
+        if self.bot.catalog.form(pokemon) is None:
             raise ValueError(f'Bad pokemon name "{pokemon}" passed to spawn.py')
-        pokemon_info = await self.bot.db[1].pfile.find_one(
-            {"id": form_info["pokemon_id"]}
-        )
-        if not pokemon_info and "alola" in pokemon:
-            pokemon_info = await self.bot.db[1].pfile.find_one(
-                {"identifier": pokemon.lower().split("-")[0]}
-            )
-        try:
-            pokeurl = await get_file_name(pokemon, self.bot, shiny)
-        except Exception:
-            return
 
         # Create & send the pokemon spawn embed
-        embed = discord.Embed(
-            title=f"A wild Pokémon has Spawned, Say its name to catch it!",
-            color=random.choice(self.bot.colors),
-        )
-        embed.add_field(name="-", value=f"This Pokémons name starts with {pokemon[0]}")
         try:
-            if small_images:
-                embed.set_thumbnail(
-                    url="https://skylarr1227.github.io/images/" + pokeurl
-                )
-            else:
-                embed.set_image(url="https://skylarr1227.github.io/images/" + pokeurl)
-        except Exception:
+            embed = self.embeds.render(
+                pokemon,
+                shiny,
+                color=random.choice(self.bot.colors),
+                small_images=small_images,
+            )
+        except ValueError:
             return
 
         if self.modal_view:
@@ -443,8 +392,7 @@ class Spawn(commands.Cog):
                    delspawn=delspawn,
                    pinspawn=pinspawn,
                    spawn_channel=spawn_channel,
-                   legendchance=legendchance,
-                   ubchance=ubchance,
+                   rare=rare,
                    shiny=shiny,
                )
                msg = await spawn_channel.send(embed=embed, view=view)
@@ -454,175 +402,138 @@ class Spawn(commands.Cog):
            except discord.HTTPException:
                return
         else:
-            catch_options = [pokemon]
-            if pokemon == "mr-mime":
-                catch_options.append("mr.-mime")
-            elif pokemon == "mime-jr":
-                catch_options.append("mime-jr.")
-            elif pokemon.endswith("-alola"):
-                catch_options.append("alola-" + pokemon[:-6])
-                catch_options.append("alolan-" + pokemon[:-6])
-            elif pokemon.endswith("-galar"):
-                catch_options.append("galar-" + pokemon[:-6])
-                catch_options.append("galarian-" + pokemon[:-6])
-            elif pokemon.endswith("-hisui"):
-                catch_options.append("hisui-" + pokemon[:-6])
-                catch_options.append("hisuian-" + pokemon[:-6])
-
             embedmsg = await spawn_channel.send(
                 embed=embed,
             )
+            spawn = self.bot.catches.open(
+                spawn_channel.id,
+                pokemon,
+                catch_names(pokemon),
+                shiny,
+                600,
+                message_id=embedmsg.id,
+                rare=rare,
+            )
+            await self.await_catch(
+                spawn, spawn_channel, embedmsg, delspawn=delspawn, pinspawn=pinspawn
+            )
+
+    async def await_catch(self, spawn, spawn_channel, embedmsg, *, delspawn, pinspawn):
+        """Waits for `spawn` to be caught or to expire, and settles the catch."""
+        while True:
+            try:
+                msg = await self.bot.catches.wait(spawn)
+            except asyncio.TimeoutError:
+                try:
+                    await embedmsg.edit(
+                        embed=despawn_embed(embedmsg.embeds[0], "despawn")
+                    )
+                except discord.HTTPException:
+                    pass
+                return
+            async with self.bot.db[0].acquire() as pconn:
+                inventory = await self.bot.queries.inventory(pconn, msg.author.id)
+                if inventory is None:
+                    await spawn_channel.send(
+                        "You have not started!\nStart with `/start` first!"
+                    )
+                else:
+                    self.bot.catches.close(spawn)
+                    break
+
+        pokemon = spawn.pokemon.capitalize()
 
-            def check(m):
-                if(m.content is None):
-                    return False
-                return (
-                    m.channel.id == spawn_channel.id
-                    and any([m.content.lower().replace(" ","-").endswith(catch_option) for catch_option in catch_options]) # The message ends with the pokemon's name
-                    and not self.bot.botbanned(m.author.id)
+        # Someone caught the poke, create it
+        ivmulti = inventory.get("iv-multiplier", 0)
+        # 0%-10% chance from 0-50 iv multis
+        boosted = random.randrange(500) < ivmulti
+        plevel = random.randint(1, 60)
+        berry, chest, credits = roll_drops(
+            self.bot.premium_server(spawn_channel.guild.id)
+        )
+        pokedata = await self.bot.commondb.settle_catch(
+            msg.author.id,
+            pokemon,
+            shiny=spawn.shiny,
+            boosted=boosted,
+            level=plevel,
+            item=berry,
+            chest=chest,
+            credits=credits,
+        )
+        if pokedata is None:
+            return
+        ivpercent = round((pokedata.iv_sum / 186) * 100, 2)
+        author = msg.author.mention
+        teext = f"Congratulations {author}, you have caught a {pokedata.emoji}{pokemon} ({ivpercent}% iv)!\n"
+        if boosted:
+            teext += "It was boosted by your IV multiplier!\n"
+        if berry:
+            teext += f"It also dropped a {berry}!\n"
+        if chest:
+            teext += f"It also dropped a {chest}!\n"
+        if credits:
+            teext += f"You also found {credits} credits!\n"
+
+        await spawn_channel.send(embed=(make_embed(title="", description=teext)))
+        try:
+            if delspawn:
+                await embedmsg.delete()
+            else:
+                await embedmsg.edit(
+                    embed=despawn_embed(embedmsg.embeds[0], "caught")
                 )
+                if (
+                    pinspawn
+                    and spawn_channel.permissions_for(
+                        spawn_channel.guild.me
+                    ).manage_messages
+                ):
+                    if spawn.rare:
+                        await embedmsg.pin()
+        except discord.HTTPException:
+            pass
+        # Dispatches an event that a poke was spawned.
+        # on_poke_spawn(self, channel, user)
+        self.bot.dispatch("poke_spawn", spawn_channel, msg.author)
 
-            while True:
+    async def restore(self, *, concurrency=5):
+        """Picks the spawns this cluster had open before a restart back up."""
+        spawns = await self.bot.catches.restore()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def resume(spawn):
+            channel = self.bot.get_channel(spawn.channel_id)
+            if not isinstance(channel, discord.TextChannel):
+                self.bot.catches.discard(spawn)
+                return
+            async with semaphore:
                 try:
-                    msg = await self.bot.wait_for("message", check=check, timeout=600)
-                except asyncio.TimeoutError:
-                    try:
-                        await embedmsg.edit(
-                            embed=despawn_embed(embedmsg.embeds[0], "despawn")
-                        )
-                    except discord.HTTPException:
-                        pass
+                    embedmsg = await channel.fetch_message(spawn.message_id)
+                except discord.HTTPException:
+                    # The spawn message was deleted, or the channel can no longer be read
+                    self.bot.catches.discard(spawn)
                     return
-                async with self.bot.db[0].acquire() as pconn:
-                    inventory = await pconn.fetchval(
-                        "SELECT inventory::json from users WHERE u_id = $1",
-                        msg.author.id,
-                    )
-                    if inventory is None:
-                        await spawn_channel.send(
-                            "You have not started!\nStart with `/start` first!"
-                        )
-                    else:
-                        break
-
-            pokemon = pokemon.capitalize()
-
-            # Someone caught the poke, create it
-            ivmulti = inventory.get("iv-multiplier", 0)
-            # 0%-10% chance from 0-50 iv multis
-            boosted = random.randrange(500) < ivmulti
-            plevel = random.randint(1, 60)
-            pokedata = await self.bot.commondb.create_poke(
-                self.bot,
-                msg.author.id,
-                pokemon,
-                shiny=shiny,
-                boosted=boosted,
-                level=plevel,
+            guild = await self.bot.guild_settings.get(channel.guild.id, {})
+            await self.await_catch(
+                spawn,
+                channel,
+                embedmsg,
+                delspawn=guild.get("delete_spawns", False),
+                pinspawn=guild.get("pin_spawns", False),
             )
-            ivpercent = round((pokedata.iv_sum / 186) * 100, 2)
-            credits = None
 
-            async with self.bot.db[0].acquire() as pconn:
-                items = await pconn.fetchval(
-                    "SELECT items::json FROM users WHERE u_id = $1", msg.author.id
-                )
-                #
-                user = await self.bot.mongo_find(
-                    "users",
-                    {"user": msg.author.id},
-                    default={"user": msg.author.id, "progress": {}},
-                )
-                progress = user["progress"]
-                progress["catch-count"] = progress.get("catch-count", 0) + 1
-                await self.bot.mongo_update(
-                    "users", {"user": msg.author.id}, {"progress": progress}
-                )
-                if shiny:
-                    await pconn.execute("UPDATE achievements SET shiny_caught = shiny_caught + 1 WHERE u_id = $1", msg.author.id)
-                else:
-                    await pconn.execute("UPDATE achievements SET pokemon_caught = pokemon_caught + 1 WHERE u_id = $1", msg.author.id)
-                berry_chance = max(1, int(random.random() * 350))
-                expensive_chance = max(1, int(random.random() * 25))
-                if berry_chance in range(1, 8):
-                    cheaps = [
-                        t["item"]
-                        for t in SHOP
-                        if t["price"] <= 8000 and not is_key(t["item"])
-                    ]
-                    expensives = [
-                        t["item"]
-                        for t in SHOP
-                        if t["price"] in range(8000, 20000) and not is_key(t["item"])
-                    ]
-                    if berry_chance == 1:
-                        berry = random.choice(cheaps)
-                    elif berry_chance == expensive_chance:
-                        berry = random.choice(expensives)
-                    else:
-                        berry = random.choice(list(berryList))
-                    # items = user_info["items"]
-                    items[berry] = items.get(berry, 0) + 1
-                    await pconn.execute(
-                        f"UPDATE users SET items = $1::json WHERE u_id = $2",
-                        items,
-                        msg.author.id,
-                    )
-                else:
-                    berry_chance = None
-                #
-                chest_chance = not random.randint(0, 200)
-                if chest_chance:
-                    inventory = await pconn.fetchval(
-                        "SELECT inventory::json FROM users WHERE u_id = $1",
-                        msg.author.id,
-                    )
-                    chest = "common chest"
-                    inventory[chest] = inventory.get(chest, 0) + 1
-                    await pconn.execute(
-                        "UPDATE users SET inventory = $1::json where u_id = $2",
-                        inventory,
-                        msg.author.id,
-                    )
-                if self.bot.premium_server(message.guild.id):
-                    credits = random.randint(100, 250)
-                    await pconn.execute(
-                        "UPDATE users SET mewcoins = mewcoins + $1 where u_id = $2",
-                        credits,
-                        msg.author.id,
-                    )
-            author = msg.author.mention
-            teext = f"Congratulations {author}, you have caught a {pokedata.emoji}{pokemon} ({ivpercent}% iv)!\n"
-            if boosted:
-                teext += "It was boosted by your IV multiplier!\n"
-            if berry_chance:
-                teext += f"It also dropped a {berry}!\n"
-            if chest_chance:
-                teext += f"It also dropped a {chest}!\n"
-            if credits:
-                teext += f"You also found {credits} credits!\n"
-
-            await spawn_channel.send(embed=(make_embed(title="", description=teext)))
-            try:
-                if delspawn:
-                    await embedmsg.delete()
-                else:
-                    await embedmsg.edit(
-                        embed=despawn_embed(embedmsg.embeds[0], "caught")
-                    )
-                    if (
-                        pinspawn
-                        and spawn_channel.permissions_for(
-                            message.guild.me
-                        ).manage_messages
-                    ):
-                        if any([legendchance < 2, ubchance < 2]):
-                            await embedmsg.pin()
-            except discord.HTTPException:
-                pass
-            # Dispatches an event that a poke was spawned.
-            # on_poke_spawn(self, channel, user)
-            self.bot.dispatch("poke_spawn", spawn_channel, msg.author)
+        for spawn in spawns:
+            task = asyncio.create_task(resume(spawn))
+            self._resumes.add(task)
+            task.add_done_callback(self._resumed)
+        if spawns:
+            self.bot.logger.info(f"Restored {len(spawns)} spawns")
+
+    def _resumed(self, task):
+        self._resumes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.bot.logger.exception("Failed to resume a spawn", exc_info=task.exception())
 
 
 async def setup(bot):
@@ -158,7 +158,7 @@ class staff(commands.Cog):
             data = {}
             async with self.bot.db[0].acquire() as pconn:
                 details = await pconn.fetch(
-                    """SELECT u_id, cardinality(pokes) as pokenum FROM users ORDER BY pokenum DESC LIMIT 50"""
+                    """SELECT owner as u_id, count(*) as pokenum FROM pokes WHERE owner IS NOT NULL GROUP BY owner ORDER BY pokenum DESC LIMIT 50"""
                 )
 
             pokes = [record["pokenum"] for record in details]
@@ -366,6 +366,138 @@ class staff(commands.Cog):
             e.description = builder
         await ctx.send(embed=e)
 
+    @check_admin()
+    @discord.app_commands.default_permissions(ban_members=True)
+    @commands.hybrid_command()
+    async def reloadcatalog(self, ctx):
+        """Reloads the in-memory pokedex catalog and lookup encyclopedia on every cluster."""
+        launcher_res = await ctx.bot.handler("statuses", 1, scope="launcher")
+        if not launcher_res:
+            return await ctx.send(
+                "Launcher did not respond.  Please start with the launcher to use this command across all clusters."
+            )
+
+        processes = len(launcher_res[0])
+        reload_res = await ctx.bot.handler("reload_catalog", processes, scope="bot")
+        reload_res.sort(key=lambda x: x["cluster_id"])
+
+        e = discord.Embed(color=0xFFB6C1)
+        builder = ""
+        for cluster in reload_res:
+            if cluster["success"]:
+                builder += f"`Cluster #{cluster['cluster_id']}`: Successfully reloaded\n"
+            else:
+                builder += f"`Cluster #{cluster['cluster_id']}`: {cluster['message']}\n"
+        e.description = builder or "No clusters responded."
+        await ctx.send(embed=e)
+
+    @check_helper()
+    @discord.app_commands.default_permissions(ban_members=True)
+    @commands.hybrid_command()
+    async def spawnstats(self, ctx):
+        """Shows the spawns waiting to be caught, how many expired and how many were rate limited, per cluster."""
+        launcher_res = await ctx.bot.handler("statuses", 1, scope="launcher")
+        if not launcher_res:
+            return await ctx.send(
+                "Launcher did not respond.  Please start with the launcher to use this command across all clusters."
+            )
+
+        processes = len(launcher_res[0])
+        stats_res = await ctx.bot.handler("spawn_stats", processes, scope="bot")
+        stats_res.sort(key=lambda x: x["cluster_id"])
+
+        e = discord.Embed(title="Spawns", color=0xFFB6C1)
+        for cluster in stats_res:
+            e.add_field(
+                name=f"Cluster #{cluster['cluster_id']}",
+                value=(
+                    f"Open: {cluster['open']:,}\n"
+                    f"Caught: {cluster['caught']:,}\n"
+                    f"Expired: {cluster['expired']:,}\n"
+                    f"Total: {cluster['opened']:,}\n"
+                    f"Restored: {cluster.get('restored', 0):,}\n"
+                    f"Dropped: {cluster.get('dropped_guild', 0):,} by guild, "
+                    f"{cluster.get('dropped_channel', 0):,} by channel\n"
+                    f"Embed templates: {cluster.get('embed_hits', 0):,} hits, "
+                    f"{cluster.get('embed_misses', 0):,} misses"
+                ),
+            )
+        if not stats_res:
+            e.description = "No clusters responded."
+        await ctx.send(embed=e)
+
+    @check_helper()
+    @discord.app_commands.default_permissions(ban_members=True)
+    @commands.hybrid_command()
+    async def activitystats(self, ctx):
+        """Shows how chat progress is being flushed to the database, per cluster."""
+        launcher_res = await ctx.bot.handler("statuses", 1, scope="launcher")
+        if not launcher_res:
+            return await ctx.send(
+                "Launcher did not respond.  Please start with the launcher to use this command across all clusters."
+            )
+
+        processes = len(launcher_res[0])
+        stats_res = await ctx.bot.handler("activity_stats", processes, scope="bot")
+        stats_res.sort(key=lambda x: x["cluster_id"])
+
+        e = discord.Embed(title="Chat progress", color=0xFFB6C1)
+        for cluster in stats_res:
+            e.add_field(
+                name=f"Cluster #{cluster['cluster_id']}",
+                value=(
+                    f"Pending: {cluster['pending']:,}\n"
+                    f"Flushes: {cluster['flushes']:,} ({cluster['flushed']:,} users)\n"
+                    f"Size: {cluster['flush_size_p50']:,} p50, {cluster['flush_size_max']:,} max\n"
+                    f"Latency: {cluster['flush_ms_p50']}ms p50, {cluster['flush_ms_p99']}ms p99\n"
+                    f"Dropped: {cluster['dropped']:,}, failed: {cluster['failed']:,}"
+                ),
+            )
+        if not stats_res:
+            e.description = "No clusters responded."
+        await ctx.send(embed=e)
+
+    @check_helper()
+    @discord.app_commands.default_permissions(ban_members=True)
+    @commands.hybrid_command()
+    async def querystats(self, ctx):
+        """Shows the named statements that took the most time, across all clusters."""
+        launcher_res = await ctx.bot.handler("statuses", 1, scope="launcher")
+        if not launcher_res:
+            return await ctx.send(
+                "Launcher did not respond.  Please start with the launcher to use this command across all clusters."
+            )
+
+        processes = len(launcher_res[0])
+        stats_res = await ctx.bot.handler("query_stats", processes, scope="bot")
+
+        # Percentiles can not be merged, the worst cluster's are shown
+        totals = {}
+        for cluster in stats_res:
+            for name, stats in cluster["statements"].items():
+                total = totals.setdefault(
+                    name, {"calls": 0, "errors": 0, "total_ms": 0, "ms_p50": 0, "ms_p99": 0}
+                )
+                total["calls"] += stats["calls"]
+                total["errors"] += stats["errors"]
+                total["total_ms"] += stats["total_ms"]
+                total["ms_p50"] = max(total["ms_p50"], stats["ms_p50"])
+                total["ms_p99"] = max(total["ms_p99"], stats["ms_p99"])
+
+        e = discord.Embed(title="Statements", color=0xFFB6C1)
+        desc = ""
+        for name, total in sorted(totals.items(), key=lambda x: x[1]["total_ms"], reverse=True):
+            desc += (
+                f"`{name}`: {total['calls']:,} calls, {total['total_ms'] / 1000:,.1f}s total, "
+                f"{total['ms_p50']}ms p50, {total['ms_p99']}ms p99"
+            )
+            if total["errors"]:
+                desc += f", {total['errors']:,} errors"
+            desc += "\n"
+        e.set_footer(text=f"{len(stats_res)} clusters")
+        e.description = desc or "No clusters responded."
+        await ctx.send(embed=e)
+
     @check_admin()
     @discord.app_commands.default_permissions(ban_members=True)
     @commands.hybrid_command()
@@ -70,8 +70,8 @@ class Start(commands.Cog):
         await ctx.send(f"You have selected {starter} as your starter! {emoji}")
 
         user_query = (
-            "INSERT INTO users (u_id, redeems, evpoints, tnick, upvotepoints, mewcoins, user_order, pokes, visible, inventory, comp) "
-            "VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)"
+            "INSERT INTO users (u_id, redeems, evpoints, tnick, upvotepoints, mewcoins, user_order, visible, inventory, comp) "
+            "VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)"
         )
         user_args = (
             ctx.author.id,
@@ -81,7 +81,6 @@ class Start(commands.Cog):
             0,
             0,
             "kek",
-            [],
             True,
             '{"coin-case": 0, "nature-capsules" : 5, "honey" : 1, "battle-multiplier": 1, "shiny-multiplier": 0 }',
             True,
@@ -239,8 +238,8 @@ class Start(commands.Cog):
             moves = ["tackle", "tackle", "tackle", "tackle"]
 
             query2 = """
-            INSERT INTO pokes (pokname, hpiv, atkiv, defiv, spatkiv, spdefiv, speediv, hpev, atkev, defev, spatkev, spdefev, speedev, pokelevel, moves, hitem, exp, nature, expcap, poknick, price, market_enlist, happiness, fav, ability_index, gender, caught_by)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27)"""
+            INSERT INTO pokes (pokname, hpiv, atkiv, defiv, spatkiv, spdefiv, speediv, hpev, atkev, defev, spatkev, spdefev, speedev, pokelevel, moves, hitem, exp, nature, expcap, poknick, price, market_enlist, happiness, fav, ability_index, gender, caught_by, owner)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $27)"""
 
             args = (
                 starter,
@@ -272,13 +271,12 @@ class Start(commands.Cog):
                 ctx.author.id,
             )
             await pconn.execute(query2, *args)
-            the_id = await pconn.fetchval("SELECT currval('pokes_id_seq');")
             code1 = "".join(
                 random.choice(string.ascii_uppercase + string.digits) for _ in range(8)
             )
             query3 = """
-            INSERT INTO users (u_id, redeems, evpoints, tnick, upvotepoints, mewcoins, user_order, pokes, visible, inventory, comp)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+            INSERT INTO users (u_id, redeems, evpoints, tnick, upvotepoints, mewcoins, user_order, visible, inventory, comp)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
             """
 
             args2 = (
@@ -289,7 +287,6 @@ class Start(commands.Cog):
                 0,
                 0,
                 "kek",
-                {the_id},
                 True,
                 '{"coin-case": 0, "nature-capsules" : 10, "honey" : 0, "battle-multiplier": 5, "shiny-multiplier": 5 }',
                 True,
@@ -1,9 +1,6 @@
-import contextlib
 import random
-import time
 from datetime import datetime
 
-import discord
 from discord.ext import commands, tasks
 
 
@@ -47,25 +44,8 @@ class Mother(commands.Cog):
             # Reset the missions progress for all users
             await self.bot.db[1].users.delete_many({})
 
-        async with self.bot.db[0].acquire() as pconn:
-            honeys = await pconn.fetch(
-                "SELECT * FROM honey WHERE expires < $1", int(time.time())
-            )
-            channels = [t["channel"] for t in honeys]
-            ids = [t["id"] for t in honeys]
-            owners = [t["owner"] for t in honeys]
-            types = [t["type"] for t in honeys]
-            for idx, id in enumerate(ids):
-                await pconn.execute("DELETE FROM honey WHERE id = $1", id)
-                with contextlib.suppress(discord.HTTPException):
-                    owner = await self.bot.fetch_user(owners[idx])
-                    await owner.send(
-                        embed=discord.Embed(
-                            title=f"Your {types[idx]} spread has expired!",
-                            description=f"Your {types[idx]} Spread in <#{channels[idx]}> has expired!\nSpread some more with `/spread`.",
-                            color=0xFFB6C1,
-                        )
-                    )
+        # Each cluster expires the honey of its own channels, this only catches the rest
+        await self.bot.honey.sweep()
 
     def cog_unload(self):
         self.energy.cancel()
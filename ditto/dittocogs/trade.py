@@ -236,34 +236,23 @@ class TradeMainView(discord.ui.View):
                     "SELECT hitem FROM pokes WHERE id = $1", _id
                 )
                 pokename = pokename.lower()
-                try:
-                    pid = [t["id"] for t in PFILE if t["identifier"] == pokename][0]
-                except:
+                catalog = self.ctx.bot.catalog
+                pfile = catalog.pfile_by_identifier(pokename)
+                if pfile is None:
                     return
 
-                eids = [t["id"] for t in PFILE if t["evolves_from_species_id"] == pid]
-
-                for eid in eids:
-                    hitem = [
-                        t["held_item_id"]
-                        for t in EVOFILE
-                        if t["evolved_species_id"] == eid
-                    ][0]
-                    evo_trigger = [
-                        t["evolution_trigger_id"]
-                        for t in EVOFILE
-                        if t["evolved_species_id"] == eid
-                    ][0]
+                for evolution in catalog.evolutions_of(pfile["id"]):
+                    evo = catalog.evo(evolution["id"])
+                    hitem = evo["held_item_id"]
+                    evo_trigger = evo["evolution_trigger_id"]
+                    evoname = evolution["identifier"]
 
                     if hitem:
-                        item = [t["identifier"] for t in ITEMS if t["id"] == hitem]
-                        item = item[0]
+                        item = catalog.item_by_id(hitem)["identifier"]
                         if not helditem.lower() == item.lower():
                             continue
 
                         else:
-                            evoname = [t["identifier"] for t in PFILE if t["id"] == eid]
-                            evoname = evoname[0]
                             await pconn.execute(
                                 "UPDATE pokes SET pokname = $1 WHERE id = $2",
                                 evoname.capitalize(),
@@ -276,8 +265,6 @@ class TradeMainView(discord.ui.View):
                                 )
                             )
                     elif evo_trigger == 2:
-                        evoname = [t["identifier"] for t in PFILE if t["id"] == eid]
-                        evoname = evoname[0]
                         await pconn.execute(
                             "UPDATE pokes SET pokname = $1 WHERE id = $2",
                             evoname.capitalize(),
@@ -382,7 +369,7 @@ class TradeMainView(discord.ui.View):
 
             async with self.ctx.bot.db[0].acquire() as pconn:
                 details = await pconn.fetchrow(
-                    "SELECT id, pokname, pokelevel, shiny, radiant, tradable FROM pokes WHERE id = (SELECT pokes[$1] FROM users WHERE u_id = $2)",
+                    "SELECT id, pokname, pokelevel, shiny, radiant, tradable FROM pokes WHERE id = poke_at($2, $1)",
                     poke,
                     interaction.user.id,
                 )
@@ -443,7 +430,7 @@ class TradeMainView(discord.ui.View):
         for poke in modal.output:
             async with self.ctx.bot.db[0].acquire() as pconn:
                 details = await pconn.fetchrow(
-                    "SELECT id, pokname, pokelevel, shiny, radiant, tradable FROM pokes WHERE id = (SELECT pokes[$1] FROM users WHERE u_id = $2)",
+                    "SELECT id, pokname, pokelevel, shiny, radiant, tradable FROM pokes WHERE id = poke_at($2, $1)",
                     poke,
                     interaction.user.id,
                 )
@@ -484,9 +471,7 @@ class TradeMainView(discord.ui.View):
             return
 
         async with self.ctx.bot.db[0].acquire() as pconn:
-            curcreds = await pconn.fetchval(
-                "SELECT mewcoins FROM users WHERE u_id = $1", interaction.user.id
-            )
+            curcreds = await self.ctx.bot.queries.credits(pconn, interaction.user.id)
             if modal.output > curcreds:
                 await modal.out_interaction.response.send_message(
                     "You don't have that many credits at this time..."
@@ -600,12 +585,10 @@ class TradeMainView(discord.ui.View):
 
         # Recheck pokes
         async with self.ctx.bot.db[0].acquire() as pconn:
-            for poke in TradeList(self.pokes).iter(self.p1):
-                is_owner = await pconn.fetchval(
-                    "SELECT u_id FROM users WHERE pokes @> $1",
-                    [poke.poke_id],
-                )
-                if is_owner != self.p1:
+            offered = [poke.poke_id for poke in TradeList(self.pokes).iter(self.p1)]
+            if offered:
+                owned = await self.ctx.bot.queries.owned_count(pconn, self.p1, offered)
+                if owned != len(set(offered)):
                     await interaction.followup.send(
                         f"<@{self.p1}> no longer owns one or more of the pokemon they were trading, canceling trade!"
                     )
@@ -613,12 +596,10 @@ class TradeMainView(discord.ui.View):
                     self.stop()
                     return
 
-            for poke in TradeList(self.pokes).iter(self.p2):
-                is_owner = await pconn.fetchval(
-                    "SELECT u_id FROM users WHERE pokes @> $1",
-                    [poke.poke_id],
-                )
-                if is_owner != self.p2:
+            offered = [poke.poke_id for poke in TradeList(self.pokes).iter(self.p2)]
+            if offered:
+                owned = await self.ctx.bot.queries.owned_count(pconn, self.p2, offered)
+                if owned != len(set(offered)):
                     await interaction.followup.send(
                         f"<@{self.p2}> no longer owns one or more of the pokemon they were trading, canceling trade!"
                     )
@@ -626,9 +607,7 @@ class TradeMainView(discord.ui.View):
                     self.stop()
                     return
 
-            p1_info = await pconn.fetchrow(
-                "SELECT selected, mewcoins FROM users WHERE u_id = $1", self.p1
-            )
+            p1_info = await self.ctx.bot.queries.trader(pconn, self.p1)
 
             if p1_info["selected"] in TradeList(self.pokes).sender(self.p1):
                 await interaction.followup.send(
@@ -646,9 +625,7 @@ class TradeMainView(discord.ui.View):
                 self.stop()
                 return
 
-            p2_info = await pconn.fetchrow(
-                "SELECT selected, mewcoins FROM users WHERE u_id = $1", self.p2
-            )
+            p2_info = await self.ctx.bot.queries.trader(pconn, self.p2)
 
             if p2_info["selected"] in TradeList(self.pokes).sender(self.p2):
                 await interaction.followup.send(
@@ -669,65 +646,25 @@ class TradeMainView(discord.ui.View):
             # Begin the trade
 
             # Mewcoins
-            await pconn.execute(
-                "UPDATE users SET mewcoins = mewcoins + $1 WHERE u_id = $2",
-                self.credits.p2,  # Credits p2 is giving to p1
-                self.p1,
-            )
+            # Credits p2 is giving to p1
+            await self.ctx.bot.queries.add_credits(pconn, self.p1, self.credits.p2)
 
             # Remove credits from p2
-            await pconn.execute(
-                "UPDATE users SET mewcoins = mewcoins - $1 WHERE u_id = $2",
-                self.credits.p2,
-                self.p2,
-            )
+            await self.ctx.bot.queries.add_credits(pconn, self.p2, -self.credits.p2)
 
-            await pconn.execute(
-                "UPDATE users SET mewcoins = mewcoins + $1 WHERE u_id = $2",
-                self.credits.p1,  # Credits p1 is giving to p2
-                self.p2,
-            )
+            # Credits p1 is giving to p2
+            await self.ctx.bot.queries.add_credits(pconn, self.p2, self.credits.p1)
 
-            await pconn.execute(
-                "UPDATE users SET mewcoins = mewcoins - $1 WHERE u_id = $2",
-                self.credits.p1,
-                self.p1,
-            )
+            await self.ctx.bot.queries.add_credits(pconn, self.p1, -self.credits.p1)
 
             # Pokemon
             for poke in TradeList(self.pokes).iter(self.p1):
                 # Remove pokemon from player 1 and give to player 2
-                await pconn.execute(
-                    "UPDATE users set pokes = array_remove(pokes, $1) WHERE u_id = $2",
-                    poke.poke_id,
-                    self.p1,
-                )
-                await pconn.execute(
-                    "UPDATE users set pokes = array_append(pokes, $1) WHERE u_id = $2",
-                    poke.poke_id,
-                    self.p2,
-                )
-                await pconn.execute(
-                    "UPDATE pokes SET market_enlist = false WHERE id = $1",
-                    poke.poke_id,
-                )
+                await self.ctx.bot.queries.give_poke(pconn, poke.poke_id, self.p1, self.p2)
 
             for poke in TradeList(self.pokes).iter(self.p2):
                 # Remove pokemon from player 2 and give to player 1
-                await pconn.execute(
-                    "UPDATE users set pokes = array_remove(pokes, $1) WHERE u_id = $2",
-                    poke.poke_id,
-                    self.p2,
-                )
-                await pconn.execute(
-                    "UPDATE users set pokes = array_append(pokes, $1) WHERE u_id = $2",
-                    poke.poke_id,
-                    self.p1,
-                )
-                await pconn.execute(
-                    "UPDATE pokes SET market_enlist = false WHERE id = $1",
-                    poke.poke_id,
-                )
+                await self.ctx.bot.queries.give_poke(pconn, poke.poke_id, self.p2, self.p1)
 
             # Just in case
             await self.unlock_trade()
@@ -895,12 +832,8 @@ class Trade(commands.Cog):
             ):
                 await ctx.send("A user is not allowed to Trade")
                 return
-            giver_creds = await pconn.fetchval(
-                "SELECT mewcoins FROM users WHERE u_id = $1", ctx.author.id
-            )
-            getter_creds = await pconn.fetchval(
-                "SELECT mewcoins FROM users WHERE u_id = $1", user.id
-            )
+            giver_creds = await ctx.bot.queries.credits(pconn, ctx.author.id)
+            getter_creds = await ctx.bot.queries.credits(pconn, user.id)
 
         if getter_creds is None:
             await ctx.send(f"{user.name} has not started... Start with `/start` first!")
@@ -920,22 +853,12 @@ class Trade(commands.Cog):
             return
 
         async with ctx.bot.db[0].acquire() as pconn:
-            curcreds = await pconn.fetchval(
-                "SELECT mewcoins FROM users WHERE u_id = $1", ctx.author.id
-            )
+            curcreds = await ctx.bot.queries.credits(pconn, ctx.author.id)
             if val > curcreds:
                 await ctx.send("You don't have that many credits anymore...")
                 return
-            await pconn.execute(
-                "UPDATE users SET mewcoins = mewcoins - $1 WHERE u_id = $2",
-                val,
-                ctx.author.id,
-            )
-            await pconn.execute(
-                "UPDATE users SET mewcoins = mewcoins + $1 WHERE u_id = $2",
-                val,
-                user.id,
-            )
+            await ctx.bot.queries.add_credits(pconn, ctx.author.id, -val)
+            await ctx.bot.queries.add_credits(pconn, user.id, val)
             await ctx.send(f"{ctx.author.name} has given {user.name} {val} credits.")
             await ctx.bot.get_partial_messageable(1004571710323957830).send(
                 f"\N{SMALL BLUE DIAMOND}- {ctx.author.name} - ``{ctx.author.id}`` has gifted \n{user.name} - `{user.id}`\n```{val} credits```\n"
@@ -986,7 +909,7 @@ class Trade(commands.Cog):
                 await ctx.send("A user is not allowed to Trade")
                 return
             poke_id = await pconn.fetchval(
-                "SELECT pokes[$1] FROM users WHERE u_id = $2", val, ctx.author.id
+                "SELECT poke_at($2, $1)", val, ctx.author.id
             )
             name = await pconn.fetchrow(
                 "SELECT market_enlist, pokname, shiny, radiant, fav, tradable FROM pokes WHERE id = $1",
@@ -1021,8 +944,9 @@ class Trade(commands.Cog):
 
         await ctx.bot.commondb.remove_poke(ctx.author.id, poke_id)
         async with ctx.bot.db[0].acquire() as pconn:
+            # Only a poke remove_poke actually took away is unowned
             await pconn.execute(
-                "UPDATE users SET pokes = array_append(pokes, $1) WHERE u_id = $2",
+                "UPDATE pokes SET owner = $2, position = DEFAULT WHERE id = $1 AND owner IS NULL",
                 poke_id,
                 user.id,
             )
@@ -0,0 +1,118 @@
+import asyncio
+import contextlib
+import statistics
+import time
+from collections import deque
+
+
+class ActivityBatcher:
+    """
+    Batches the procedure calls behind the egg steps, exp and friendship chat messages earn.
+
+    Every message that earns progress used to cost an existence check and the
+    `party_counter`, `selected_counter` and `level_pokemon` procedures in their
+    own round trips. Messages are collected per user instead, and every
+    `interval` seconds the procedures run for all of them in a single statement.
+    Only the round trips are batched, postgres still runs the procedures once
+    per pending user, as the rules for progress live in them.
+
+    Hatches and level ups are only known once the procedures ran, so they are
+    dispatched as `message_activity` events with the message that earned them
+    up to `interval` seconds after it, instead of as a reply to it right away.
+
+    Pending progress is bounded: at `max_pending` users a flush starts early,
+    and messages arriving while it is full are dropped. A crash loses at most
+    `interval` seconds of progress, `close` flushes what is left on shutdown.
+    """
+
+    def __init__(self, bot, *, interval=2.0, max_pending=5000):
+        self.bot = bot
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending = {}
+        self._full = asyncio.Event()
+        self._task = None
+        self.flushes = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.failed = 0
+        self._sizes = deque(maxlen=256)
+        self._latencies = deque(maxlen=256)
+
+    def __len__(self):
+        return len(self._pending)
+
+    def stats(self):
+        sizes = sorted(self._sizes) or [0]
+        latencies = sorted(self._latencies) or [0]
+        return {
+            "pending": len(self),
+            "flushes": self.flushes,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flush_size_p50": statistics.median(sizes),
+            "flush_size_max": sizes[-1],
+            "flush_ms_p50": round(statistics.median(latencies) * 1000, 2),
+            "flush_ms_p99": round(latencies[int((len(latencies) - 1) * 0.99)] * 1000, 2),
+        }
+
+    def add(self, message):
+        """Queues the progress `message` earns its author. Returns whether it was queued."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        user_id = message.author.id
+        if user_id not in self._pending and len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return False
+        # Users earn progress once a cooldown, the latest message is where they are replied to
+        self._pending[user_id] = message
+        if len(self._pending) >= self.max_pending:
+            self._full.set()
+        return True
+
+    async def flush(self):
+        """Applies the pending progress, dispatching the hatches and level ups."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._full.clear()
+        start = time.perf_counter()
+        try:
+            async with self.bot.db[0].acquire() as pconn:
+                rows = await self.bot.queries.flush_activity(pconn, list(pending))
+        except Exception:
+            # One user's procedure failing would fail the batch, retry them one by one
+            self.bot.logger.warning("Failed to flush chat progress as a batch", exc_info=True)
+            rows = []
+            async with self.bot.db[0].acquire() as pconn:
+                for user_id in pending:
+                    try:
+                        rows.extend(await self.bot.queries.flush_activity(pconn, [user_id]))
+                    except Exception:
+                        self.failed += 1
+        self._latencies.append(time.perf_counter() - start)
+        self._sizes.append(len(pending))
+        self.flushes += 1
+        self.flushed += len(pending)
+        for user_id, hatched_party, hatched, leveled in rows:
+            if hatched_party or hatched or leveled:
+                self.bot.dispatch(
+                    "message_activity", pending[user_id], hatched_party, hatched, leveled
+                )
+
+    async def _run(self):
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._full.wait(), self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                self.bot.logger.exception("Failed to flush chat progress")
+
+    async def close(self):
+        """Stops flushing on a timer and flushes what is pending."""
+        if self._task is not None:
+            self._task.cancel()
+        with contextlib.suppress(Exception):
+            await self.flush()
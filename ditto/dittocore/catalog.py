@@ -0,0 +1,185 @@
+import asyncio
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from dittocogs.json_files import PMOVES
+from dittocore.dex_index import DexIndex
+from dittocore.learnsets import Learnsets
+from dittocore.sprites import SpriteIndex
+from dittocore.type_chart import TypeChart
+from pokemon_utils.evolution import EvolutionGraph
+
+
+class Catalog:
+    """
+    In-memory copy of the static pokedex collections in mongo.
+
+    The collections below never change while a cluster is running, so they are read
+    once (one bulk `find` per collection) and indexed into dicts, turning the
+    per-call `find_one` round-trips into O(1) lookups.
+
+    Documents returned by the lookups are shared between every caller.
+    Copy them before mutating.
+    """
+
+    COLLECTIONS = (
+        "forms",
+        "pfile",
+        "ptypes",
+        "pokemon_stats",
+        "natures",
+        "stat_types",
+        "poke_abilities",
+        "abilities",
+        "items",
+        "moves",
+        "evofile",
+        "types",
+        "egg_groups",
+        "egg_groups_info",
+        "type_effectiveness",
+    )
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.loaded_at = None
+        self._build({name: [] for name in self.COLLECTIONS})
+
+    async def load(self):
+        """(Re)loads every collection from mongo, swapping the indexes in at once."""
+        start = time.monotonic()
+        docs = await asyncio.gather(
+            *(self.bot.db[1][name].find({}).to_list(None) for name in self.COLLECTIONS)
+        )
+        data = dict(zip(self.COLLECTIONS, docs))
+        data["pokemon_moves"] = PMOVES
+        self._build(data)
+        self.loaded_at = time.time()
+        if self.evolutions.missing:
+            self.bot.logger.warning(
+                f"An evofile does not exist for some pokes - {', '.join(self.evolutions.missing)}"
+            )
+        self.bot.logger.info(
+            f"Loaded pokedex catalog in {round((time.monotonic() - start) * 1000)}ms"
+        )
+
+    def _build(self, data):
+        # `find_one` returns the first document in natural order, so the first one wins on duplicate keys.
+        self._forms = _index(data["forms"], "identifier")
+        self._forms_by_order = _index(data["forms"], "order")
+        self._forms_by_pokemon = _group(data["forms"], "pokemon_id")
+        self._form_identifiers = sorted(k for k in self._forms if k is not None)
+        self._pfile = _index(data["pfile"], "id")
+        self._pfile_by_identifier = _index(data["pfile"], "identifier")
+        self._pfile_by_evolves_from = _group(data["pfile"], "evolves_from_species_id")
+        self._ptypes = _index(data["ptypes"], "id")
+        self._stats = _index(data["pokemon_stats"], "pokemon_id")
+        self._natures = _index(data["natures"], "identifier")
+        self._stat_types = _index(data["stat_types"], "id")
+        self._abilities = _group(data["poke_abilities"], "pokemon_id")
+        self._ability_pokemon = _group(data["poke_abilities"], "ability_id")
+        self._ability_info = _index(data["abilities"], "identifier")
+        self._items = _index(data["items"], "identifier")
+        self._items_by_id = _index(data["items"], "id")
+        self._moves = _index(data["moves"], "identifier")
+        self._moves_by_id = _index(data["moves"], "id")
+        self._evofile = _index(data["evofile"], "evolved_species_id")
+        self.sprites = SpriteIndex(data["forms"])
+        self.evolutions = EvolutionGraph(data["pfile"], data["evofile"], self._moves_by_id)
+        self.type_chart = TypeChart(data["type_effectiveness"])
+        self.learnsets = Learnsets(data.get("pokemon_moves", {}), data["moves"])
+        self.index = DexIndex(
+            data["forms"],
+            data["ptypes"],
+            data["types"],
+            data["egg_groups"],
+            data["egg_groups_info"],
+            data["pfile"],
+        )
+
+    @property
+    def loaded(self):
+        return self.loaded_at is not None
+
+    def form(self, identifier):
+        return self._forms.get(identifier)
+
+    def form_by_order(self, order):
+        return self._forms_by_order.get(order)
+
+    def forms_of(self, pokemon_id):
+        return self._forms_by_pokemon.get(pokemon_id, [])
+
+    def forms_with_prefix(self, prefix):
+        """Returns every form identifier starting with `prefix`, in sorted order."""
+        identifiers = self._form_identifiers
+        result = []
+        for i in range(bisect_left(identifiers, prefix), len(identifiers)):
+            if not identifiers[i].startswith(prefix):
+                break
+            result.append(identifiers[i])
+        return result
+
+    def pfile(self, species_id):
+        return self._pfile.get(species_id)
+
+    def pfile_by_identifier(self, identifier):
+        return self._pfile_by_identifier.get(identifier)
+
+    def evolutions_of(self, species_id):
+        """Returns the pfile docs of every species that evolves from `species_id`."""
+        return self._pfile_by_evolves_from.get(species_id, [])
+
+    def ptypes(self, pokemon_id):
+        return self._ptypes.get(pokemon_id)
+
+    def stats(self, pokemon_id):
+        return self._stats.get(pokemon_id)
+
+    def nature(self, identifier):
+        return self._natures.get(identifier)
+
+    def stat_type(self, stat_id):
+        return self._stat_types.get(stat_id)
+
+    def ability_ids(self, pokemon_id):
+        """Returns the ability ids of a pokemon, in the order `ability_index` refers to."""
+        return [doc["ability_id"] for doc in self._abilities.get(pokemon_id, [])]
+
+    def ability(self, identifier):
+        return self._ability_info.get(identifier)
+
+    def pokemon_with_ability(self, ability_id):
+        """Returns the ids of every pokemon that can have the ability `ability_id`."""
+        return [doc["pokemon_id"] for doc in self._ability_pokemon.get(ability_id, [])]
+
+    def item(self, identifier):
+        return self._items.get(identifier)
+
+    def item_by_id(self, item_id):
+        return self._items_by_id.get(item_id)
+
+    def move(self, identifier):
+        return self._moves.get(identifier)
+
+    def move_by_id(self, move_id):
+        return self._moves_by_id.get(move_id)
+
+    def evo(self, evolved_species_id):
+        """Returns the evofile doc describing how to evolve into `evolved_species_id`."""
+        return self._evofile.get(evolved_species_id)
+
+
+def _index(docs, key):
+    result = {}
+    for doc in docs:
+        result.setdefault(doc.get(key), doc)
+    return result
+
+
+def _group(docs, key):
+    result = defaultdict(list)
+    for doc in docs:
+        result[doc.get(key)].append(doc)
+    return dict(result)
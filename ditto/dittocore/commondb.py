@@ -4,6 +4,8 @@ import discord
 from dittocogs.pokemon_list import natlist
 from utils.misc import get_emoji
 
+from dittocore.queries import POKE_COLUMNS
+
 
 class UserNotStartedError(Exception):
     """
@@ -28,34 +30,40 @@ class CommonDB:
 
     async def remove_poke(self, user_id: int, poke_id: int, delete: bool = False):
         """
-        Helper func to remove a pokemon from a user's array.
+        Helper func to take a pokemon away from a user.
 
         This func handles de-selecting the pokemon and removing it from the user's party.
         """
         async with self.bot.db[0].acquire() as pconn:
-            data = await pconn.fetchrow(
-                "SELECT pokes, selected, party FROM users WHERE u_id = $1", user_id
-            )
-            if data is None:
-                raise UserNotStartedError
-            pokes, selected, party = data
-            if poke_id not in pokes:
-                return
-            selected = None if selected == poke_id else selected
-            party = [0 if p == poke_id else p for p in party]
-            await pconn.execute(
-                "UPDATE users SET pokes = array_remove(pokes, $2), selected = $3, party = $4 WHERE u_id = $1",
-                user_id,
-                poke_id,
-                selected,
-                party,
-            )
-            if delete:
-                await pconn.execute("DELETE FROM pokes WHERE id = $1", poke_id)
-            else:
-                await pconn.execute(
-                    "UPDATE pokes SET fav = false WHERE id = $1", poke_id
+            async with pconn.transaction():
+                data = await pconn.fetchrow(
+                    "SELECT selected, party FROM users WHERE u_id = $1 FOR UPDATE",
+                    user_id,
                 )
+                if data is None:
+                    raise UserNotStartedError
+                if delete:
+                    removed = await pconn.fetchval(
+                        "DELETE FROM pokes WHERE id = $1 AND owner = $2 RETURNING id",
+                        poke_id,
+                        user_id,
+                    )
+                else:
+                    removed = await pconn.fetchval(
+                        "UPDATE pokes SET owner = NULL, fav = false WHERE id = $1 AND owner = $2 RETURNING id",
+                        poke_id,
+                        user_id,
+                    )
+                if removed is None:
+                    return
+                selected, party = data
+                if selected == poke_id or poke_id in party:
+                    await pconn.execute(
+                        "UPDATE users SET selected = $2, party = $3 WHERE u_id = $1",
+                        user_id,
+                        None if selected == poke_id else selected,
+                        [0 if p == poke_id else p for p in party],
+                    )
 
     async def shadow_hunt_check(self, user_id: int, pokemon: str):
         """
@@ -84,38 +92,22 @@ class CommonDB:
                 )
         return make_shadow
 
-    async def create_poke(
-        self,
-        bot,
-        user_id: int,
-        pokemon: str,
-        *,
-        boosted: bool = False,
-        radiant: bool = False,
-        shiny: bool = False,
-        skin: str = None,
-        gender: str = None,
-        level: int = 1,
-    ):
+    def _roll_poke(self, bot, user_id, pokemon, *, boosted, radiant, shiny, gender, level):
         """
-        Creates a poke and gives it to user.
+        Rolls the IVs, nature, gender and ability of a new poke.
 
-        Returns a Pokemon object if the poke was created, and None otherwise.
+        Returns the values of every POKE_COLUMNS column but skin, the gender and the IV sum,
+        or None if the poke has no gender rate.
         """
-        form_info = await bot.db[1].forms.find_one({"identifier": pokemon.lower()})
-        pokemon_info = await bot.db[1].pfile.find_one({"id": form_info["pokemon_id"]})
+        form_info = bot.catalog.form(pokemon.lower())
+        pokemon_info = bot.catalog.pfile(form_info["pokemon_id"])
         try:
             gender_rate = pokemon_info["gender_rate"]
         except Exception:
             bot.logger.warn(f'No Gender Rate for {pokemon_info["identifier"]}')
             return None
 
-        ab_ids = (
-            await bot.db[1]
-            .poke_abilities.find({"pokemon_id": form_info["pokemon_id"]})
-            .to_list(length=3)
-        )
-        ab_ids = [doc["ability_id"] for doc in ab_ids]
+        ab_ids = bot.catalog.ability_ids(form_info["pokemon_id"])[:3]
 
         min_iv = 12 if boosted else 1
         max_iv = 31 if boosted or random.randint(0, 1) else 29
@@ -145,29 +137,6 @@ class CommonDB:
             else:
                 gender = "-m"
 
-        if skin:
-            shiny = False
-            radiant = False
-            skin = skin.lower()
-        elif radiant:
-            shiny = False
-        elif not shiny:
-            override_with_shadow = await self.shadow_hunt_check(user_id, pokemon)
-            if override_with_shadow:
-                skin = "shadow"
-                await bot.get_partial_messageable(1005737655025291334).send(
-                    f"`{user_id} - {pokemon}`"
-                )
-        emoji = get_emoji(
-            shiny=shiny,
-            radiant=radiant,
-            skin=skin,
-        )
-        query2 = """
-                INSERT INTO pokes (pokname, hpiv, atkiv, defiv, spatkiv, spdefiv, speediv, hpev, atkev, defev, spatkev, spdefev, speedev, pokelevel, moves, hitem, exp, nature, expcap, poknick, shiny, price, market_enlist, fav, ability_index, gender, caught_by, radiant, skin)
-
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28, $29) RETURNING id
-                """
         args = (
             pokemon.capitalize(),
             hpiv,
@@ -197,18 +166,120 @@ class CommonDB:
             gender,
             user_id,
             radiant,
-            skin,
         )
+        return args, gender, sum((hpiv, atkiv, defiv, spaiv, spdiv, speiv))
+
+    async def create_poke(
+        self,
+        bot,
+        user_id: int,
+        pokemon: str,
+        *,
+        boosted: bool = False,
+        radiant: bool = False,
+        shiny: bool = False,
+        skin: str = None,
+        gender: str = None,
+        level: int = 1,
+    ):
+        """
+        Creates a poke and gives it to user.
+
+        Returns a Pokemon object if the poke was created, and None otherwise.
+        """
+        if skin:
+            shiny = False
+            radiant = False
+            skin = skin.lower()
+        elif radiant:
+            shiny = False
+        rolled = self._roll_poke(
+            bot,
+            user_id,
+            pokemon,
+            boosted=boosted,
+            radiant=radiant,
+            shiny=shiny,
+            gender=gender,
+            level=level,
+        )
+        if rolled is None:
+            return None
+        args, gender, iv_sum = rolled
+
+        if not (skin or radiant or shiny):
+            override_with_shadow = await self.shadow_hunt_check(user_id, pokemon)
+            if override_with_shadow:
+                skin = "shadow"
+                await bot.get_partial_messageable(1005737655025291334).send(
+                    f"`{user_id} - {pokemon}`"
+                )
+        emoji = get_emoji(
+            shiny=shiny,
+            radiant=radiant,
+            skin=skin,
+        )
+        query2 = f"""
+                INSERT INTO pokes ({POKE_COLUMNS}, owner)
+
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28, $29, $27) RETURNING id
+                """
         async with bot.db[0].acquire() as pconn:
-            pokeid = await pconn.fetchval(query2, *args)
-            await pconn.execute(
-                "UPDATE users SET pokes = array_append(pokes, $2) WHERE u_id = $1",
-                user_id,
-                pokeid,
+            pokeid = await pconn.fetchval(query2, *args, skin)
+        return Pokemon(pokeid, gender, iv_sum, emoji)
+
+    async def settle_catch(
+        self,
+        user_id: int,
+        pokemon: str,
+        *,
+        shiny: bool = False,
+        boosted: bool = False,
+        level: int = 1,
+        item: str = None,
+        chest: str = None,
+        credits: int = 0,
+    ):
+        """
+        Gives a caught spawn and its drops to a user.
+
+        Every postgres effect of the catch, the poke, the shadow hunt roll, the
+        dropped item and chest, credits and achievements, is applied by a single
+        statement, so a catch is applied entirely or not at all. The catch count
+        in the mongo progress is only incremented once that statement gave the poke.
+
+        Returns a Pokemon object, or None if the user has not started.
+        """
+        rolled = self._roll_poke(
+            self.bot,
+            user_id,
+            pokemon,
+            boosted=boosted,
+            radiant=False,
+            shiny=shiny,
+            gender=None,
+            level=level,
+        )
+        if rolled is None:
+            return None
+        args, gender, iv_sum = rolled
+        async with self.bot.db[0].acquire() as pconn:
+            row = await self.bot.queries.settle_catch(
+                pconn, [*args, not shiny, item, chest, credits]
             )
-        return Pokemon(
-            pokeid, gender, sum((hpiv, atkiv, defiv, spaiv, spdiv, speiv)), emoji
+        if row is None:
+            return None
+        await self.bot.db[1].users.update_one(
+            {"user": user_id},
+            {"$inc": {"progress.catch-count": 1}},
+            upsert=True,
         )
+        if row["skin"] == "shadow":
+            await self.bot.get_partial_messageable(1005737655025291334).send(
+                f"`{user_id} - {pokemon}`"
+            )
+        emoji = get_emoji(shiny=shiny, radiant=False, skin=row["skin"])
+        return Pokemon(row["id"], gender, iv_sum, emoji)
 
     class TradeLock:
         """
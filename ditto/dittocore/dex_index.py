@@ -0,0 +1,108 @@
+from collections import defaultdict
+
+
+class DexIndex:
+    """
+    Inverted indexes over the pokedex, built alongside the catalog.
+
+    Maps type ids to form identifiers, egg groups to species and forms, and
+    evolution chains to their species, so "which pokemon have X" questions are
+    dict lookups and set operations instead of chained collection queries.
+
+    Every identifier returned is lowercase, callers apply their own casing.
+    """
+
+    def __init__(self, forms, ptypes, types, egg_groups, egg_groups_info, pfile):
+        forms_by_pokemon = defaultdict(set)
+        for doc in forms:
+            forms_by_pokemon[doc["pokemon_id"]].add(doc["identifier"])
+        self._forms_by_pokemon = dict(forms_by_pokemon)
+
+        self._types = {}
+        self._types_by_id = {}
+        for doc in types:
+            self._types.setdefault(doc["identifier"], doc)
+            self._types_by_id.setdefault(doc["id"], doc)
+        self._type_forms = defaultdict(set)
+        for doc in ptypes:
+            for type_id in doc["types"]:
+                self._type_forms[type_id] |= self._forms_by_pokemon.get(doc["id"], set())
+        self._type_forms = {k: frozenset(v) for k, v in self._type_forms.items()}
+
+        self._egg_groups_info = {}
+        self._egg_groups_info_by_id = {}
+        for doc in egg_groups_info:
+            self._egg_groups_info.setdefault(doc["identifier"], doc)
+            self._egg_groups_info_by_id.setdefault(doc["id"], doc)
+        self._egg_groups = {}
+        self._egg_group_species = defaultdict(set)
+        for doc in egg_groups:
+            self.add_egg_groups(doc["species_id"], doc["egg_groups"])
+
+        self._chains = defaultdict(set)
+        for doc in pfile:
+            self._chains[doc["evolution_chain_id"]].add(doc["identifier"])
+        self._chains = {k: frozenset(v) for k, v in self._chains.items()}
+
+    def type(self, identifier):
+        """Returns the types doc named `identifier`."""
+        return self._types.get(identifier)
+
+    def type_by_id(self, type_id):
+        return self._types_by_id.get(type_id)
+
+    def egg_group(self, identifier):
+        """Returns the egg_groups_info doc named `identifier`."""
+        return self._egg_groups_info.get(identifier)
+
+    def egg_group_by_id(self, egg_group_id):
+        return self._egg_groups_info_by_id.get(egg_group_id)
+
+    def egg_groups(self, species_id):
+        """Returns the egg group ids of a species, or None if it has no egg_groups doc."""
+        return self._egg_groups.get(species_id)
+
+    def add_egg_groups(self, species_id, egg_groups):
+        """Registers the egg groups of a species that did not have an egg_groups doc yet."""
+        if species_id in self._egg_groups:
+            return
+        self._egg_groups[species_id] = egg_groups
+        for egg_group_id in egg_groups:
+            self._egg_group_species[egg_group_id].add(species_id)
+
+    def type_forms(self, type_id):
+        """Returns the identifiers of every form with type `type_id`."""
+        return self._type_forms.get(type_id, frozenset())
+
+    def egg_group_forms(self, egg_group_id):
+        """Returns the identifiers of the forms whose pokemon_id is a species in the egg group."""
+        forms = set()
+        for species_id in self._egg_group_species.get(egg_group_id, ()):
+            forms |= self._forms_by_pokemon.get(species_id, set())
+        return forms
+
+    def chain(self, chain_id):
+        """Returns the identifiers of every species in an evolution chain."""
+        return self._chains.get(chain_id, frozenset())
+
+    def forms(self, *, types=(), egg_groups=(), chains=()):
+        """
+        Returns the identifiers matching every given key.
+
+        The ids within one key are OR'd together and the keys are AND'd, so
+        `forms(types=[10, 11], egg_groups=[1])` is "fire or water, and monster".
+        Chains match species identifiers, which are also the default form's identifier.
+        """
+        result = None
+        for ids, lookup in (
+            (types, self.type_forms),
+            (egg_groups, self.egg_group_forms),
+            (chains, self.chain),
+        ):
+            if not ids:
+                continue
+            matches = set()
+            for i in ids:
+                matches |= lookup(i)
+            result = matches if result is None else result & matches
+        return result or set()
@@ -25,9 +25,18 @@ from utils.misc import EnableCommandsView, get_prefix
 from motor.core import AgnosticClient
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from dittocogs.json_files import Dataset, DATASETS, loaded_datasets, preload_datasets
+from dittocore.activity import ActivityBatcher
+from dittocore.catalog import Catalog
 from dittocore.commondb import CommonDB
 from dittocore.dna_misc import DittoMisc
+from dittocore.encyclopedia import Encyclopedia
+from dittocore.guild_settings import GuildSettings
+from dittocore.honey import HoneyIndex
+from dittocore.inventory import Inventories
+from dittocore.queries import STATEMENT_CACHE_SIZE, Queries
 from dittocore.redis_handler import RedisHandler
+from dittocore.spawns import CatchDispatcher
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
@@ -68,6 +77,13 @@ class Ditto(commands.AutoShardedBot):
         )
         self.misc = DittoMisc(self)
         self.commondb = CommonDB(self)
+        self.catalog = Catalog(self)
+        self.catches = CatchDispatcher(self)
+        self.guild_settings = GuildSettings(self)
+        self.honey = HoneyIndex(self)
+        self.activity = ActivityBatcher(self)
+        self.queries = Queries(self)
+        self.inventories = Inventories(self)
         airbrake_handler = pybrake.LoggingHandler(notifier=notifier, level=logging.WARN)
         self.logger = logging.getLogger("dittobot")
         self.logger.addHandler(airbrake_handler)
@@ -103,9 +119,10 @@ class Ditto(commands.AutoShardedBot):
         self.cluster = cluster_info
 
         for i in os.listdir(self.app_directory / "shared" / "data" / "pokemon_names"):
-            self.pokemon_names[i[:2]] = ujson.load(
-                open(self.app_directory / "shared" / "data" / "pokemon_names" / f"{i}")
-            )
+            self.pokemon_names[i[:2]] = Dataset(f"pokemon_names/{i}")
+        self.encyclopedia = Encyclopedia(
+            self.app_directory / "shared" / "encyclopedia.json"
+        )
         self.mongo_client = AsyncIOMotorClient(os.environ["MONGO_URL"])
         self.mongo_pokemon_db = self.mongo_client.pokemon
         self.db[1] = self.mongo_pokemon_db
@@ -134,6 +151,7 @@ class Ditto(commands.AutoShardedBot):
         self.owner = None
 
         self.initial_launch = True
+        self._preload = None
         self._clusters_ready = asyncio.Event()
 
         self.official_server = None
@@ -188,6 +206,18 @@ class Ditto(commands.AutoShardedBot):
         }
         await self.db[2].execute("PUBLISH", "dittobot_clusters", json.dumps(payload))
         if self.initial_launch:
+            # Kept until it finishes, the loop only holds tasks weakly
+            self._preload = asyncio.create_task(self.preload_datasets())
+            self._preload.add_done_callback(self._preloaded)
+            # Channels are only known once the guilds are, so honey waits for ready
+            await self.honey.load()
+            # Spawns left open by the last run of this cluster can still be caught
+            spawn = self.get_cog("Spawn")
+            if spawn is not None:
+                try:
+                    await spawn.restore()
+                except Exception:
+                    self.logger.exception("Failed to restore spawns")
             with contextlib.suppress(discord.HTTPException):
                 embed = discord.Embed(
                     title=f"[Cluster #{self.cluster['id']} ({self.cluster['name']})] Started successfully",
@@ -291,6 +321,7 @@ class Ditto(commands.AutoShardedBot):
             min_size=10,
             max_size=15,
             command_timeout=30,
+            statement_cache_size=STATEMENT_CACHE_SIZE,
             init=self.init_pg,
         )
         self.db[2] = await aioredis.create_pool(
@@ -300,7 +331,8 @@ class Ditto(commands.AutoShardedBot):
         #    OXI_DATABASE_URL, min_size=2, max_size=10, command_timeout=10, init=self.init
         # )
         await self.redis_manager.start()
-        await self.load_guild_settings()
+        await self.catalog.load()
+        self.encyclopedia.load()
         # await self.load_extensions()
         await self.load_bans()
         self.logger.info("Initialization Completed!")
@@ -327,6 +359,9 @@ class Ditto(commands.AutoShardedBot):
             await self.db[2].wait_closed()
 
     async def logout(self):
+        self.catches.stop()
+        self.honey.stop()
+        await self.activity.close()
         await self._async_del()
         await super().close()
 
@@ -496,12 +531,6 @@ class Ditto(commands.AutoShardedBot):
     def botbanned(self, id):
         return id in self.banned_users  # and (id not in (790722073248661525))
 
-    async def load_guild_settings(self):
-        self.guild_settings = {}
-        cursor = self.mongo_pokemon_db.guilds.find()
-        async for document in cursor:
-            self.guild_settings[document.pop("id")] = document
-
     async def pubsub_request(self, target_shard="all", **kwargs):
         if self.db[2]:
             request = {"target_shard": target_shard} | kwargs
@@ -516,6 +545,8 @@ class Ditto(commands.AutoShardedBot):
         if not result:
             await self.db[1][collection].insert_one({**filter, **update})
         result = await self.db[1][collection].update_one(filter, {"$set": update})
+        if collection == "guilds" and "id" in filter:
+            await self.guild_settings.publish_invalidate(filter["id"])
         return result
 
 
@@ -577,6 +608,31 @@ class Ditto(commands.AutoShardedBot):
                     txt += "\n" + f"Error unloading cog.{cog} - {str(e)}"
         await ctx.send(f"```css\n{txt}```", delete_after=5)
 
+    def log_import_report(self, report):
+        """Logs how long each cog took to import and set up, and which datasets it loaded."""
+        lines = []
+        for cog, elapsed, datasets in sorted(report, key=lambda r: r[1], reverse=True):
+            line = f"{cog}: {elapsed * 1000:.1f}ms"
+            if datasets:
+                loads = ", ".join(
+                    f"{name} {DATASETS[name].load_time * 1000:.1f}ms" for name in sorted(datasets)
+                )
+                line += f" (loaded {loads})"
+            lines.append(line)
+        total = sum(elapsed for _, elapsed, _ in report)
+        self.logger.info(f"Loaded cogs in {total * 1000:.1f}ms\n" + "\n".join(lines))
+
+    async def preload_datasets(self):
+        """Loads the datasets no cog has used yet, off the event loop."""
+        start = time.perf_counter()
+        await asyncio.get_running_loop().run_in_executor(None, preload_datasets)
+        self.logger.debug(f"Preloaded datasets in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    def _preloaded(self, task):
+        self._preload = None
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.exception("Failed to preload datasets", exc_info=task.exception())
+
     async def _run(self):
         self.logger.info("Launching...")
         # self.logger.info(f"Shards - {self.shards}\n{[self.get_shard(shard_id) for shard_id in self.shard_ids]}")
@@ -623,9 +679,16 @@ class Ditto(commands.AutoShardedBot):
                     "tutorial",
                 ]
 
+                report = []
                 for cog in safe_to_load:
+                    datasets = loaded_datasets()
+                    start = time.perf_counter()
                     await self.load_extension(f"dittocogs.{cog}")
+                    report.append(
+                        (cog, time.perf_counter() - start, loaded_datasets() - datasets)
+                    )
                 self.loaded_extensions = True
+                self.log_import_report(report)
 
                 async def check(ctx):
                     return await ctx.bot.check(ctx)
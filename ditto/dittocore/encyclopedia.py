@@ -0,0 +1,204 @@
+"""
+Local store of the move and ability text the lookup commands show.
+
+The stats of moves and abilities ship in shared/data, only their effect text,
+flavor text and learners came from PokeAPI on every lookup. That text is kept
+in a JSON dump on disk, indexed by identifier. Entries missing from the dump
+are fetched from PokeAPI the first time they are looked up and saved to it,
+and the whole dump can be refreshed out of band:
+
+    python -m dittocore.encyclopedia refresh [--base-url http://localhost:8000/api/v2]
+    python -m dittocore.encyclopedia import dump.json
+
+Run from the ditto directory, with DIRECTORY set to the app directory.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+
+import aiohttp
+
+POKEAPI_URL = os.environ.get("POKEAPI_URL", "https://pokeapi.co/api/v2")
+
+# Total seconds a lookup waits on PokeAPI for a missing entry before treating it as not found
+LOOKUP_TIMEOUT = 5
+
+
+def _english(entries, key):
+    result = []
+    for entry in entries:
+        if entry["language"]["name"] == "en" and entry[key] not in result:
+            result.append(entry[key])
+    return result
+
+
+def move_entry(data):
+    """Converts a PokeAPI move response into an encyclopedia entry."""
+    return {
+        "effects": _english(data["effect_entries"], "short_effect"),
+        "flavor_text": _english(data["flavor_text_entries"], "flavor_text"),
+        "pokemon": [p["name"] for p in data.get("learned_by_pokemon", [])],
+    }
+
+
+def ability_entry(data):
+    """Converts a PokeAPI ability response into an encyclopedia entry."""
+    return {
+        "effects": _english(data["effect_entries"], "short_effect"),
+        "flavor_text": _english(data["flavor_text_entries"], "flavor_text"),
+        "pokemon": [p["pokemon"]["name"] for p in data["pokemon"]],
+    }
+
+
+class Encyclopedia:
+    """Effect text, flavor text and learners of every move and ability, by identifier."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._moves = {}
+        self._abilities = {}
+
+    def __len__(self):
+        return len(self._moves) + len(self._abilities)
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, moves, abilities):
+        tmp = self.path.with_name(
+            f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"moves": moves, "abilities": abilities}, f)
+        os.replace(tmp, self.path)
+
+    def _merge(self, data):
+        """
+        Adds the entries of a dump the encyclopedia has no entry for, and returns copies of both stores.
+
+        The stores are updated in place, a refresh in flight keeps writing into them.
+        """
+        for store, entries in (
+            (self._moves, data.get("moves", {})),
+            (self._abilities, data.get("abilities", {})),
+        ):
+            for identifier, entry in entries.items():
+                store.setdefault(identifier, entry)
+        return dict(self._moves), dict(self._abilities)
+
+    def load(self):
+        """(Re)loads the dump from disk, an encyclopedia without a dump is just empty."""
+        data = self._read()
+        self._moves.clear()
+        self._moves.update(data.get("moves", {}))
+        self._abilities.clear()
+        self._abilities.update(data.get("abilities", {}))
+
+    def save(self):
+        """Writes the encyclopedia, merged over entries other clusters saved since it was loaded."""
+        self._write(*self._merge(self._read()))
+
+    def import_dump(self, data):
+        """Merges a dump, in the format `save` writes, into the encyclopedia."""
+        self._moves.update(data.get("moves", {}))
+        self._abilities.update(data.get("abilities", {}))
+
+    def move(self, identifier):
+        return self._moves.get(identifier)
+
+    def ability(self, identifier):
+        return self._abilities.get(identifier)
+
+    async def fetch_missing(self, *, moves=(), abilities=(), base_url=POKEAPI_URL):
+        """Fetches the given moves and abilities the encyclopedia has no entry for, and saves them."""
+        moves = [identifier for identifier in moves if identifier not in self._moves]
+        abilities = [identifier for identifier in abilities if identifier not in self._abilities]
+        if not moves and not abilities:
+            return
+        failed = await self.refresh(
+            moves, abilities, base_url=base_url, timeout=LOOKUP_TIMEOUT
+        )
+        if len(failed) < len(moves) + len(abilities):
+            # Only the file is touched off the loop, the stores are merged and copied on it
+            data = await asyncio.to_thread(self._read)
+            await asyncio.to_thread(self._write, *self._merge(data))
+
+    async def refresh(
+        self, moves, abilities, *, base_url=POKEAPI_URL, concurrency=8, timeout=300
+    ):
+        """
+        Fetches the entries of the given move and ability identifiers from a PokeAPI compatible server.
+
+        Identifiers that fail to fetch, or take over `timeout` seconds, keep their previous entry.
+        Returns the identifiers that failed.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        failed = []
+
+        async def fetch(session, kind, identifier, store, convert):
+            async with semaphore:
+                try:
+                    async with session.get(f"{base_url}/{kind}/{identifier}") as response:
+                        if response.status != 200:
+                            failed.append(identifier)
+                            return
+                        store[identifier] = convert(await response.json())
+                except (aiohttp.ClientError, asyncio.TimeoutError, KeyError):
+                    failed.append(identifier)
+
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as session:
+            await asyncio.gather(
+                *(fetch(session, "move", i, self._moves, move_entry) for i in moves),
+                *(
+                    fetch(session, "ability", i, self._abilities, ability_entry)
+                    for i in abilities
+                ),
+            )
+        return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the lookup encyclopedia dump.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    refresh = commands.add_parser("refresh", help="Fetch every move and ability.")
+    refresh.add_argument("--base-url", default=POKEAPI_URL)
+    refresh.add_argument("--concurrency", type=int, default=8)
+    dump = commands.add_parser("import", help="Merge a dump into the encyclopedia.")
+    dump.add_argument("dump")
+    args = parser.parse_args()
+
+    directory = Path(os.environ["DIRECTORY"])
+    encyclopedia = Encyclopedia(directory / "shared" / "encyclopedia.json")
+    encyclopedia.load()
+    if args.command == "import":
+        with open(args.dump, encoding="utf-8") as f:
+            encyclopedia.import_dump(json.load(f))
+    else:
+        data = directory / "shared" / "data"
+        with open(data / "moves.json", encoding="utf-8") as f:
+            moves = [move["identifier"] for move in json.load(f)]
+        with open(data / "abilities.json", encoding="utf-8") as f:
+            abilities = [ability["identifier"] for ability in json.load(f)]
+        failed = asyncio.run(
+            encyclopedia.refresh(
+                moves, abilities, base_url=args.base_url, concurrency=args.concurrency
+            )
+        )
+        if failed:
+            print(f"Failed to fetch {len(failed)} entries: {', '.join(failed)}")
+    encyclopedia.save()
+    print(f"Saved {len(encyclopedia)} entries to {encyclopedia.path}")
+
+
+if __name__ == "__main__":
+    main()
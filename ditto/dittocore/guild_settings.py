@@ -0,0 +1,89 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+
+class GuildSettings:
+    """
+    Per-guild cache of the mongo guilds documents.
+
+    Guilds are loaded the first time they are read and the least recently used
+    are dropped past `maxsize`, guilds without a document are cached as None.
+    Writes go through `Ditto.mongo_update`, which drops the guild on every
+    cluster over Redis, `ttl` only bounds how stale a missed invalidation can get.
+
+    The documents returned are shared, callers must not mutate them.
+    """
+
+    def __init__(self, bot, *, maxsize=10000, ttl=3600):
+        self.bot = bot
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache = OrderedDict()
+        self._loading = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, guild_id):
+        return guild_id in self._cache
+
+    async def get(self, guild_id, default=None):
+        """Returns the settings document of a guild, or `default` if it has none."""
+        entry = self._cache.get(guild_id)
+        if entry is not None and time.monotonic() < entry[1]:
+            self._cache.move_to_end(guild_id)
+            self.hits += 1
+            return default if entry[0] is None else entry[0]
+        self.misses += 1
+        # Concurrent misses on the same guild share a single read
+        task = self._loading.get(guild_id)
+        if task is None:
+            task = asyncio.create_task(self._load(guild_id))
+            self._loading[guild_id] = task
+            task.add_done_callback(lambda t: self._loaded(guild_id, t))
+        document = await asyncio.shield(task)
+        return default if document is None else document
+
+    async def _load(self, guild_id):
+        document = await self.bot.db[1].guilds.find_one({"id": guild_id})
+        # Tagged with the load that wrote it, so an invalidation only evicts its own entry
+        self._cache[guild_id] = (
+            document,
+            time.monotonic() + self.ttl,
+            asyncio.current_task(),
+        )
+        self._cache.move_to_end(guild_id)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return document
+
+    def _loaded(self, guild_id, task):
+        # An invalidation may already have replaced this load with a newer one
+        if self._loading.get(guild_id) is task:
+            del self._loading[guild_id]
+
+    def _evict(self, guild_id, task):
+        entry = self._cache.get(guild_id)
+        if entry is not None and entry[2] is task:
+            del self._cache[guild_id]
+
+    def invalidate(self, guild_id):
+        """Drops a guild from this cluster's cache."""
+        self._cache.pop(guild_id, None)
+        # A read in flight may have fetched the document before the write
+        task = self._loading.pop(guild_id, None)
+        if task is not None:
+            task.add_done_callback(lambda t: self._evict(guild_id, t))
+
+    async def publish_invalidate(self, guild_id):
+        """Drops a guild from the cache of every cluster."""
+        self.invalidate(guild_id)
+        await self.bot.redis_manager.notify(
+            "invalidate_guild_settings", {"guild_id": guild_id}
+        )
+
+    def clear(self):
+        self._cache.clear()
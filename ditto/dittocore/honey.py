@@ -0,0 +1,175 @@
+import asyncio
+import contextlib
+import heapq
+import time
+from collections import defaultdict
+
+import discord
+
+HONEY_NAMES = {"honey": "Honey", "ghost": "Ghost Detector", "cheer": "Christmas Cheer"}
+
+
+class Honey:
+    """A honey spread in a channel."""
+
+    __slots__ = ("id", "channel", "owner", "type", "expires")
+
+    def __init__(self, id, channel, owner, type, expires):
+        self.id = id
+        self.channel = channel
+        self.owner = owner
+        self.type = type
+        self.expires = expires
+
+    @property
+    def expired(self):
+        return self.expires <= time.time()
+
+
+class HoneyIndex:
+    """
+    The honey spread in this cluster's channels, kept in memory.
+
+    Spawns check honey on every spawn, this answers those from a dict instead
+    of the honey table. Expiry is scheduled on a heap, due honey is deleted in
+    a single statement and every owner gets one DM for all of their spreads.
+
+    Rows are only loaded for channels this cluster can see, honey is spread
+    from the channel it applies to, so it is always written by its own cluster.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._channels = {}
+        self._heap = []
+        self._changed = asyncio.Event()
+        self._task = None
+
+    def __len__(self):
+        return len(self._channels)
+
+    def get(self, channel_id):
+        """Returns the unexpired Honey of a channel, or None."""
+        honey = self._channels.get(channel_id)
+        if honey is None or honey.expired:
+            return None
+        return honey
+
+    async def load(self):
+        """(Re)loads the honey of every channel this cluster can see."""
+        async with self.bot.db[0].acquire() as pconn:
+            rows = await pconn.fetch("SELECT id, channel, owner, type, expires FROM honey")
+        self._channels = {}
+        self._heap = []
+        for row in rows:
+            if self.bot.get_channel(row["channel"]) is None:
+                continue
+            self._add(Honey(row["id"], row["channel"], row["owner"], row["type"], row["expires"]))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._expire_loop())
+        self._changed.set()
+
+    async def spread(self, channel_id, owner, honey_type, *, duration=60 * 60):
+        """
+        Spreads honey in a channel for `duration` seconds.
+
+        Returns the new Honey, or None if the channel already has some.
+        """
+        if self.get(channel_id) is not None:
+            return None
+        expires = int(time.time() + duration)
+        async with self.bot.db[0].acquire() as pconn:
+            honey_id = await pconn.fetchval(
+                "INSERT INTO honey (channel, expires, owner, type) VALUES ($1, $2, $3, $4) RETURNING id",
+                channel_id,
+                expires,
+                owner,
+                honey_type,
+            )
+        honey = Honey(honey_id, channel_id, owner, honey_type, expires)
+        self._add(honey)
+        self._changed.set()
+        return honey
+
+    def _add(self, honey):
+        self._channels[honey.channel] = honey
+        heapq.heappush(self._heap, (honey.expires, honey.id, honey))
+
+    def _pop_due(self):
+        due = []
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, honey = heapq.heappop(self._heap)
+            # Skip entries replaced since they were scheduled
+            if self._channels.get(honey.channel) is honey:
+                del self._channels[honey.channel]
+                due.append(honey)
+        return due
+
+    async def _expire_loop(self):
+        while True:
+            self._changed.clear()
+            delay = self._heap[0][0] - time.time() if self._heap else None
+            if delay is None or delay > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._changed.wait(), delay)
+                continue
+            due = self._pop_due()
+            if not due:
+                continue
+            try:
+                async with self.bot.db[0].acquire() as pconn:
+                    await pconn.execute(
+                        "DELETE FROM honey WHERE id = ANY($1)", [h.id for h in due]
+                    )
+                await self.notify_expired(due)
+            except Exception:
+                self.bot.logger.exception("Failed to expire honey")
+
+    async def sweep(self, grace=10 * 60):
+        """
+        Deletes honey that expired over `grace` seconds ago, and notifies the owners.
+
+        Catches spreads in channels no cluster has loaded, such as channels of guilds the bot left.
+        """
+        async with self.bot.db[0].acquire() as pconn:
+            rows = await pconn.fetch(
+                "DELETE FROM honey WHERE expires < $1 RETURNING id, channel, owner, type, expires",
+                int(time.time() - grace),
+            )
+        await self.notify_expired(
+            [Honey(r["id"], r["channel"], r["owner"], r["type"], r["expires"]) for r in rows]
+        )
+
+    async def notify_expired(self, expired, *, concurrency=5):
+        """DMs every owner once about all of their expired spreads."""
+        by_owner = defaultdict(list)
+        for honey in expired:
+            by_owner[honey.owner].append(honey)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def notify(owner_id, spreads):
+            async with semaphore:
+                with contextlib.suppress(discord.HTTPException):
+                    owner = self.bot.get_user(owner_id) or await self.bot.fetch_user(
+                        owner_id
+                    )
+                    description = "\n".join(
+                        f"Your {HONEY_NAMES.get(h.type, h.type)} spread in <#{h.channel}> has expired!"
+                        for h in spreads
+                    )
+                    await owner.send(
+                        embed=discord.Embed(
+                            title="Your spread has expired!"
+                            if len(spreads) == 1
+                            else f"{len(spreads)} of your spreads have expired!",
+                            description=f"{description}\nSpread some more with `/spread`.",
+                            color=0xFFB6C1,
+                        )
+                    )
+
+        await asyncio.gather(*(notify(o, s) for o, s in by_owner.items()))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
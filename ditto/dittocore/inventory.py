@@ -0,0 +1,109 @@
+# users columns holding a json object of item name -> count
+COLUMNS = ("inventory", "items", "holidayinv")
+
+# The stored count of d.key, rounded, and 0 for a count that isn't a number
+COUNT = """
+CASE WHEN jsonb_typeof({column}::jsonb -> d.key) = 'number'
+THEN round(({column}::jsonb ->> d.key)::numeric)::bigint ELSE 0 END
+"""
+
+# $1 the user, $2 and $3 the keys and their deltas. The row is only updated,
+# and the new object returned, if no negative delta takes a count below 0.
+APPLY = """
+UPDATE users SET {column} = COALESCE({column}::jsonb, '{{}}') || COALESCE((
+    SELECT jsonb_object_agg(d.key, {count} + d.delta)
+    FROM unnest($2::text[], $3::int[]) AS d(key, delta)
+), '{{}}')
+WHERE u_id = $1 AND NOT EXISTS (
+    SELECT 1 FROM unnest($2::text[], $3::int[]) AS d(key, delta)
+    WHERE d.delta < 0 AND {count} + d.delta < 0
+)
+RETURNING {column}::json
+"""
+
+# $1 the user, $2 an object of keys to overwrite
+SET = """
+UPDATE users SET {column} = COALESCE({column}::jsonb, '{{}}') || $2::json::jsonb
+WHERE u_id = $1
+RETURNING {column}::json
+"""
+
+# $1 the user, whose row stays locked until the transaction ends
+LOCK = "SELECT {column}::json FROM users WHERE u_id = $1 FOR UPDATE"
+
+STATEMENTS = {
+    **{
+        f"{column}_apply": APPLY.format(
+            column=column, count=COUNT.format(column=column).strip()
+        )
+        for column in COLUMNS
+    },
+    **{f"{column}_set": SET.format(column=column) for column in COLUMNS},
+    **{f"{column}_lock": LOCK.format(column=column) for column in COLUMNS},
+}
+
+
+class Inventories:
+    """
+    Atomic updates to the counts in a user's `inventory`, `items` or `holidayinv`.
+
+    Reading the object, changing it in Python and writing all of it back cost
+    two round trips and lost concurrent changes, like a chest dropped while
+    another was being opened. Every change here is one statement that adds
+    to the stored counts, so concurrent changes all apply.
+
+    Methods take a connection acquired from `bot.db[0]` and return the
+    updated object, or None if the user has not started or, for a change that
+    takes, does not have enough.
+
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def apply(self, pconn, user_id: int, deltas: dict, *, column: str = "inventory"):
+        """
+        Adds every key -> delta of `deltas` at once, or none of them if a count would go below 0.
+
+        Counts that aren't whole numbers are rounded, and counts that aren't numbers count as 0.
+        Empty `deltas` return an empty object without a query.
+        """
+        if column not in COLUMNS:
+            raise ValueError(f"{column} is not an inventory column.")
+        if not deltas:
+            return {}
+        return await self.bot.queries.run(
+            pconn,
+            f"{column}_apply",
+            "fetchval",
+            user_id,
+            list(deltas),
+            list(deltas.values()),
+        )
+
+    async def add(self, pconn, user_id: int, key: str, amount: int = 1, *, column: str = "inventory"):
+        """Gives a user `amount` of `key`."""
+        return await self.apply(pconn, user_id, {key: amount}, column=column)
+
+    async def take(self, pconn, user_id: int, key: str, amount: int = 1, *, column: str = "inventory"):
+        """Takes `amount` of `key` from a user, if they have that many."""
+        return await self.apply(pconn, user_id, {key: -amount}, column=column)
+
+    async def lock(self, pconn, user_id: int, *, column: str = "inventory"):
+        """
+        Returns the object of a user, or None, locking their row until the transaction ends.
+
+        A change that depends on the counts beyond "enough", like one clamped
+        to a cap, computes its deltas from this object in the transaction that
+        applies them, so no concurrent change lands in between. Anything slow,
+        like messaging the user, belongs after the transaction.
+        """
+        if column not in COLUMNS:
+            raise ValueError(f"{column} is not an inventory column.")
+        return await self.bot.queries.run(pconn, f"{column}_lock", "fetchval", user_id)
+
+    async def set(self, pconn, user_id: int, values: dict, *, column: str = "inventory"):
+        """Overwrites the keys of `values`, leaving the rest of the object as is."""
+        if column not in COLUMNS:
+            raise ValueError(f"{column} is not an inventory column.")
+        return await self.bot.queries.run(pconn, f"{column}_set", "fetchval", user_id, values)
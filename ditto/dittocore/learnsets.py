@@ -0,0 +1,149 @@
+from bisect import bisect_left
+from collections import defaultdict
+from sys import intern
+
+# Moves which are not coded in the bot, smeargle cannot sketch these
+UNCODED_MOVE_IDS = {
+    266,
+    270,
+    476,
+    495,
+    502,
+    511,
+    597,
+    602,
+    603,
+    607,
+    622,
+    623,
+    624,
+    625,
+    626,
+    627,
+    628,
+    629,
+    630,
+    631,
+    632,
+    633,
+    634,
+    635,
+    636,
+    637,
+    638,
+    639,
+    640,
+    641,
+    642,
+    643,
+    644,
+    645,
+    646,
+    647,
+    648,
+    649,
+    650,
+    651,
+    652,
+    653,
+    654,
+    655,
+    656,
+    657,
+    658,
+    671,
+    695,
+    696,
+    697,
+    698,
+    699,
+    700,
+    701,
+    702,
+    703,
+    719,
+    723,
+    724,
+    725,
+    726,
+    727,
+    728,
+    811,
+    10001,
+    10002,
+    10003,
+    10004,
+    10005,
+    10006,
+    10007,
+    10008,
+    10009,
+    10010,
+    10011,
+    10012,
+    10013,
+    10014,
+    10015,
+    10016,
+    10017,
+    10018,
+}
+
+
+class Learnsets:
+    """
+    Learnset index built from pokemon_moves.json.
+
+    Maps every pokemon to its sorted, deduplicated learnable moves, with the move
+    docs resolved ahead of time, so listing or validating a pokemon's moves never
+    touches the database.
+
+    pokemon_moves.json only records which moves a pokemon can learn, not how or at
+    what level, so learnsets are not split by learn method.
+    """
+
+    def __init__(self, pokemon_moves, moves):
+        self._moves = {}
+        self._damaging_by_type = defaultdict(list)
+        for doc in moves:
+            if doc["identifier"] in self._moves:
+                continue
+            self._moves[doc["identifier"]] = doc
+            if doc["damage_class_id"] != 1:
+                self._damaging_by_type[doc["type_id"]].append(doc)
+
+        self._learnsets = {}
+        self._resolved = {}
+        for pokemon, learnset in pokemon_moves.items():
+            learnset = tuple(sorted({intern(move) for move in learnset}))
+            self._learnsets[intern(pokemon)] = learnset
+            for move in learnset:
+                if move not in self._resolved:
+                    # Moves are stored without apostrophes, and some variants,
+                    # like hidden-power-fire, only exist as their base move
+                    name = move.replace("'", "")
+                    self._resolved[move] = self._moves.get(name) or self._moves.get(
+                        name.rsplit("-", 1)[0]
+                    )
+        self._learnsets["smeargle"] = tuple(
+            sorted(k for k, v in self._moves.items() if v["id"] not in UNCODED_MOVE_IDS)
+        )
+        for move in self._learnsets["smeargle"]:
+            self._resolved.setdefault(move, self._moves[move])
+
+    def moves(self, pokemon):
+        """Returns the sorted identifiers of every move `pokemon` can learn, or None if it has no learnset."""
+        return self._learnsets.get(pokemon)
+
+    def can_learn(self, pokemon, move):
+        learnset = self._learnsets.get(pokemon, ())
+        i = bisect_left(learnset, move)
+        return i < len(learnset) and learnset[i] == move
+
+    def move_info(self, move):
+        """Returns the move doc a learnable move resolves to, or None if it is not in the moves collection."""
+        return self._resolved.get(move)
+
+    def damaging_moves(self, type_ids):
+        """Returns every physical or special move of one of `type_ids`."""
+        return [doc for type_id in type_ids for doc in self._damaging_by_type.get(type_id, [])]
@@ -0,0 +1,199 @@
+import asyncio
+from collections import OrderedDict
+
+IV_SUM = "COALESCE(atkiv,0) + COALESCE(defiv,0) + COALESCE(spatkiv,0) + COALESCE(spdefiv,0) + COALESCE(speediv,0) + COALESCE(hpiv,0)"
+EV_SUM = "COALESCE(atkev,0) + COALESCE(defev,0) + COALESCE(spatkev,0) + COALESCE(spdefev,0) + COALESCE(speedev,0) + COALESCE(hpev,0)"
+POKE_STATS = f"{IV_SUM} AS ivs, {EV_SUM} AS evs"
+
+# users.user_order, as set by /order, to the (sort key, descending) of a listing.
+# "kek" is the default, catch order, which is the `position` tiebreak alone.
+# Keys are compared as a row with the tiebreak, so they must not be NULL.
+USER_ORDERS = {
+    "iv": (IV_SUM, True),
+    "level": ("COALESCE(pokelevel,0)", True),
+    "ev": (EV_SUM, True),
+    "name": ("COALESCE(pokname,'')", True),
+    "kek": (None, False),
+}
+
+# The numbers of user $1's pokemon up to position $2, among ids $3
+NUMBERS = """
+SELECT id, num FROM (
+    SELECT id, row_number() OVER (ORDER BY position) AS num
+    FROM pokes WHERE owner = $1 AND position <= $2
+) numbered WHERE id = ANY($3)
+"""
+
+
+class KeysetPages:
+    """
+    Page source for MenuView that fetches a listing one page at a time.
+
+    Rows are sorted by `key` then the unique `tiebreak`, both in the same direction.
+    A page is fetched from the (key, tiebreak) of the last row of the page before
+    it, or of the first row of the page after it, so no page costs an OFFSET
+    over the ones before. The first and last pages are fetched from either end.
+
+    The page after the one viewed is read ahead in the background, and the last
+    `cache_size` pages stay rendered. `format_page(records, index)` returns
+    the description of a page, wrapped in a copy of `base_embed` like `pagify`.
+    """
+
+    def __init__(
+        self,
+        pool,
+        *,
+        table,
+        where,
+        args=(),
+        tiebreak,
+        key=None,
+        descending=False,
+        columns="*",
+        format_page,
+        base_embed,
+        per_page=15,
+        cache_size=4,
+        timeout=None,
+    ):
+        self.pool = pool
+        self.table = table
+        self.where = where
+        self.args = list(args)
+        self.tiebreak = tiebreak
+        self.key = key
+        self.descending = descending
+        self.columns = columns
+        self.format_page = format_page
+        self.base_embed = base_embed
+        self.per_page = per_page
+        self.cache_size = cache_size
+        self.timeout = timeout
+        self.count = None
+        self._pages = OrderedDict()
+        self._bounds = {}
+        self._loading = {}
+
+    def __len__(self):
+        # An empty listing still shows one empty page, like `pagify`
+        return max(1, -(-(self.count or 0) // self.per_page))
+
+    async def prepare(self):
+        """Counts the rows of the listing, once."""
+        if self.count is None:
+            async with self.pool.acquire() as pconn:
+                self.count = await pconn.fetchval(
+                    f"SELECT count(*) FROM {self.table} WHERE {self.where}",
+                    *self.args,
+                    timeout=self.timeout,
+                )
+
+    async def get_page(self, index):
+        page = self._pages.get(index)
+        if page is None:
+            task = self._loading.get(index) or self._load(index)
+            page = await task
+        else:
+            self._pages.move_to_end(index)
+        if index + 1 < len(self) and index + 1 not in self._pages and index + 1 not in self._loading:
+            self._read_ahead(index + 1)
+        return page
+
+    def _read_ahead(self, index):
+        task = self._loading[index] = asyncio.create_task(self._load(index))
+        # Read ahead is best effort, a failure is retried when the page is viewed
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _load(self, index):
+        try:
+            records = await self._fetch(index)
+            if records:
+                self._bounds[index] = (self._row_key(records[0]), self._row_key(records[-1]))
+            embed = self.base_embed.copy()
+            embed.description = self.format_page(records, index)
+            embed.set_footer(text=f"Page {index + 1}/{len(self)}")
+            self._pages[index] = embed
+            while len(self._pages) > self.cache_size:
+                self._pages.popitem(last=False)
+            return embed
+        finally:
+            self._loading.pop(index, None)
+
+    def _row_key(self, record):
+        return (record["_key"], record["_tie"]) if self.key is not None else (record["_tie"],)
+
+    async def _fetch(self, index):
+        last = len(self) - 1
+        if index == 0:
+            return await self._rows(None, forward=True, limit=self.per_page)
+        if index == last:
+            return await self._rows(
+                None, forward=False, limit=self.count - last * self.per_page
+            )
+        if index - 1 in self._bounds:
+            return await self._rows(self._bounds[index - 1][1], forward=True, limit=self.per_page)
+        if index + 1 in self._bounds:
+            return await self._rows(self._bounds[index + 1][0], forward=False, limit=self.per_page)
+        # Neither neighbour was viewed, which the menu's buttons can not lead to
+        return await self._rows(None, forward=True, limit=self.per_page, offset=index * self.per_page)
+
+    async def _rows(self, after, *, forward, limit, offset=0):
+        """Fetches `limit` rows past `after` in the listing's order, or before it when not `forward`."""
+        args = list(self.args)
+        sort = [self.key, self.tiebreak] if self.key is not None else [self.tiebreak]
+        # Walking backwards flips the direction, the rows are put back in order after
+        descending = self.descending == forward
+        where = self.where
+        if after is not None:
+            params = []
+            for value in after:
+                args.append(value)
+                params.append(f"${len(args)}")
+            where += f" AND ({', '.join(sort)}) {'<' if descending else '>'} ({', '.join(params)})"
+        order = ", ".join(f"{col} {'DESC' if descending else 'ASC'}" for col in sort)
+        key = f"{self.key} AS _key, " if self.key is not None else ""
+        query = (
+            f"SELECT {self.columns}, {key}{self.tiebreak} AS _tie FROM {self.table} "
+            f"WHERE {where} ORDER BY {order} LIMIT {int(limit)} OFFSET {int(offset)}"
+        )
+        async with self.pool.acquire() as pconn:
+            records = await pconn.fetch(query, *args, timeout=self.timeout)
+            records = await self.annotate(pconn, records)
+        return records if forward else records[::-1]
+
+    async def annotate(self, pconn, records):
+        """Hook to add to the records of a page before they are formatted."""
+        return records
+
+
+class OwnedPages(KeysetPages):
+    """
+    KeysetPages over the pokemon of user $1, in catch order unless a `key` is given.
+
+    Rows get `ivs`, `evs` and `num`, the number the pokemon has in its owner's box.
+    Numbers are counted in a window up to the page's furthest position, not over the whole box.
+    """
+
+    def __init__(self, pool, user_id, *, where="true", args=(), **kwargs):
+        super().__init__(
+            pool,
+            table="pokes",
+            where=f"owner = $1 AND {where}",
+            args=[user_id, *args],
+            tiebreak="position",
+            columns=f"{POKE_STATS}, *",
+            **kwargs,
+        )
+
+    async def annotate(self, pconn, records):
+        if not records:
+            return records
+        numbers = dict(
+            await pconn.fetch(
+                NUMBERS,
+                self.args[0],
+                max(r["position"] for r in records),
+                [r["id"] for r in records],
+            )
+        )
+        return [{**record, "num": numbers.get(record["id"])} for record in records]
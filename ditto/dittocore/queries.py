@@ -0,0 +1,198 @@
+import statistics
+import time
+from collections import deque
+
+from dittocore.inventory import STATEMENTS as INVENTORY_STATEMENTS
+
+POKE_COLUMNS = "pokname, hpiv, atkiv, defiv, spatkiv, spdefiv, speediv, hpev, atkev, defev, spatkev, spdefev, speedev, pokelevel, moves, hitem, exp, nature, expcap, poknick, shiny, price, market_enlist, fav, ability_index, gender, caught_by, radiant, skin"
+
+# Prepared statements asyncpg keeps per pooled connection, its default is 100
+STATEMENT_CACHE_SIZE = 1024
+
+# name -> SQL of every statement Queries runs
+STATEMENTS = {
+    "staff_rank": "SELECT staff FROM users WHERE u_id = $1",
+    "has_started": "SELECT EXISTS(SELECT 1 FROM users WHERE u_id = $1)",
+    "inventory": "SELECT inventory::json FROM users WHERE u_id = $1",
+    "credits": "SELECT mewcoins FROM users WHERE u_id = $1",
+    "trader": "SELECT selected, mewcoins FROM users WHERE u_id = $1",
+    "add_credits": "UPDATE users SET mewcoins = mewcoins + $2 WHERE u_id = $1",
+    "mothers": (
+        "SELECT pokemon_id, entry_time FROM mothers "
+        "INNER JOIN pokes ON pokes.id = mothers.pokemon_id WHERE pokes.owner = $1"
+    ),
+    "selected_details": (
+        "SELECT users.silenced, pokes.* FROM users INNER JOIN pokes "
+        "ON pokes.id = (SELECT selected FROM users WHERE u_id = $1) AND users.u_id = $1"
+    ),
+    "owned_count": "SELECT count(*) FROM pokes WHERE id = ANY($1) AND owner = $2",
+    "give_poke": (
+        "UPDATE pokes SET owner = $3, position = DEFAULT, market_enlist = false "
+        "WHERE id = $1 AND owner = $2"
+    ),
+    "market_listing": "SELECT poke, owner, price, buyer FROM market WHERE id = $1",
+    # Runs the chat progress procedures for every pending user that has started, in one round trip.
+    # Postgres still runs each procedure once per user.
+    "flush_activity": """
+        SELECT t.u_id, party_counter(t.u_id), selected_counter(t.u_id), level_pokemon(t.u_id)
+        FROM unnest($1::bigint[]) AS t(u_id)
+        WHERE EXISTS (SELECT 1 FROM users WHERE users.u_id = t.u_id)
+    """,
+    # $1-$28 are the poke's columns but skin, $29 whether it can roll a shadow skin,
+    # $30 the dropped item, $31 the dropped chest (either NULL for none) and $32 the credits found.
+    # The users row is locked first, so concurrent catches by one user apply in turn.
+    "settle_catch": f"""
+        WITH hunter AS (
+            SELECT u_id, hunt = $1 AND $29 AS hunting,
+                hunt = $1 AND $29 AND random() < 4 ^ (chain / 1000.0) / 12000 AS shadow
+            FROM users WHERE u_id = $27 FOR UPDATE
+        ),
+        poke AS (
+            INSERT INTO pokes ({POKE_COLUMNS}, owner)
+            SELECT $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28,
+                CASE WHEN shadow THEN 'shadow' END, u_id
+            FROM hunter
+            RETURNING id, skin
+        ),
+        owner AS (
+            UPDATE users SET
+                chain = CASE
+                    WHEN NOT hunter.hunting THEN users.chain
+                    WHEN hunter.shadow THEN 0
+                    ELSE users.chain + 1
+                END,
+                items = CASE WHEN $30::text IS NULL THEN users.items::jsonb ELSE jsonb_set(
+                    COALESCE(users.items::jsonb, '{{}}'),
+                    ARRAY[$30::text],
+                    to_jsonb(COALESCE((users.items::jsonb ->> $30::text)::int, 0) + 1)
+                ) END,
+                inventory = CASE WHEN $31::text IS NULL THEN users.inventory::jsonb ELSE jsonb_set(
+                    COALESCE(users.inventory::jsonb, '{{}}'),
+                    ARRAY[$31::text],
+                    to_jsonb(COALESCE((users.inventory::jsonb ->> $31::text)::int, 0) + 1)
+                ) END,
+                mewcoins = users.mewcoins + $32
+            FROM poke, hunter
+            WHERE users.u_id = hunter.u_id
+        ),
+        achieved AS (
+            UPDATE achievements SET
+                shiny_caught = shiny_caught + CASE WHEN $21 THEN 1 ELSE 0 END,
+                pokemon_caught = pokemon_caught + CASE WHEN $21 THEN 0 ELSE 1 END
+            WHERE u_id = $27 AND EXISTS (SELECT 1 FROM poke)
+        )
+        SELECT id, skin FROM poke
+    """,
+    **INVENTORY_STATEMENTS,
+}
+
+
+class Queries:
+    """
+    Named statements for the bot's hot SQL, with execution counts and latencies.
+
+    asyncpg prepares every query it runs and keeps the statement per connection
+    in an LRU, dropped with the connection when the pool reconnects it. The
+    bot's hundreds of inline queries, and the filter queries built per call,
+    kept evicting the hot ones, so they were parsed again and again.
+    A statement here always runs from the same text, and the pool keeps
+    `STATEMENT_CACHE_SIZE` statements per connection, so hot statements stay
+    prepared. asyncpg also re-prepares a statement the schema changed under.
+
+    Methods take a connection acquired from `bot.db[0]`, so they can run in the
+    caller's transaction.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.calls = {name: 0 for name in STATEMENTS}
+        self.errors = {name: 0 for name in STATEMENTS}
+        self.total = {name: 0.0 for name in STATEMENTS}
+        self._latencies = {name: deque(maxlen=256) for name in STATEMENTS}
+
+    def stats(self):
+        """Returns name -> calls, errors, total and percentile latencies of every statement that ran."""
+        result = {}
+        for name, calls in self.calls.items():
+            if not calls:
+                continue
+            latencies = sorted(self._latencies[name])
+            result[name] = {
+                "calls": calls,
+                "errors": self.errors[name],
+                "total_ms": round(self.total[name] * 1000, 2),
+                "ms_p50": round(statistics.median(latencies) * 1000, 2),
+                "ms_p99": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2),
+            }
+        return result
+
+    async def run(self, pconn, name: str, method: str, *args):
+        """Runs the statement `name` with the connection's `method`, fetch, fetchrow, fetchval or execute."""
+        start = time.perf_counter()
+        try:
+            return await getattr(pconn, method)(STATEMENTS[name], *args)
+        except Exception:
+            self.errors[name] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls[name] += 1
+            self.total[name] += elapsed
+            self._latencies[name].append(elapsed)
+
+    async def staff_rank(self, pconn, user_id: int):
+        """Returns the staff rank of a user, or None."""
+        return await self.run(pconn, "staff_rank", "fetchval", user_id)
+
+    async def has_started(self, pconn, user_id: int):
+        """Returns whether a user has started."""
+        return await self.run(pconn, "has_started", "fetchval", user_id)
+
+    async def inventory(self, pconn, user_id: int):
+        """Returns the inventory dict of a user, or None if they have not started."""
+        return await self.run(pconn, "inventory", "fetchval", user_id)
+
+    async def credits(self, pconn, user_id: int):
+        """Returns the credits of a user, or None if they have not started."""
+        return await self.run(pconn, "credits", "fetchval", user_id)
+
+    async def trader(self, pconn, user_id: int):
+        """Returns the (selected, mewcoins) a trade rechecks of a user, or None."""
+        return await self.run(pconn, "trader", "fetchrow", user_id)
+
+    async def add_credits(self, pconn, user_id: int, amount: int):
+        """Gives a user `amount` credits, takes them if it is negative."""
+        await self.run(pconn, "add_credits", "execute", user_id, amount)
+
+    async def mothers(self, pconn, user_id: int):
+        """Returns poke id -> entry time of a user's pokemon in the daycare."""
+        records = await self.run(pconn, "mothers", "fetch", user_id)
+        return {r["pokemon_id"]: r["entry_time"] for r in records}
+
+    async def selected_details(self, pconn, user_id: int):
+        """Returns the row of a user's selected pokemon with their `silenced`, or None."""
+        return await self.run(pconn, "selected_details", "fetchrow", user_id)
+
+    async def owned_count(self, pconn, user_id: int, poke_ids: list):
+        """Returns how many of `poke_ids` a user owns."""
+        return await self.run(pconn, "owned_count", "fetchval", poke_ids, user_id)
+
+    async def give_poke(self, pconn, poke_id: int, giver: int, receiver: int):
+        """Moves a pokemon to the end of `receiver`'s list, if `giver` still owns it."""
+        await self.run(pconn, "give_poke", "execute", poke_id, giver, receiver)
+
+    async def market_listing(self, pconn, listing_id: int):
+        """Returns the (poke, owner, price, buyer) of a market listing, or None."""
+        return await self.run(pconn, "market_listing", "fetchrow", listing_id)
+
+    async def flush_activity(self, pconn, user_ids: list):
+        """
+        Runs the chat progress procedures for every started user in `user_ids`.
+
+        Returns (u_id, party_counter, selected_counter, level_pokemon) rows.
+        """
+        return await self.run(pconn, "flush_activity", "fetch", user_ids)
+
+    async def settle_catch(self, pconn, args: list):
+        """Runs the catch settling statement with `args`, returning its (id, skin) row or None."""
+        return await self.run(pconn, "settle_catch", "fetchrow", *args)
@@ -79,6 +79,13 @@ class RedisHandler:
                     await asyncio.sleep(0.1)
         return self._messages.pop(command_id, None)
 
+    async def notify(self, action: str, args: dict = None, scope: str = "bot"):
+        """Publishes an action to every cluster without waiting for replies."""
+        payload = {"scope": scope, "action": action, "command_id": str(uuid4())}
+        if args:
+            payload["args"] = args
+        await self.redis.execute("PUBLISH", "dittobot_clusters", orjson.dumps(payload))
+
     async def shutdown(self, args, *, command_id):
         if args.get("cluster_id") == self.cluster["id"]:
             if not args.get("yesiknowwhatimdoingpleasedontspammessages"):
@@ -214,6 +221,77 @@ class RedisHandler:
             self.logger.error("Exception in redis unload", exc_info=True)
             return {}
 
+    async def reload_catalog(self, args, *, command_id: str):
+        try:
+            try:
+                await self.bot.catalog.load()
+                self.bot.encyclopedia.load()
+            except Exception as e:
+                output = {"success": False, "message": f"{type(e).__name__}: {str(e)}"}
+            else:
+                output = {"success": True, "message": ""}
+            payload = {
+                "output": {"cluster_id": self.cluster["id"], **output},
+                "command_id": command_id,
+                "scope": "bot",
+            }
+            await self.redis.execute(
+                "PUBLISH", "dittobot_clusters", orjson.dumps(payload)
+            )
+        except Exception as e:
+            self.logger.error("Exception in redis reload_catalog", exc_info=True)
+
+    async def invalidate_guild_settings(self, args, *, command_id: str):
+        self.bot.guild_settings.invalidate(args["guild_id"])
+
+    async def spawn_stats(self, args, *, command_id: str):
+        try:
+            spawn = self.bot.get_cog("Spawn")
+            payload = {
+                "output": {
+                    "cluster_id": self.cluster["id"],
+                    **self.bot.catches.stats(),
+                    **(spawn.admission.stats() if spawn else {}),
+                    **(spawn.embeds.stats() if spawn else {}),
+                },
+                "command_id": command_id,
+                "scope": "bot",
+            }
+            await self.redis.execute(
+                "PUBLISH", "dittobot_clusters", orjson.dumps(payload)
+            )
+        except Exception as e:
+            self.logger.error("Exception in redis spawn_stats", exc_info=True)
+
+    async def activity_stats(self, args, *, command_id: str):
+        try:
+            payload = {
+                "output": {"cluster_id": self.cluster["id"], **self.bot.activity.stats()},
+                "command_id": command_id,
+                "scope": "bot",
+            }
+            await self.redis.execute(
+                "PUBLISH", "dittobot_clusters", orjson.dumps(payload)
+            )
+        except Exception as e:
+            self.logger.error("Exception in redis activity_stats", exc_info=True)
+
+    async def query_stats(self, args, *, command_id: str):
+        try:
+            payload = {
+                "output": {
+                    "cluster_id": self.cluster["id"],
+                    "statements": self.bot.queries.stats(),
+                },
+                "command_id": command_id,
+                "scope": "bot",
+            }
+            await self.redis.execute(
+                "PUBLISH", "dittobot_clusters", orjson.dumps(payload)
+            )
+        except Exception as e:
+            self.logger.error("Exception in redis query_stats", exc_info=True)
+
     async def _eval(self, args, *, command_id: str):
         if args["cluster_id"] not in [self.cluster["id"], "-1"]:
             return
@@ -0,0 +1,109 @@
+import random
+
+LEGENDARY = "legendary"
+ULTRA_BEAST = "ultra_beast"
+PSEUDO = "pseudo"
+STARTER = "starter"
+COMMON = "common"
+
+# Rarity tiers in the order they are rolled: (tier, base odds, odds taken off at 100% honey).
+# Each tier hits with a chance of 2 in its odds, the first tier to hit is picked, COMMON if none do.
+SPAWN_TIERS = (
+    (LEGENDARY, 4000, 7600),
+    (ULTRA_BEAST, 3000, 5700),
+    (PSEUDO, 1000, 1900),
+    (STARTER, 500, 950),
+)
+
+
+def one_in(threshold):
+    """
+    Returns True once in `threshold + 1` calls, the odds of `random.choice([False] * threshold + [True])`.
+
+    Thresholds of 0 or less always hit.
+    """
+    return threshold <= 0 or not random.randrange(threshold + 1)
+
+
+class AliasTable:
+    """
+    Walker's alias method (Vose's construction), samples a discrete distribution in O(1).
+
+    Each of the `n` columns holds its own index with probability `prob[i]` and
+    `alias[i]` otherwise, so a draw is one uniform column and one biased coin.
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        if not n:
+            raise ValueError("Cannot build an alias table without weights")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("Alias table weights must sum to more than 0")
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        # Whatever is left is 1 up to rounding error
+
+    def __len__(self):
+        return len(self.prob)
+
+    def sample(self):
+        i = int(random.random() * len(self.prob))
+        return i if random.random() < self.prob[i] else self.alias[i]
+
+
+def tier_odds(honey):
+    """Returns the chance each tier in SPAWN_TIERS, then COMMON, is picked with `honey`% honey."""
+    odds = []
+    remaining = 1.0
+    for _, base, honey_scale in SPAWN_TIERS:
+        n = round(base - honey_scale * honey / 100)
+        # int(random.random() * n) < 2 always holds for n <= 2
+        hit = 1.0 if n <= 2 else 2 / n
+        odds.append(remaining * hit)
+        remaining *= 1 - hit
+    odds.append(remaining)
+    return odds
+
+
+class SpawnSampler:
+    """
+    Picks the species of a spawn by rarity tier, one alias table per honey strength.
+
+    `species` maps every tier of SPAWN_TIERS and COMMON to its list of species.
+    Every list entry is a column weighted by its tier's odds over the list's
+    length, so a draw picks the tier and the species at once. Tables are built
+    the first time a honey strength is sampled.
+    """
+
+    def __init__(self, species):
+        self.species = species
+        self._tiers = [(tier, species[tier]) for tier, _, _ in SPAWN_TIERS]
+        self._tiers.append((COMMON, species[COMMON]))
+        self._tables = {}
+
+    def table(self, honey=0):
+        table = self._tables.get(honey)
+        if table is None:
+            entries = []
+            weights = []
+            for (tier, species), odds in zip(self._tiers, tier_odds(honey)):
+                for name in species:
+                    entries.append((name, tier))
+                    weights.append(odds / len(species))
+            table = self._tables[honey] = (AliasTable(weights), entries)
+        return table
+
+    def sample(self, honey=0):
+        """Returns a (species, tier) pair for a spawn with `honey`% honey."""
+        alias, entries = self.table(honey)
+        return entries[alias.sample()]
@@ -0,0 +1,360 @@
+"""
+Compiled, memory-mapped snapshot of the static JSON files in shared/data.
+
+Every cluster used to parse the same ~10 MB of JSON into its own heap at import time.
+`build_snapshot` compiles those files once into a single binary file holding a
+deduplicated string table and columnar int64/uint32 arrays, and `load_snapshot`
+maps that file read-only. Rows are decoded on access, so the pages backing the data
+live in the page cache and are shared by every process on the host.
+
+The snapshot is only a cache, if it is missing or older than any of the JSON files
+`load_snapshot` returns None and callers should fall back to reading the JSON.
+
+Layout:
+    MAGIC | u32 version | u32 index length | index (json) | 8-byte aligned sections
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+MAGIC = b"DITTOSNP"
+VERSION = 1
+SNAPSHOT_NAME = "data.snapshot"
+_HEADER = struct.Struct("<8sII")
+
+NULL_INT = -(2**63)
+NULL_ID = 2**32 - 1
+# Marks keys missing from a row, some files don't repeat every key in every row.
+MISSING_INT = NULL_INT + 1
+MISSING_ID = NULL_ID - 1
+_MISSING = object()
+
+# Column codes: "i" int64, "s" string id, "j" string id of a json encoded value.
+_ARRAY_CODES = {"i": "q", "s": "I", "j": "I"}
+
+
+def _sources(root):
+    """Yields the path of every JSON file the snapshot is compiled from, relative to `root`."""
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and (path.suffix == ".json" or path.name == "statfile"):
+            yield path.relative_to(root).as_posix()
+
+
+def _fingerprint(root, name):
+    stat = (root / name).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _is_scalar(value):
+    return value is None or isinstance(value, (int, str)) and not isinstance(value, bool)
+
+
+def _is_flat_records(rows):
+    if not all(isinstance(row, dict) for row in rows):
+        return False
+    return all(_is_scalar(value) for row in rows for value in row.values())
+
+
+class _Writer:
+    def __init__(self):
+        self.strings = {}
+        self.sections = []
+        self.size = 0
+
+    def string(self, value):
+        if value is None:
+            return NULL_ID
+        if value is _MISSING:
+            return MISSING_ID
+        return self.strings.setdefault(value, len(self.strings))
+
+    def _section(self, data):
+        offset = self.size
+        padding = -len(data) % 8
+        self.sections.append(data + b"\0" * padding)
+        self.size += len(data) + padding
+        return offset
+
+    def array(self, code, values):
+        return self._section(struct.pack(f"<{len(values)}{_ARRAY_CODES[code]}", *values))
+
+    def column(self, values):
+        present = [v for v in values if v is not _MISSING]
+        if all(v is None or type(v) is int for v in present):
+            code = "i"
+            encoded = [
+                NULL_INT if v is None else MISSING_INT if v is _MISSING else v for v in values
+            ]
+        elif all(v is None or type(v) is str for v in present):
+            code = "s"
+            encoded = [self.string(v) for v in values]
+        else:
+            code = "j"
+            encoded = [self.string(v if v is _MISSING else json.dumps(v)) for v in values]
+        return [code, self.array(code, encoded), len(encoded)]
+
+    def records(self, rows):
+        keys = {}
+        for row in rows:
+            keys.update(dict.fromkeys(row))
+        return [
+            [key, *self.column([row.get(key, _MISSING) for row in rows])] for key in keys
+        ]
+
+    def bounds(self, groups):
+        bounds = [0]
+        for group in groups:
+            bounds.append(bounds[-1] + len(group))
+        return self.column(bounds)
+
+    def table(self, data):
+        if isinstance(data, list) and all(type(v) is str for v in data):
+            return {"kind": "strings", "values": self.column(data)}
+        if isinstance(data, list) and _is_flat_records(data):
+            return {"kind": "records", "rows": len(data), "columns": self.records(data)}
+        if isinstance(data, dict):
+            values = list(data.values())
+            keys = self.column(list(data))
+            if all(type(v) is str for v in values):
+                return {"kind": "string_map", "keys": keys, "values": self.column(values)}
+            if all(isinstance(v, list) and all(type(s) is str for s in v) for v in values):
+                return {
+                    "kind": "string_lists",
+                    "keys": keys,
+                    "bounds": self.bounds(values),
+                    "values": self.column([s for v in values for s in v]),
+                }
+            if all(isinstance(v, list) for v in values) and _is_flat_records(
+                [row for v in values for row in v]
+            ):
+                rows = [row for v in values for row in v]
+                return {
+                    "kind": "grouped_records",
+                    "keys": keys,
+                    "bounds": self.bounds(values),
+                    "columns": self.records(rows),
+                }
+        return {"kind": "json", "value": self.string(json.dumps(data))}
+
+    def string_table(self):
+        blobs = [s.encode("utf-8") for s in self.strings]
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        return {
+            "offsets": self.array("i", offsets),
+            "count": len(blobs),
+            "blob": self._section(b"".join(blobs)),
+        }
+
+
+def build_snapshot(root, path=None):
+    """
+    Compiles every JSON file under `root` into a snapshot at `path`.
+
+    The file is written next to its final location and renamed into place, so
+    processes that already mapped the previous snapshot keep a valid mapping.
+    Returns the path of the snapshot.
+    """
+    root = Path(root)
+    path = Path(path) if path else root / SNAPSHOT_NAME
+    writer = _Writer()
+    tables = {}
+    sources = {}
+    for name in _sources(root):
+        sources[name] = _fingerprint(root, name)
+        with open(root / name, encoding="utf-8") as f:
+            tables[name] = writer.table(json.load(f))
+    strings = writer.string_table()
+    index = json.dumps(
+        {"sources": sources, "strings": strings, "tables": tables}
+    ).encode("utf-8")
+    start = _HEADER.size + len(index)
+    start += -start % 8
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        f.write(b"\0" * (start - _HEADER.size - len(index)))
+        for section in writer.sections:
+            f.write(section)
+    os.replace(tmp, path)
+    return path
+
+
+def load_snapshot(root, path=None):
+    """Maps the snapshot of `root`, or returns None if it is missing or stale."""
+    root = Path(root)
+    path = Path(path) if path else root / SNAPSHOT_NAME
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+    magic, version, index_length = _HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        return None
+    index = json.loads(buffer[_HEADER.size : _HEADER.size + index_length])
+    if list(_sources(root)) != list(index["sources"]):
+        return None
+    for name, fingerprint in index["sources"].items():
+        if _fingerprint(root, name) != fingerprint:
+            return None
+    start = _HEADER.size + index_length
+    start += -start % 8
+    return Snapshot(memoryview(buffer)[start:], index)
+
+
+class _Strings:
+    def __init__(self, data, offsets, count, blob):
+        self._offsets = data[offsets : offsets + 8 * (count + 1)].cast("q")
+        self._blob = data[blob : blob + self._offsets[count]]
+
+    def __getitem__(self, string_id):
+        if string_id == NULL_ID:
+            return None
+        return str(self._blob[self._offsets[string_id] : self._offsets[string_id + 1]], "utf-8")
+
+
+class _Column:
+    def __init__(self, data, strings, code, offset, count):
+        size = struct.calcsize(_ARRAY_CODES[code])
+        self._values = data[offset : offset + size * count].cast(_ARRAY_CODES[code])
+        self._strings = strings
+        self._code = code
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, i):
+        value = self._values[i]
+        if self._code == "i":
+            if value == NULL_INT:
+                return None
+            return _MISSING if value == MISSING_INT else value
+        if value == MISSING_ID:
+            return _MISSING
+        if self._code == "s":
+            return self._strings[value]
+        return json.loads(self._strings[value])
+
+
+class Records(Sequence):
+    """Read-only list of dicts, each row is decoded when it is accessed."""
+
+    def __init__(self, columns, start, stop):
+        self._columns = columns
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def _row(self, i):
+        row = {}
+        for name, column in self._columns:
+            value = column[i]
+            if value is not _MISSING:
+                row[name] = value
+        return row
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(self._start, self._stop)[i]]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Records index out of range")
+        return self._row(self._start + i)
+
+    def __iter__(self):
+        for i in range(self._start, self._stop):
+            yield self._row(i)
+
+    def __repr__(self):
+        return f"<Records rows={len(self)}>"
+
+
+class _Keyed(Mapping):
+    """Read-only dict, values are decoded when they are accessed."""
+
+    def __init__(self, keys, value):
+        self._positions = {keys[i]: i for i in range(len(keys))}
+        self._value = value
+
+    def __getitem__(self, key):
+        return self._value(self._positions[key])
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+
+class Snapshot(Mapping):
+    """A mapped snapshot, keyed by the path of each JSON file relative to shared/data."""
+
+    def __init__(self, data, index):
+        self._data = data
+        self._index = index["tables"]
+        self._strings = _Strings(data, **index["strings"])
+        self._tables = {}
+
+    def _column(self, spec):
+        return _Column(self._data, self._strings, *spec)
+
+    def _records(self, specs, start=0, stop=None):
+        columns = [(name, self._column(spec)) for name, *spec in specs]
+        if stop is None:
+            stop = len(columns[0][1]) if columns else 0
+        return columns, start, stop
+
+    def _load(self, spec):
+        kind = spec["kind"]
+        if kind == "strings":
+            values = self._column(spec["values"])
+            return [values[i] for i in range(len(values))]
+        if kind == "records":
+            return Records(*self._records(spec["columns"], 0, spec["rows"]))
+        if kind == "json":
+            return json.loads(self._strings[spec["value"]])
+        keys = self._column(spec["keys"])
+        if kind == "string_map":
+            values = self._column(spec["values"])
+            return _Keyed(keys, values.__getitem__)
+        bounds = self._column(spec["bounds"])
+        if kind == "string_lists":
+            values = self._column(spec["values"])
+            return _Keyed(
+                keys,
+                lambda i: [values[j] for j in range(bounds[i], bounds[i + 1])],
+            )
+        columns, _, _ = self._records(spec["columns"])
+        return _Keyed(keys, lambda i: Records(columns, bounds[i], bounds[i + 1]))
+
+    def __getitem__(self, name):
+        if name not in self._tables:
+            self._tables[name] = self._load(self._index[name])
+        return self._tables[name]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+if __name__ == "__main__":
+    import sys
+
+    root = Path(sys.argv[1] if len(sys.argv) > 1 else os.environ["DIRECTORY"]) / "shared" / "data"
+    print(f"Wrote {build_snapshot(root)}")
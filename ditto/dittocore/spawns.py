@@ -0,0 +1,496 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, defaultdict
+
+import discord
+import orjson
+
+IMAGE_ROOT = "https://skylarr1227.github.io/images/"
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel, schedules expirations in O(1) and expires them a tick at a time.
+
+    Items further out than one revolution wait in their slot for the extra rounds.
+    """
+
+    def __init__(self, slots=1024, resolution=1.0):
+        self.resolution = resolution
+        self._slots = [dict() for _ in range(slots)]
+        self._tick = 0
+        self._where = {}
+
+    def __len__(self):
+        return len(self._where)
+
+    def schedule(self, item, delay):
+        ticks = max(1, -int(-delay // self.resolution))
+        # Expires on the `ticks`th advance from now, the slot `offset + 1` ahead after `rounds` revolutions
+        rounds, offset = divmod(ticks - 1, len(self._slots))
+        slot = (self._tick + offset + 1) % len(self._slots)
+        self.cancel(item)
+        self._slots[slot][item] = rounds
+        self._where[item] = slot
+
+    def cancel(self, item):
+        slot = self._where.pop(item, None)
+        if slot is not None:
+            del self._slots[slot][item]
+
+    def advance(self):
+        """Moves the wheel forward one tick, returning the items that expired."""
+        self._tick = (self._tick + 1) % len(self._slots)
+        bucket = self._slots[self._tick]
+        expired = []
+        for item, rounds in list(bucket.items()):
+            if rounds:
+                bucket[item] = rounds - 1
+                continue
+            del bucket[item]
+            del self._where[item]
+            expired.append(item)
+        return expired
+
+
+class TokenBuckets:
+    """
+    Token buckets by key, `rate` tokens a second up to `burst`, kept in a bounded LRU.
+
+    A bucket left alone long enough to refill is dropped, it is recreated full
+    the next time it is used. Past `maxsize` keys the least recently used is
+    dropped early, which can only let through an extra spawn, not block one.
+    """
+
+    def __init__(self, rate, burst, *, maxsize=50000):
+        if rate <= 0 or burst < 1:
+            raise ValueError("Token buckets need a positive rate and a burst of at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()
+        self._ttl = burst / rate
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def tokens(self, key, now):
+        """Returns how many tokens the bucket of `key` holds at `now`."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return self.burst
+        tokens, updated = bucket
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def take(self, key, now):
+        """Takes a token from the bucket of `key`, which must hold one."""
+        self._buckets[key] = (self.tokens(key, now) - 1, now)
+        self._buckets.move_to_end(key)
+        # The least recently used buckets are first, drop those that have refilled
+        while self._buckets:
+            oldest = next(iter(self._buckets.values()))
+            if len(self._buckets) <= self.maxsize and now - oldest[1] < self._ttl:
+                break
+            self._buckets.popitem(last=False)
+
+
+class SpawnAdmission:
+    """
+    Decides whether a message that rolled a spawn may spawn one.
+
+    Each guild and each channel has a token bucket, a spawn takes a token from
+    both and is dropped if either is empty. This bounds the spawns, and the
+    database work behind them, that a busy guild or a flooded channel can cause.
+    The defaults match the old 5 second guild cooldown. The channel buckets
+    default to the guild's rate and burst, so they only bind when configured
+    tighter.
+    """
+
+    def __init__(
+        self,
+        *,
+        guild_rate=1 / 5,
+        guild_burst=1,
+        channel_rate=None,
+        channel_burst=None,
+        maxsize=50000,
+    ):
+        self.guilds = TokenBuckets(guild_rate, guild_burst, maxsize=maxsize)
+        self.channels = TokenBuckets(
+            guild_rate if channel_rate is None else channel_rate,
+            guild_burst if channel_burst is None else channel_burst,
+            maxsize=maxsize,
+        )
+        self.admitted = 0
+        self.dropped = defaultdict(int)
+
+    def stats(self):
+        return {
+            "admitted": self.admitted,
+            "dropped_guild": self.dropped["guild"],
+            "dropped_channel": self.dropped["channel"],
+            "buckets": len(self.guilds) + len(self.channels),
+        }
+
+    def admit(self, guild_id, channel_id):
+        """Returns whether a spawn may happen, taking its tokens if so."""
+        now = time.monotonic()
+        if self.guilds.tokens(guild_id, now) < 1:
+            self.dropped["guild"] += 1
+            return False
+        if self.channels.tokens(channel_id, now) < 1:
+            self.dropped["channel"] += 1
+            return False
+        self.guilds.take(guild_id, now)
+        self.channels.take(channel_id, now)
+        self.admitted += 1
+        return True
+
+
+class SpawnEmbeds:
+    """
+    Sprite urls of spawn embeds, keyed by (pokemon, shiny, radiant, skin), in a bounded LRU.
+
+    A spawn's sprite url is resolved once per key, a spawn only builds the
+    embed around it. Urls are dropped when the catalog is reloaded.
+    """
+
+    TITLE = "A wild Pokémon has Spawned, Say its name to catch it!"
+
+    def __init__(self, bot, *, maxsize=4096):
+        self.bot = bot
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._urls = OrderedDict()
+        self._sprites = None
+
+    def __len__(self):
+        return len(self._urls)
+
+    def stats(self):
+        return {"embed_hits": self.hits, "embed_misses": self.misses, "embeds": len(self)}
+
+    def url(self, pokemon, shiny=False, *, radiant=False, skin=None):
+        """
+        Returns the sprite url of a spawn.
+
+        Raises ValueError if the sprite index does not know `pokemon`.
+        """
+        sprites = self.bot.catalog.sprites
+        if sprites is not self._sprites:
+            self._urls.clear()
+            self._sprites = sprites
+        key = (pokemon, shiny, radiant, skin)
+        url = self._urls.get(key)
+        if url is not None:
+            self.hits += 1
+            self._urls.move_to_end(key)
+            return url
+        self.misses += 1
+        url = self._urls[key] = IMAGE_ROOT + sprites.file_name(
+            pokemon, shiny, radiant=radiant, skin=skin
+        )
+        if len(self._urls) > self.maxsize:
+            self._urls.popitem(last=False)
+        return url
+
+    def render(self, pokemon, shiny=False, *, color, radiant=False, skin=None, small_images=False):
+        """Returns the embed of a spawn, see `url` for the arguments."""
+        url = self.url(pokemon, shiny, radiant=radiant, skin=skin)
+        embed = discord.Embed(title=self.TITLE, color=color)
+        embed.add_field(
+            name="-", value=f"This Pokémons name starts with {pokemon[0]}", inline=True
+        )
+        if small_images:
+            embed.set_thumbnail(url=url)
+        else:
+            embed.set_image(url=url)
+        return embed
+
+
+class ActiveSpawn:
+    """A spawn waiting to be caught by name in a channel."""
+
+    __slots__ = (
+        "channel_id",
+        "pokemon",
+        "names",
+        "shiny",
+        "expires",
+        "message_id",
+        "rare",
+        "record",
+        "registration",
+        "future",
+    )
+
+    def __init__(self, channel_id, pokemon, names, shiny, expires, *, message_id=None, rare=False):
+        self.channel_id = channel_id
+        self.pokemon = pokemon
+        self.names = tuple(names)
+        self.shiny = shiny
+        self.expires = expires
+        self.message_id = message_id
+        self.rare = rare
+        # The registry member of the spawn once registered, and the task registering it
+        self.record = None
+        self.registration = None
+        self.future = None
+
+    @property
+    def expired(self):
+        return time.time() >= self.expires
+
+    def matches(self, content):
+        content = content.lower().replace(" ", "-")
+        return any(content.endswith(name) for name in self.names)
+
+
+class SpawnRegistry:
+    """
+    The open spawns of this cluster in Redis, so a restarted cluster can pick them back up.
+
+    Spawns are members of a sorted set scored by their expiry. Registering one
+    drops the expired members and all but the `maxsize` latest expiring ones,
+    and pushes the TTL of the set out to the spawn's, in one script. A cluster
+    whose spawns all expired leaves nothing behind.
+
+    Writes are best-effort, a spawn that fails to register is only lost on a
+    restart, as every spawn was before.
+    """
+
+    REGISTER = """
+        redis.call("ZADD", KEYS[1], ARGV[1], ARGV[2])
+        redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", ARGV[3])
+        redis.call("ZREMRANGEBYRANK", KEYS[1], 0, -tonumber(ARGV[4]) - 1)
+        if redis.call("TTL", KEYS[1]) < tonumber(ARGV[5]) then
+            redis.call("EXPIRE", KEYS[1], ARGV[5])
+        end
+    """
+
+    def __init__(self, bot, *, maxsize=10000):
+        self.bot = bot
+        self.maxsize = maxsize
+        self.registered = 0
+        self.restored = 0
+        self.failed = 0
+
+    @property
+    def key(self):
+        return f"spawns:{self.bot.cluster['id']}"
+
+    async def register(self, spawn):
+        now = time.time()
+        record = orjson.dumps(
+            {
+                "channel": spawn.channel_id,
+                "pokemon": spawn.pokemon,
+                "names": spawn.names,
+                "shiny": spawn.shiny,
+                "expires": spawn.expires,
+                "message": spawn.message_id,
+                "rare": spawn.rare,
+            }
+        )
+        try:
+            await self.bot.db[2].execute(
+                "EVAL",
+                self.REGISTER,
+                1,
+                self.key,
+                spawn.expires,
+                record,
+                now,
+                self.maxsize,
+                max(1, math.ceil(spawn.expires - now)),
+            )
+        except Exception:
+            self.failed += 1
+            self.bot.logger.warning("Failed to register a spawn", exc_info=True)
+            return
+        spawn.record = record
+        self.registered += 1
+
+    async def unregister(self, spawn):
+        # Registration and removal can take different connections, removal waits its turn
+        if spawn.registration is not None:
+            await spawn.registration
+        if spawn.record is None:
+            return
+        try:
+            await self.bot.db[2].execute("ZREM", self.key, spawn.record)
+        except Exception:
+            self.failed += 1
+            self.bot.logger.warning("Failed to unregister a spawn", exc_info=True)
+
+    async def load(self):
+        """Returns the unexpired spawns registered by this cluster, soonest to expire first."""
+        records = await self.bot.db[2].execute(
+            "ZRANGEBYSCORE", self.key, time.time(), "+inf"
+        )
+        spawns = []
+        for record in records or ():
+            data = orjson.loads(record)
+            spawn = ActiveSpawn(
+                data["channel"],
+                data["pokemon"],
+                data["names"],
+                data["shiny"],
+                data["expires"],
+                message_id=data["message"],
+                rare=data["rare"],
+            )
+            spawn.record = record
+            spawns.append(spawn)
+        return spawns
+
+
+class CatchDispatcher:
+    """
+    Routes messages to the spawns open in their channel.
+
+    Replaces one `bot.wait_for` listener per spawn, whose checks all ran on every
+    message, with a channel id -> open spawns dict, so a message costs one dict
+    lookup unless a spawn is open in its channel. Spawns expire on a timer wheel.
+
+    Spawns opened with the id of their message are kept in the SpawnRegistry
+    until they are caught, `restore` reopens them after a restart.
+    """
+
+    def __init__(self, bot, *, resolution=1.0):
+        self.bot = bot
+        self._channels = defaultdict(list)
+        self._wheel = TimerWheel(resolution=resolution)
+        self._task = None
+        self._writes = set()
+        self.registry = SpawnRegistry(bot)
+        self.opened = 0
+        self.caught = 0
+        self.expired = 0
+
+    @property
+    def open_spawns(self):
+        return len(self._wheel)
+
+    def stats(self):
+        return {
+            "open": self.open_spawns,
+            "opened": self.opened,
+            "caught": self.caught,
+            "expired": self.expired,
+            "registered": self.registry.registered,
+            "restored": self.registry.restored,
+        }
+
+    def open(self, channel_id, pokemon, names, shiny, ttl, *, message_id=None, rare=False):
+        """
+        Opens a spawn in `channel_id` that can be caught by any of `names` for `ttl` seconds.
+
+        Spawns with a `message_id` are registered so they survive a restart.
+        """
+        spawn = ActiveSpawn(
+            channel_id, pokemon, names, shiny, time.time() + ttl, message_id=message_id, rare=rare
+        )
+        self._add(spawn, ttl)
+        if message_id is not None:
+            spawn.registration = self._write(self.registry.register(spawn))
+        return spawn
+
+    async def restore(self):
+        """Reopens the registered spawns that have not expired and are not open, returns them."""
+        restored = []
+        now = time.time()
+        for spawn in await self.registry.load():
+            if any(s.record == spawn.record for s in self._channels.get(spawn.channel_id, ())):
+                continue
+            self._add(spawn, spawn.expires - now)
+            self.registry.restored += 1
+            restored.append(spawn)
+        return restored
+
+    def _add(self, spawn, ttl):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._channels[spawn.channel_id].append(spawn)
+        self._wheel.schedule(spawn, ttl)
+        self.opened += 1
+
+    def _write(self, coro):
+        # Keep a reference, the loop only holds tasks weakly
+        task = asyncio.create_task(coro)
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+        return task
+
+    def close(self, spawn):
+        """Closes a spawn that was caught."""
+        if self.discard(spawn):
+            self.caught += 1
+
+    def discard(self, spawn):
+        """Closes a spawn that can no longer be caught. Returns whether it was open."""
+        if not self._remove(spawn):
+            return False
+        self._wheel.cancel(spawn)
+        self._write(self.registry.unregister(spawn))
+        return True
+
+    async def wait(self, spawn):
+        """
+        Waits for the next message that names `spawn`.
+
+        Raises asyncio.TimeoutError once the spawn expires.
+        """
+        if spawn.expired or spawn not in self._channels.get(spawn.channel_id, ()):
+            raise asyncio.TimeoutError
+        spawn.future = asyncio.get_running_loop().create_future()
+        try:
+            return await spawn.future
+        finally:
+            spawn.future = None
+
+    def dispatch(self, message):
+        """Hands `message` to the oldest spawn in its channel it names. Returns whether one did."""
+        spawns = self._channels.get(message.channel.id)
+        if not spawns or not message.content:
+            return False
+        for spawn in spawns:
+            if spawn.future is None or spawn.future.done():
+                continue
+            if spawn.matches(message.content) and not self.bot.botbanned(message.author.id):
+                spawn.future.set_result(message)
+                return True
+        return False
+
+    def _remove(self, spawn):
+        spawns = self._channels.get(spawn.channel_id)
+        if not spawns or spawn not in spawns:
+            return False
+        spawns.remove(spawn)
+        if not spawns:
+            del self._channels[spawn.channel_id]
+        return True
+
+    def _expire(self, spawn):
+        if not self._remove(spawn):
+            return
+        self.expired += 1
+        if spawn.future is not None and not spawn.future.done():
+            spawn.future.set_exception(asyncio.TimeoutError())
+
+    async def _run(self):
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(self._wheel.resolution)
+            now = time.monotonic()
+            # Catch up on every tick missed while the loop was busy
+            while now - last >= self._wheel.resolution:
+                last += self._wheel.resolution
+                for spawn in self._wheel.advance():
+                    self._expire(spawn)
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
@@ -0,0 +1,66 @@
+class SpriteIndex:
+    """
+    Resolves pokemon names to sprite file names without touching the database.
+
+    Every form identifier is mapped to its (pokemon_id, form_id) pair up front,
+    so building the radiant, shiny, skin and pixel variants is pure string work.
+    """
+
+    def __init__(self, forms):
+        by_identifier = {}
+        for doc in forms:
+            by_identifier.setdefault(doc["identifier"], doc)
+        self._ids = {}
+        self._stems = {}
+        for name, doc in by_identifier.items():
+            suffix = doc["form_identifier"]
+            if suffix and name.endswith(suffix):
+                base = by_identifier.get(name[: -(len(suffix) + 1)])
+                # Negative cache, forms whose base form is missing stay unresolvable without being recomputed.
+                if base is None or doc.get("form_order") is None:
+                    self._stems[name] = None
+                    continue
+                ids = (base["pokemon_id"], int(doc["form_order"] - 1))
+            else:
+                ids = (doc["pokemon_id"], 0)
+            self._ids[name] = ids
+            self._stems[name] = f"{ids[0]}-{ids[1]}-"
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, name):
+        return self._stems.get(name.lower()) is not None
+
+    def _stem(self, name):
+        stem = self._stems.get(name.lower())
+        if stem is None:
+            self.misses += 1
+            raise ValueError(f"Invalid name ({name}) passed to the sprite index.")
+        return stem
+
+    def ids(self, name):
+        """Returns the (pokemon_id, form_id) pair used by the sprite files of `name`."""
+        self._stem(name)
+        return self._ids[name.lower()]
+
+    def file_name(self, name, shiny=False, *, radiant=False, skin=None):
+        """Returns the file name of the full-size sprite, relative to the image root."""
+        stem = self._stem(name)
+        filetype = "png"
+        if skin is None:
+            skin = ""
+        else:
+            if skin.endswith("_gif"):
+                filetype = "gif"
+            skin = f"{skin}/"
+        is_radiant = "radiant/" if radiant else ""
+        is_shiny = "shiny/" if shiny else ""
+        return f"{is_radiant}{is_shiny}{skin}{stem}.{filetype}"
+
+    def pixel_file_name(self, name, shiny=False):
+        """Returns the file name of the pixel sprite, relative to the pixel image root."""
+        stem = self._stem(name)
+        is_shiny = "shiny/" if shiny else ""
+        return f"{is_shiny}{stem}.png"
@@ -0,0 +1,51 @@
+import numpy as np
+
+# Type ids run from 1 (normal) to 18 (fairy), 19 is TYPELESS, which is neutral to and from everything.
+TYPE_COUNT = 19
+TYPELESS = 19
+
+
+class TypeChart:
+    """
+    The type effectiveness chart as a 19x19 matrix of damage multipliers.
+
+    Row `a - 1`, column `d - 1` holds the multiplier of attacking type id `a`
+    against defending type id `d`. The inverse battle chart, where weaknesses and
+    resistances swap and immunities become weaknesses, is precomputed next to it.
+    """
+
+    def __init__(self, type_effectiveness):
+        matrix = np.ones((TYPE_COUNT, TYPE_COUNT))
+        for te in type_effectiveness:
+            attacker, defender = te["damage_type_id"], te["target_type_id"]
+            # Skip the shadow type and anything else outside the main series types
+            if attacker > TYPE_COUNT or defender > TYPE_COUNT:
+                continue
+            matrix[attacker - 1, defender - 1] = te["damage_factor"] / 100
+        inverse = np.where(matrix < 1, 2.0, np.where(matrix > 1, 0.5, 1.0))
+        matrix.setflags(write=False)
+        inverse.setflags(write=False)
+        self._matrices = (matrix, inverse)
+        # Plain nested lists, indexing these is much cheaper than indexing numpy per hit.
+        self._factors = (matrix.tolist(), inverse.tolist())
+
+    def matrix(self, *, inverse=False):
+        """Returns the whole (read-only) chart, attackers by defenders."""
+        return self._matrices[inverse]
+
+    def factor(self, attacker_type, defender_type, *, inverse=False):
+        """Returns the multiplier of `attacker_type` damage on a `defender_type` pokemon."""
+        return self._factors[inverse][attacker_type - 1][defender_type - 1]
+
+    def attacking(self, attacker_type, *, inverse=False):
+        """Returns the multipliers of `attacker_type` on every defending type, by type id - 1."""
+        return self._matrices[inverse][attacker_type - 1]
+
+    def defending(self, defender_types, *, inverse=False):
+        """
+        Returns the multipliers of every attacking type on a pokemon of `defender_types`, by type id - 1.
+
+        Multi-type defenders take the product of the multipliers of each of their types.
+        """
+        columns = [t - 1 for t in defender_types if t != TYPELESS]
+        return self._matrices[inverse][:, columns].prod(axis=1)
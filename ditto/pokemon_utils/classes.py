@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from enum import IntFlag
 from typing import Any, Optional
 
 
@@ -97,3 +98,41 @@ class FormInfo:
             self.pokemon_id == maybe_evolve_to["evolves_from_species_id"]
             for maybe_evolve_to in self.evoline
         )
+
+
+class EvoReqs(IntFlag):
+    """Stores the requirements for a particular evolution."""
+
+    EMPTY = 0
+    PHYSICALSTATS = 1
+    GENDER = 2
+    LEVEL = 4
+    HAPPINESS = 8
+    MOVE = 16
+    HELDITEM = 32
+    ACTIVEITEM = 64
+    REGION = 128
+
+    def used_active_item(self):
+        return EvoReqs.ACTIVEITEM in self
+
+    @staticmethod
+    def from_raw(raw):
+        score = EvoReqs.EMPTY
+        if raw["relative_physical_stats"] is not None:
+            score |= EvoReqs.PHYSICALSTATS
+        if raw["gender_id"]:
+            score |= EvoReqs.GENDER
+        if raw["minimum_level"]:
+            score |= EvoReqs.LEVEL
+        if raw["minimum_happiness"]:
+            score |= EvoReqs.HAPPINESS
+        if raw["known_move_id"]:
+            score |= EvoReqs.MOVE
+        if raw["held_item_id"]:
+            score |= EvoReqs.HELDITEM
+        if raw["trigger_item_id"]:
+            score |= EvoReqs.ACTIVEITEM
+        if raw.get("region"):
+            score |= EvoReqs.REGION
+        return score
@@ -0,0 +1,117 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+from pokemon_utils.classes import EvoReqs
+
+
+@dataclass(frozen=True)
+class EvoEdge:
+    """One possible evolution, with its evofile requirements resolved ahead of time."""
+
+    species_id: int
+    identifier: str
+    chain_id: int
+    reqs: EvoReqs
+    trigger_item_id: Optional[int]
+    held_item_id: Optional[int]
+    gender_id: Optional[int]
+    minimum_level: Optional[int]
+    minimum_happiness: Optional[int]
+    known_move: Optional[str]
+    relative_physical_stats: Optional[int]
+    region: Optional[str]
+
+
+class EvolutionGraph:
+    """
+    Evolution graph compiled from the pfile and evofile collections.
+
+    Holds the adjacency list of every species, each species' base evolution
+    and the members of every evolution chain, so evolving, devolving and
+    breeding never have to walk the database.
+    """
+
+    def __init__(self, pfile, evofile, moves_by_id):
+        self._species = {}
+        self._chains = defaultdict(list)
+        for doc in pfile:
+            if doc["id"] in self._species:
+                continue
+            self._species[doc["id"]] = doc
+            self._chains[doc["evolution_chain_id"]].append(doc)
+        evos = {}
+        for doc in evofile:
+            evos.setdefault(doc["evolved_species_id"], doc)
+
+        # Species without an evofile doc can never be evolved into.
+        self.missing = []
+        self._edges = defaultdict(list)
+        for chain_id, members in self._chains.items():
+            # Babies first, matching the order evolve has always considered evos in.
+            members.sort(key=lambda doc: doc["is_baby"], reverse=True)
+            for doc in members:
+                if not doc["evolves_from_species_id"]:
+                    continue
+                raw = evos.get(doc["id"])
+                if raw is None:
+                    self.missing.append(doc["identifier"])
+                    continue
+                known_move = None
+                if raw["known_move_id"] and raw["known_move_id"] in moves_by_id:
+                    known_move = moves_by_id[raw["known_move_id"]]["identifier"]
+                self._edges[(doc["evolves_from_species_id"], chain_id)].append(
+                    EvoEdge(
+                        species_id=doc["id"],
+                        identifier=doc["identifier"],
+                        chain_id=chain_id,
+                        reqs=EvoReqs.from_raw(raw),
+                        trigger_item_id=raw["trigger_item_id"],
+                        held_item_id=raw["held_item_id"],
+                        gender_id=raw["gender_id"],
+                        minimum_level=raw["minimum_level"],
+                        minimum_happiness=raw["minimum_happiness"],
+                        known_move=known_move,
+                        relative_physical_stats=raw["relative_physical_stats"],
+                        region=raw.get("region"),
+                    )
+                )
+
+        self._base = {}
+        for species_id in self._species:
+            self._base[species_id] = self._find_base(species_id)
+
+    def _find_base(self, species_id):
+        seen = set()
+        doc = self._species[species_id]
+        while doc["evolves_from_species_id"]:
+            if doc["id"] in seen:
+                return None
+            seen.add(doc["id"])
+            doc = self._species.get(doc["evolves_from_species_id"])
+            if doc is None:
+                return None
+        return doc
+
+    def evolutions(self, species_id, chain_id):
+        """Returns the evolutions of `species_id` within evolution chain `chain_id`."""
+        return self._edges.get((species_id, chain_id), [])
+
+    def pre_evolution(self, species_id):
+        """Returns the pfile doc of the species `species_id` evolves from, if any."""
+        doc = self._species.get(species_id)
+        if doc is None or not doc["evolves_from_species_id"]:
+            return None
+        return self._species.get(doc["evolves_from_species_id"])
+
+    def base(self, species_id):
+        """
+        Returns the pfile doc of the first stage of `species_id`'s evolution line.
+
+        Returns None if the species, or any of its pre-evolutions, is unknown.
+        """
+        return self._base.get(species_id)
+
+    def evoline(self, chain_id):
+        """Returns the pfile docs of every species in an evolution chain, babies first."""
+        return self._chains.get(chain_id, [])
@@ -1,5 +1,3 @@
-from enum import IntFlag
-
 import dacite
 import discord
 from dittocogs.json_files import *
@@ -39,13 +37,11 @@ def edit_stats(stats, inc_stat, dec_stat):
 async def get_pokemon_qinfo(ctx, records, info_type=None):
     _id = records["id"]
     async with ctx.bot.db[0].acquire() as pconn:
-        ids = await pconn.fetchval(
-            "SELECT pokes FROM users WHERE u_id = $1", ctx.author.id
+        pnum, id_count = await pconn.fetchrow(
+            "SELECT poke_number($1, $2), poke_count($1)", ctx.author.id, _id
         )
     if not info_type:
-        try:
-            pnum = ids.index(_id) + 1
-        except ValueError:
+        if pnum is None:
             # The user *probably* has a pokemon selected that they do not own, so clear the
             # user's selected pokemon for the future.
             async with ctx.bot.db[0].acquire() as pconn:
@@ -246,7 +242,6 @@ async def get_pokemon_qinfo(ctx, records, info_type=None):
     embed.description = f"""**Ability**: `{abilities}` | **Nature**: `{nature}`\n**Types**: {tlist}\n**Egg Groups**: {egg_groups}\n`HP`: **{hpiv}** | `Attack`: **{atkiv}** | `Defense`: **{defiv}**\n`SP.A`: **{spatkiv}** | `SP.D`: **{spdefiv}** | `Speed`: **{speediv}**\n__**Total IV%:**__ `{ivs}`\nHeld item : `{hi}{txt}`"""
     # embed.set_thumbnail(url=ctx.author.avatar_url)
     # embed.set_image(url=iurl)
-    id_count = len(ids)
     embed.set_footer(
         text=f"Number {pnum}/{id_count} | Global ID: {_id}" if not info_type else ""
     )
@@ -256,17 +251,15 @@ async def get_pokemon_qinfo(ctx, records, info_type=None):
 async def get_pokemon_info(ctx, records, info_type=None):
     _id = records["id"]
     async with ctx.bot.db[0].acquire() as pconn:
-        ids = await pconn.fetchval(
-            "SELECT pokes FROM users WHERE u_id = $1", ctx.author.id
+        pnum, id_count = await pconn.fetchrow(
+            "SELECT poke_number($1, $2), poke_count($1)", ctx.author.id, _id
         )
         tnick = await pconn.fetchval(
             "SELECT tnick FROM users WHERE u_id = $1", records["caught_by"]
         )
     tnick = str(tnick)[:20]
     if not info_type:
-        try:
-            pnum = ids.index(_id) + 1
-        except ValueError:
+        if pnum is None:
             # The user *probably* has a pokemon selected that they do not own, so clear the
             # user's selected pokemon for the future.
             async with ctx.bot.db[0].acquire() as pconn:
@@ -537,7 +530,6 @@ async def get_pokemon_info(ctx, records, info_type=None):
     if ctx.author.avatar is not None:
         embed.set_thumbnail(url=ctx.author.avatar.url)
     embed.set_image(url=iurl)
-    id_count = len(ids)
     embed.set_footer(
         text=f"Number {pnum}/{id_count} | Global ID#: {_id}{txt}"
         if not info_type
@@ -546,93 +538,52 @@ async def get_pokemon_info(ctx, records, info_type=None):
     return embed
 
 
-class EvoReqs(IntFlag):
-    """Stores the requirements for a particular evolution."""
-
-    EMPTY = 0
-    PHYSICALSTATS = 1
-    GENDER = 2
-    LEVEL = 4
-    HAPPINESS = 8
-    MOVE = 16
-    HELDITEM = 32
-    ACTIVEITEM = 64
-    REGION = 128
-
-    def used_active_item(self):
-        return EvoReqs.ACTIVEITEM in self
-
-    @staticmethod
-    def from_raw(raw):
-        score = EvoReqs.EMPTY
-        if raw["relative_physical_stats"] is not None:
-            score |= EvoReqs.PHYSICALSTATS
-        if raw["gender_id"]:
-            score |= EvoReqs.GENDER
-        if raw["minimum_level"]:
-            score |= EvoReqs.LEVEL
-        if raw["minimum_happiness"]:
-            score |= EvoReqs.HAPPINESS
-        if raw["known_move_id"]:
-            score |= EvoReqs.MOVE
-        if raw["held_item_id"]:
-            score |= EvoReqs.HELDITEM
-        if raw["trigger_item_id"]:
-            score |= EvoReqs.ACTIVEITEM
-        if raw["region"]:
-            score |= EvoReqs.REGION
-        return score
-
-
-async def _check_evo_reqs(
-    bot, pokemon, held_item_id, active_item_id, region, evoreq, override_lvl_100
+def _check_evo_reqs(
+    pokemon, held_item_id, active_item_id, region, evo, override_lvl_100
 ):
-    """Checks that "poke" meets all of the criteria of "evoreq"."""
-    req_flags = EvoReqs.from_raw(evoreq)
+    """Checks that "poke" meets all of the criteria of the EvoEdge "evo"."""
     # They used an active item but this evo doesn't use an active item, don't use it.
-    if active_item_id is not None and not req_flags.used_active_item():
+    if active_item_id is not None and not evo.reqs.used_active_item():
         return False
     # If a pokemon is level 100, ONLY evolve via an override or active item.
     if pokemon.pokelevel >= 100 and not (
         override_lvl_100 or active_item_id is not None
     ):
         return False
-    if evoreq["trigger_item_id"]:
-        if evoreq["trigger_item_id"] != active_item_id:
+    if evo.trigger_item_id:
+        if evo.trigger_item_id != active_item_id:
             return False
-    if evoreq["held_item_id"]:
-        if evoreq["held_item_id"] != held_item_id:
+    if evo.held_item_id:
+        if evo.held_item_id != held_item_id:
             return False
-    if evoreq["gender_id"]:
-        if evoreq["gender_id"] == 1 and pokemon.gender == "-m":
+    if evo.gender_id:
+        if evo.gender_id == 1 and pokemon.gender == "-m":
             return False
-        if evoreq["gender_id"] == 2 and pokemon.gender == "-f":
+        if evo.gender_id == 2 and pokemon.gender == "-f":
             return False
-    if evoreq["minimum_level"]:
-        if pokemon.pokelevel < evoreq["minimum_level"]:
+    if evo.minimum_level:
+        if pokemon.pokelevel < evo.minimum_level:
             return False
-    if evoreq["known_move_id"]:
-        identifier = await bot.db[1].moves.find_one({"id": evoreq["known_move_id"]})
-        identifier = identifier["identifier"]
-        if identifier not in pokemon.moves:
+    if EvoReqs.MOVE in evo.reqs:
+        if evo.known_move not in pokemon.moves:
             return False
-    if evoreq["minimum_happiness"]:
-        if pokemon.happiness < evoreq["minimum_happiness"]:
+    if evo.minimum_happiness:
+        if pokemon.happiness < evo.minimum_happiness:
             return False
-    if evoreq["relative_physical_stats"] is not None:
+    if evo.relative_physical_stats is not None:
         # WARNING
         # Currently this is only used by Tyrogue, which has identical base stats for atk and def.
         # If this is used on a poke WITHOUT identical base stats, the base stat needs to be considered.
         attack = pokemon.atkiv + pokemon.atkev
         defense = pokemon.defiv + pokemon.defev
-        if evoreq["relative_physical_stats"] == 1 and not attack > defense:
+        if evo.relative_physical_stats == 1 and not attack > defense:
             return False
-        elif evoreq["relative_physical_stats"] == -1 and not attack < defense:
+        elif evo.relative_physical_stats == -1 and not attack < defense:
             return False
-        elif evoreq["relative_physical_stats"] == 0 and not attack == defense:
+        elif evo.relative_physical_stats == 0 and not attack == defense:
             return False
-    if evoreq["region"]:
-        if evoreq["region"] != region:
+    if evo.region:
+        if evo.region != region:
             return False
         # Temp blocker since previously radiants could never evolve to regional forms, so they were released separately
         if pokemon.radiant:
@@ -648,13 +599,12 @@ def _pick_evo(valid_evos):
     IE: held item evos > level evos
     """
     best_score = -1
-    best_id = None
+    best_evo = None
     for evo in valid_evos:
-        score = EvoReqs.from_raw(evo)
-        if score > best_score:
-            best_score = score
-            best_id = evo["evolved_species_id"]
-    return (best_id, best_score)
+        if evo.reqs > best_score:
+            best_score = evo.reqs
+            best_evo = evo
+    return (best_evo, best_score)
 
 
 async def evolve(
@@ -685,48 +635,23 @@ async def evolve(
         return False
 
     # Get the necessary info of this poke to find evos
-    pokemon_info = await bot.mongo_pokemon_db.forms.find_one(
-        {"identifier": pokemon.pokname}
-    )
-    if pokemon_info is None:
+    form_info = bot.catalog.form(pokemon.pokname)
+    if form_info is None:
         bot.logger.warning(
             f"A poke exists that is not in the mongo forms table - {pokemon.pokname}"
         )
         return False
-    pokemon_info = dacite.from_dict(
-        data_class=FormInfo,
-        data=pokemon_info,
-    )
-    raw_pfile = await bot.mongo_pokemon_db.pfile.find_one(
-        {"identifier": pokemon_info.identifier}
-    )
-    if raw_pfile is None:
+    pfile = bot.catalog.pfile_by_identifier(form_info["identifier"])
+    if pfile is None:
         bot.logger.warning(
             f"A non-formed poke exists that is not in the mongo pfile table - {pokemon.pokname}"
         )
         return False
-    pokemon_info.pfile = dacite.from_dict(data_class=PFile, data=raw_pfile)
 
-    # Get a list of pokes in this poke's evo chain
-    evoline = bot.mongo_pokemon_db.pfile.find(
-        {"evolution_chain_id": pokemon_info.pfile.evolution_chain_id}
+    # Evos that are evolved from this poke, within its own evo chain
+    potential_evos = bot.catalog.evolutions.evolutions(
+        form_info["pokemon_id"], pfile["evolution_chain_id"]
     )
-    async for record in evoline:
-        pokemon_info.evoline.append(record)
-    pokemon_info.evoline.sort(key=lambda doc: doc["is_baby"], reverse=True)
-
-    # Filter the potential evos to only include ones that are evolved from this poke
-    potential_evos = []
-    for x in pokemon_info.evoline:
-        if not x["evolves_from_species_id"] == pokemon_info.pokemon_id:
-            continue
-        val = await bot.db[1].evofile.find_one({"evolved_species_id": x["id"]})
-        if val is None:
-            bot.logger.warning(
-                f"An evofile does not exist for a poke - {x['identifier']}"
-            )
-        else:
-            potential_evos.append(val)
 
     # This pokemon has no future evos, so it can't evolve into anything
     if not potential_evos:
@@ -736,44 +661,42 @@ async def evolve(
     if active_item is None:
         active_item_id = None
     else:
-        active_item_id = await bot.mongo_pokemon_db.items.find_one(
-            {"identifier": active_item}
-        )
+        active_item_id = bot.catalog.item(active_item)
         if active_item_id is None:
             bot.logger.warning(
                 f"A poke is trying to use an active item that is not in the mongo table - {active_item}"
             )
         else:
             active_item_id = active_item_id["id"]
-    held_item_id = await bot.mongo_pokemon_db.items.find_one(
-        {"identifier": pokemon.hitem}
-    )
+    held_item_id = bot.catalog.item(pokemon.hitem)
     if held_item_id is not None:
         held_item_id = held_item_id["id"]
 
-    # Get the owner's current region
-    async with bot.db[0].acquire() as pconn:
-        region = await pconn.fetchval(
-            "SELECT region FROM users WHERE u_id = $1", owner.id
-        )
-    if region is None:
-        return False
+    # Get the owner's current region, only regional evos depend on it
+    region = None
+    if any(evo.region for evo in potential_evos):
+        async with bot.db[0].acquire() as pconn:
+            region = await pconn.fetchval(
+                "SELECT region FROM users WHERE u_id = $1", owner.id
+            )
+        if region is None:
+            return False
 
     # Filter out evos that this poke does not meet the requirements for
-    valid_evos = []
-    for evoreq in potential_evos:
-        if await _check_evo_reqs(
-            bot, pokemon, held_item_id, active_item_id, region, evoreq, override_lvl_100
-        ):
-            valid_evos.append(evoreq)
+    valid_evos = [
+        evo
+        for evo in potential_evos
+        if _check_evo_reqs(
+            pokemon, held_item_id, active_item_id, region, evo, override_lvl_100
+        )
+    ]
 
     # This poke does not meet the conditions of any potential evos
     if not valid_evos:
         return False
 
-    evo_id, evo_reqs = _pick_evo(valid_evos)
-    evo = await bot.mongo_pokemon_db.pfile.find_one({"id": evo_id})
-    evo = evo["identifier"].capitalize()
+    evo, evo_reqs = _pick_evo(valid_evos)
+    evo = evo.identifier.capitalize()
 
     # We evolved, actually update the poke & notify the user
     async with bot.db[0].acquire() as pconn:
@@ -808,14 +731,11 @@ async def devolve(ctx, pokeid):
         pokename = await pconn.fetchval(
             "SELECT pokname FROM pokes WHERE id = $1", pokeid
         )
-    pokedata = await ctx.bot.mongo_pokemon_db.pfile.find_one(
-        {"identifier": pokename.lower()}
-    )
-    preid = pokedata["evolves_from_species_id"]
+    pokedata = ctx.bot.catalog.pfile_by_identifier(pokename.lower())
+    preevo = ctx.bot.catalog.evolutions.pre_evolution(pokedata["id"])
     # The pokemon is the base evolution, or otherwise does not exist.
-    if not preid:
+    if preevo is None:
         return False
-    preevo = await ctx.bot.mongo_pokemon_db.pfile.find_one({"id": preid})
     new_name = preevo["identifier"].capitalize()
     async with ctx.bot.db[0].acquire() as pconn:
         await pconn.execute(
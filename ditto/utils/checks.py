@@ -58,9 +58,7 @@ def check_admin():
         if ctx.author.id in OWNER_IDS:
             return True
         async with ctx.bot.db[0].acquire() as pconn:
-            rank = await pconn.fetchval(
-                "SELECT staff FROM users WHERE u_id = $1", ctx.author.id
-            )
+            rank = await ctx.bot.queries.staff_rank(pconn, ctx.author.id)
         if rank is None:
             return False
         rank = Rank[rank.upper()]
@@ -74,9 +72,7 @@ def check_investigator():
         if ctx.author.id in OWNER_IDS:
             return True
         async with ctx.bot.db[0].acquire() as pconn:
-            rank = await pconn.fetchval(
-                "SELECT staff FROM users WHERE u_id = $1", ctx.author.id
-            )
+            rank = await ctx.bot.queries.staff_rank(pconn, ctx.author.id)
         if rank is None:
             return False
         rank = Rank[rank.upper()]
@@ -91,9 +87,7 @@ def check_gymauth():
         if ctx.author.id in OWNER_IDS:
             return True
         async with ctx.bot.db[0].acquire() as pconn:
-            rank = await pconn.fetchval(
-                "SELECT staff FROM users WHERE u_id = $1", ctx.author.id
-            )
+            rank = await ctx.bot.queries.staff_rank(pconn, ctx.author.id)
         if rank is None:
             return False
         rank = Rank[rank.upper()]
@@ -108,9 +102,7 @@ def check_mod():
         if ctx.author.id in OWNER_IDS:
             return True
         async with ctx.bot.db[0].acquire() as pconn:
-            rank = await pconn.fetchval(
-                "SELECT staff FROM users WHERE u_id = $1", ctx.author.id
-            )
+            rank = await ctx.bot.queries.staff_rank(pconn, ctx.author.id)
         if rank is None:
             return False
         rank = Rank[rank.upper()]
@@ -124,9 +116,7 @@ def check_helper():
         if ctx.author.id in OWNER_IDS:
             return True
         async with ctx.bot.db[0].acquire() as pconn:
-            rank = await pconn.fetchval(
-                "SELECT staff FROM users WHERE u_id = $1", ctx.author.id
-            )
+            rank = await ctx.bot.queries.staff_rank(pconn, ctx.author.id)
         if rank is None:
             return False
         rank = Rank[rank.upper()]
@@ -140,9 +130,7 @@ def check_support():
         if ctx.author.id in OWNER_IDS:
             return True
         async with ctx.bot.db[0].acquire() as pconn:
-            rank = await pconn.fetchval(
-                "SELECT staff FROM users WHERE u_id = $1", ctx.author.id
-            )
+            rank = await ctx.bot.queries.staff_rank(pconn, ctx.author.id)
         if rank is None:
             return False
         rank = Rank[rank.upper()]
@@ -502,115 +502,15 @@ async def get_pixel_spawn_url(pokemon_name):
 
 
 async def get_pixel_file_name(name, bot, shiny=False):
-    name = name.lower()
-    identifier = await bot.db[1].forms.find_one({"identifier": name})
-    if not identifier:
-        # I have NO idea how this can be handled yet, raising for now to avoid breaking other code while still making errors clearer.
-        raise ValueError(
-            f"Invalid name ({name}) passed to ditto/utils/misc.py get_pixel_file_name."
-        )
-
-    # suffix = get_suffix(name)
-    suffix = identifier["form_identifier"]
-
-    if suffix and name.endswith(suffix):
-        form_id = int(identifier["form_order"] - 1)
-        form_name = name[: -(len(suffix) + 1)]
-        pokemon_identifier = await bot.db[1].forms.find_one({"identifier": form_name})
-        if not pokemon_identifier:
-            # I have NO idea how this can be handled yet, raising for now to avoid breaking other code while still making errors clearer.
-            raise ValueError(
-                f"Invalid name ({name}) passed to ditto/utils/misc.py get_file_name."
-            )
-        pokemon_id = pokemon_identifier["pokemon_id"]
-    else:
-        pokemon_id = identifier["pokemon_id"]
-        form_id = 0
-    filetype = "png"
-   # if skin is None:
-     #   skin = ""
-    #else:
-     #   if skin.endswith("_gif"):
-      #      filetype = "gif"
-       # skin = f"skins/{skin}/"
-    #is_radiant = "radiant/" if radiant else ""
-    is_shiny = "shiny/" if shiny else ""
-    return f"{is_shiny}{pokemon_id}-{form_id}-.{filetype}"
+    return bot.catalog.sprites.pixel_file_name(name, shiny)
 
 
 async def get_file_name(name, bot, shiny=False, *, radiant=False, skin=None):
-    name = name.lower()
-    identifier = await bot.db[1].forms.find_one({"identifier": name})
-    if not identifier:
-        # I have NO idea how this can be handled yet, raising for now to avoid breaking other code while still making errors clearer.
-        raise ValueError(
-            f"Invalid name ({name}) passed to ditto/utils/misc.py get_file_name."
-        )
-
-    # suffix = get_suffix(name)
-    suffix = identifier["form_identifier"]
-
-    if suffix and name.endswith(suffix):
-        form_id = int(identifier["form_order"] - 1)
-        form_name = name[: -(len(suffix) + 1)]
-        pokemon_identifier = await bot.db[1].forms.find_one({"identifier": form_name})
-        if not pokemon_identifier:
-            # I have NO idea how this can be handled yet, raising for now to avoid breaking other code while still making errors clearer.
-            raise ValueError(
-                f"Invalid name ({name}) passed to ditto/utils/misc.py get_file_name."
-            )
-        pokemon_id = pokemon_identifier["pokemon_id"]
-    else:
-        pokemon_id = identifier["pokemon_id"]
-        form_id = 0
-    filetype = "png"
-    if skin is None:
-        skin = ""
-    else:
-        if skin.endswith("_gif"):
-            filetype = "gif"
-        skin = f"{skin}/"
-
-    is_radiant = "radiant/" if radiant else ""
-    is_shiny = "shiny/" if shiny else ""
-    return f"{is_radiant}{is_shiny}{skin}{pokemon_id}-{form_id}-.{filetype}"
+    return bot.catalog.sprites.file_name(name, shiny, radiant=radiant, skin=skin)
 
 
 async def get_battle_file_name(name, bot, shiny=False, *, radiant=False, skin=None):
-    name = name.lower()
-    identifier = await bot.db[1].forms.find_one({"identifier": name})
-    if not identifier:
-        # I have NO idea how this can be handled yet, raising for now to avoid breaking other code while still making errors clearer.
-        raise ValueError(
-            f"Invalid name ({name}) passed to ditto/utils/misc.py get_file_name."
-        )
-
-    # suffix = get_suffix(name)
-    suffix = identifier["form_identifier"]
-
-    if suffix and name.endswith(suffix):
-        form_id = int(identifier["form_order"] - 1)
-        form_name = name[: -(len(suffix) + 1)]
-        pokemon_identifier = await bot.db[1].forms.find_one({"identifier": form_name})
-        if not pokemon_identifier:
-            # I have NO idea how this can be handled yet, raising for now to avoid breaking other code while still making errors clearer.
-            raise ValueError(
-                f"Invalid name ({name}) passed to ditto/utils/misc.py get_file_name."
-            )
-        pokemon_id = pokemon_identifier["pokemon_id"]
-    else:
-        pokemon_id = identifier["pokemon_id"]
-        form_id = 0
-    filetype = "png"
-    if skin is None:
-        skin = ""
-    else:
-        if skin.endswith("_gif"):
-            filetype = "gif"
-        skin = f"{skin}/"
-    is_radiant = "radiant/" if radiant else ""
-    is_shiny = "shiny/" if shiny else ""
-    return f"{is_radiant}{is_shiny}{skin}{pokemon_id}-{form_id}-.{filetype}"
+    return bot.catalog.sprites.file_name(name, shiny, radiant=radiant, skin=skin)
 
 
 def scale_image(image, width=None, height=None):
@@ -633,10 +533,8 @@ async def get_prefix(bot, message):
     prefixes = ['<@1000125868938633297>']
     if not message.guild:
         return "?"
-    #return (
-    #    bot.guild_settings[message.guild.id]["prefix"]
-    #    if message.guild.id in bot.guild_settings
-    #    else "<@1000125868938633297>"
+    #settings = await bot.guild_settings.get(message.guild.id, {})
+    #return settings.get("prefix", "<@1000125868938633297>")
     return commands.when_mentioned_or(*prefixes)(bot, message)
 
  
@@ -783,7 +681,7 @@ class LeftPageButton(discord.ui.Button):
 
     async def callback(self, interaction):
         self.view.page -= 1
-        self.view.page %= len(self.view.pages)
+        self.view.page %= len(self.view.source)
         await self.view.handle_page(interaction.response.edit_message)
 
 
@@ -815,7 +713,7 @@ class RightPageButton(discord.ui.Button):
 
     async def callback(self, interaction):
         self.view.page += 1
-        self.view.page %= len(self.view.pages)
+        self.view.page %= len(self.view.source)
         await self.view.handle_page(interaction.response.edit_message)
 
 
@@ -829,7 +727,7 @@ class LastPageButton(discord.ui.Button):
         )
 
     async def callback(self, interaction):
-        self.view.page = len(self.view.pages) - 1
+        self.view.page = len(self.view.source) - 1
         await self.view.handle_page(interaction.response.edit_message)
 
 
@@ -1031,23 +929,35 @@ class LastPageButton(discord.ui.Button):
 #        await self.ctx.bot.load_bans()
 
 
+class ListPageSource:
+    """Page source over pages built up front, such as the List[str] or List[embed] from `pagify`."""
+
+    def __init__(self, pages: "List[Union[str, discord.Embed]]"):
+        self.pages = pages
+
+    def __len__(self):
+        return len(self.pages)
+
+    async def prepare(self):
+        pass
+
+    async def get_page(self, index: int):
+        return self.pages[index]
+
+
 class MenuView(discord.ui.View):
-    """View that creates a menu using the List[str] or List[embed] provided."""
+    """
+    View that creates a menu using the List[str] or List[embed] provided.
 
-    def __init__(
-        self, ctx: "commands.Context", pages: "List[Union[str, discord.Embed]]"
-    ):
+    A page source can be provided instead, an object with a length, `prepare` and `get_page`,
+    to build pages only as they are viewed.
+    """
+
+    def __init__(self, ctx: "commands.Context", pages):
         super().__init__(timeout=60)
         self.ctx = ctx
-        self.pages = pages
+        self.source = pages if hasattr(pages, "get_page") else ListPageSource(pages)
         self.page = 0
-        if len(self.pages) > 1:
-            self.add_item(FirstPageButton())
-            self.add_item(LeftPageButton())
-        self.add_item(CloseMenuButton())
-        if len(self.pages) > 1:
-            self.add_item(RightPageButton())
-            self.add_item(LastPageButton())
 
     async def interaction_check(self, interaction):
         if interaction.user.id != self.ctx.author.id:
@@ -1066,18 +976,28 @@ class MenuView(discord.ui.View):
         await self.ctx.bot.misc.log_error(self.ctx, error)
 
     async def handle_page(self, edit_func):
-        if isinstance(self.pages[0], discord.Embed):
-            await edit_func(embed=self.pages[self.page])
+        page = await self.source.get_page(self.page)
+        if isinstance(page, discord.Embed):
+            await edit_func(embed=page)
         else:
-            await edit_func(content=self.pages[self.page])
+            await edit_func(content=page)
 
     async def start(self):
-        if len(self.pages) < 1:
+        await self.source.prepare()
+        if len(self.source) < 1:
             raise RuntimeError("Must provide at least 1 page.")
-        if isinstance(self.pages[0], discord.Embed):
-            self.message = await self.ctx.send(embed=self.pages[0], view=self)
+        if len(self.source) > 1:
+            self.add_item(FirstPageButton())
+            self.add_item(LeftPageButton())
+        self.add_item(CloseMenuButton())
+        if len(self.source) > 1:
+            self.add_item(RightPageButton())
+            self.add_item(LastPageButton())
+        page = await self.source.get_page(0)
+        if isinstance(page, discord.Embed):
+            self.message = await self.ctx.send(embed=page, view=self)
         else:
-            self.message = await self.ctx.send(self.pages[0], view=self)
+            self.message = await self.ctx.send(page, view=self)
         return self.message
 
 
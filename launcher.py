@@ -29,6 +29,8 @@ import orjson
 import psutil
 from dotenv import load_dotenv
 
+from ditto.dittocore.snapshot import build_snapshot
+
 abspath = os.path.abspath(__file__)
 directory = os.path.dirname(abspath)
 os.chdir(directory)
@@ -109,6 +111,13 @@ async def get_app_info() -> Tuple[str, int]:
     return response["name"], response["id"]
 
 
+def compile_data() -> None:
+    """Rebuilds the shared/data snapshot. This blocks, so the launcher runs it in a thread to keep its redis listener going."""
+    start = time()
+    path = build_snapshot(os.path.join(os.getcwd(), "shared", "data"))
+    logger.info(f"Compiled {path} in {round((time() - start) * 1000)}ms")
+
+
 def get_cluster_list(shards: int):
     return [
         list(range(shards)[i : i + shards_per_cluster])
@@ -411,6 +420,7 @@ class Main:
             )
 
         logger.info(f"Running from directory: {os.getcwd()}")
+        await asyncio.to_thread(compile_data)
 
         if self.cprofile:
             logger.info(
@@ -457,6 +467,7 @@ class Main:
             self.redis_task.cancel()
 
     async def rolling_restart(self) -> None:
+        await asyncio.to_thread(compile_data)
         for instance in self.instances:
             self.launching = instance.id
             self.waiting_for_msg = True
@@ -0,0 +1,204 @@
+"""
+Moves pokemon ownership from the `users.pokes` array onto the pokes themselves.
+
+Every poke gets the id of its `owner` and a `position`, the order it was
+caught or received in. Positions come from a sequence and are sparse, a
+user's pokemon are numbered by their rank in position order, so taking a
+pokemon away or giving one never renumbers rows. `(owner, position)` is
+indexed, the bot reads it through a handful of SQL functions:
+
+    poke_at(u_id, n)          the id of a user's nth pokemon, NULL past the end
+    newest_poke(u_id)         the id of a user's latest pokemon
+    poke_number(u_id, id)     a pokemon's number in its owner's list, NULL if not theirs
+    poke_count(u_id)          how many pokemon a user owns
+    owned_pokes(u_id)         a user's pokemon ids in order, what `users.pokes` held
+
+The `user_pokes` view keeps the old `(u_id, pokes)` shape for queries and
+tools outside the bot that still read the array.
+
+Steps, in the order they are deployed:
+
+    python migrations/poke_ownership.py schema     columns, index, functions and view, online
+    python migrations/poke_ownership.py backfill   copies the arrays onto the pokes, with the bot stopped
+    python migrations/poke_ownership.py verify     compares the arrays to the owners
+    (deploy the bot, it no longer reads or writes the arrays)
+    python migrations/poke_ownership.py drop       drops users.pokes
+
+`backfill` is batched by users and can be rerun, every rerun reassigns the
+owners of the batch from the arrays. Connects to `--dsn`, or DATABASE_URL
+from env/postgres.env.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+import asyncpg
+from dotenv import load_dotenv
+
+SCHEMA = (
+    "CREATE SEQUENCE IF NOT EXISTS pokes_position_seq",
+    # No default while the columns are added, a volatile default would rewrite the table
+    "ALTER TABLE pokes ADD COLUMN IF NOT EXISTS owner bigint, ADD COLUMN IF NOT EXISTS position bigint",
+    "ALTER TABLE pokes ALTER COLUMN position SET DEFAULT nextval('pokes_position_seq')",
+    "ALTER SEQUENCE pokes_position_seq OWNED BY pokes.position",
+    # The bot stops writing the array, new users must be insertable without it
+    "ALTER TABLE users ALTER COLUMN pokes SET DEFAULT '{}', ALTER COLUMN pokes DROP NOT NULL",
+    """
+    CREATE OR REPLACE FUNCTION poke_at(user_id bigint, n bigint) RETURNS bigint
+    LANGUAGE sql STABLE AS $$
+        SELECT id FROM pokes WHERE owner = user_id AND n > 0
+        ORDER BY position OFFSET GREATEST(n - 1, 0) LIMIT 1
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION newest_poke(user_id bigint) RETURNS bigint
+    LANGUAGE sql STABLE AS $$
+        SELECT id FROM pokes WHERE owner = user_id ORDER BY position DESC LIMIT 1
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION poke_number(user_id bigint, poke_id bigint) RETURNS bigint
+    LANGUAGE sql STABLE AS $$
+        SELECT (
+            SELECT count(*) FROM pokes p WHERE p.owner = user_id AND p.position <= o.position
+        )
+        FROM pokes o WHERE o.id = poke_id AND o.owner = user_id
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION poke_count(user_id bigint) RETURNS bigint
+    LANGUAGE sql STABLE AS $$
+        SELECT count(*) FROM pokes WHERE owner = user_id
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION owned_pokes(user_id bigint) RETURNS bigint[]
+    LANGUAGE sql STABLE AS $$
+        SELECT ARRAY(SELECT id FROM pokes WHERE owner = user_id ORDER BY position)
+    $$
+    """,
+    "CREATE OR REPLACE VIEW user_pokes AS SELECT u_id, owned_pokes(u_id) AS pokes FROM users",
+)
+
+# Can not run inside a transaction, so it is not part of SCHEMA
+INDEX = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS pokes_owner_position
+ON pokes (owner, position) INCLUDE (id) WHERE owner IS NOT NULL
+"""
+
+# Positions are drawn after the sort, in array order
+BACKFILL = """
+UPDATE pokes SET owner = owned.u_id, position = owned.position
+FROM (
+    SELECT u.u_id, p.id, nextval('pokes_position_seq') AS position
+    FROM users u, unnest(u.pokes) WITH ORDINALITY AS p(id, ord)
+    WHERE u.u_id = ANY($1)
+    ORDER BY u.u_id, p.ord
+) owned
+WHERE pokes.id = owned.id
+"""
+
+# Pokes of the batch's users that are no longer in their array
+DISOWN = """
+UPDATE pokes SET owner = NULL
+WHERE owner = ANY($1) AND NOT EXISTS (
+    SELECT 1 FROM users u WHERE u.u_id = pokes.owner AND pokes.id = ANY(u.pokes)
+)
+"""
+
+VERIFY = """
+SELECT u.u_id, poke_count(u.u_id) AS owned_count,
+    (SELECT count(DISTINCT p.id) FROM pokes p WHERE p.id = ANY(u.pokes)) AS array_count
+FROM users u
+WHERE u.u_id > $1
+ORDER BY u.u_id
+LIMIT $2
+"""
+
+
+async def schema(pool, args):
+    async with pool.acquire() as pconn:
+        async with pconn.transaction():
+            for statement in SCHEMA:
+                await pconn.execute(statement)
+        print("Created the owner and position columns, functions and view")
+        await pconn.execute(INDEX)
+        print("Created the pokes_owner_position index")
+
+
+async def backfill(pool, args):
+    last = -1
+    users = pokes = 0
+    start = time.perf_counter()
+    while True:
+        async with pool.acquire() as pconn:
+            batch = await pconn.fetch(
+                "SELECT u_id FROM users WHERE u_id > $1 ORDER BY u_id LIMIT $2",
+                last,
+                args.batch,
+            )
+            if not batch:
+                break
+            ids = [r["u_id"] for r in batch]
+            async with pconn.transaction():
+                status = await pconn.execute(BACKFILL, ids)
+                await pconn.execute(DISOWN, ids)
+        last = ids[-1]
+        users += len(ids)
+        pokes += int(status.split()[-1])
+        print(f"{users:,} users, {pokes:,} pokes ({time.perf_counter() - start:.1f}s)")
+
+
+async def verify(pool, args):
+    last = -1
+    checked = mismatched = 0
+    while True:
+        async with pool.acquire() as pconn:
+            rows = await pconn.fetch(VERIFY, last, args.batch)
+        if not rows:
+            break
+        for row in rows:
+            if row["array_count"] != row["owned_count"]:
+                mismatched += 1
+                if mismatched <= args.show:
+                    print(
+                        f"{row['u_id']}: {row['array_count']} in the array, owns {row['owned_count']}"
+                    )
+        checked += len(rows)
+        last = rows[-1]["u_id"]
+    print(f"Checked {checked:,} users, {mismatched:,} mismatched")
+    if mismatched:
+        raise SystemExit(1)
+
+
+async def drop(pool, args):
+    async with pool.acquire() as pconn:
+        # user_pokes only reads u_id, it outlives the column
+        await pconn.execute("ALTER TABLE users DROP COLUMN IF EXISTS pokes")
+    print("Dropped users.pokes")
+
+
+STEPS = {"schema": schema, "backfill": backfill, "verify": verify, "drop": drop}
+
+
+async def main(args):
+    pool = await asyncpg.create_pool(args.dsn, min_size=1, max_size=2)
+    try:
+        await STEPS[args.step](pool, args)
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    load_dotenv("./env/postgres.env")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("step", choices=STEPS)
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--batch", type=int, default=1000, help="users per batch")
+    parser.add_argument("--show", type=int, default=20, help="mismatches to print")
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+    asyncio.run(main(args))